@@ -0,0 +1,17 @@
+import argparse
+from makao_game import GameDataAnalyzer, get_data_path
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Print aggregated statistics of all saved Makao games')
+    parser.add_argument('data_dir', nargs='?', default=get_data_path(), help='directory with game data files')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='number of processes reading files (default - all cores)')
+    parser.add_argument('--no-cache', action='store_true', help='read every file again and do not save the cache')
+    args = parser.parse_args()
+
+    analyzer = GameDataAnalyzer(args.data_dir, workers=args.workers, use_cache=not args.no_cache)
+    stats = analyzer.run()
+    print(stats)
+    print(f'{analyzer.files_read} files read, {stats.files - analyzer.files_read} taken from cache')
+
+if __name__ == '__main__':
+    main()
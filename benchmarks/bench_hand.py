@@ -0,0 +1,40 @@
+"""Compares Hand and BitHand in have_valid_cards, choosing available cards and demands on big hands
+
+Run from project root: python -m benchmarks.bench_hand
+"""
+import random
+import timeit
+
+from makao_game import Card, CARDS, BotPlayer, CardsActions, NullIOHandler, FUNCTIONS_TYPES_NAMES
+
+HAND_SIZES: list[int] = [5, 20, 40]
+NUMBER: int = 20_000
+
+def make_bot(bit_hand: bool, cards: list[Card]) -> BotPlayer:
+    bot: BotPlayer = BotPlayer('Bot', NullIOHandler(), rng=random.Random(0), bit_hand=bit_hand)
+    bot.deck.extend(cards)
+    return bot
+
+def main() -> None:
+    rng: random.Random = random.Random(0)
+    full_deck: list[Card] = list(CARDS)
+    actions: CardsActions = CardsActions()
+    actions.action_type = FUNCTIONS_TYPES_NAMES['PULL']
+
+    for size in HAND_SIZES:
+        cards: list[Card] = rng.sample(full_deck, size)
+        top: Card = next(card for card in full_deck if card not in cards)
+        for bit_hand in (False, True):
+            bot: BotPlayer = make_bot(bit_hand, cards)
+            valid: float = timeit.timeit(lambda: bot.have_valid_cards(top, actions), number=NUMBER)
+            available: float = timeit.timeit(lambda: bot._create_available_deck(top, actions), number=NUMBER)
+            colour: float = timeit.timeit(bot.pick_colour_demand, number=NUMBER)
+            number: float = timeit.timeit(bot.pick_number_demand, number=NUMBER)
+            print(f'{size:>2} cards, {"BitHand" if bit_hand else "Hand   "}: '
+                  f'have_valid_cards {valid / NUMBER * 1e9:6.0f} ns, '
+                  f'_create_available_deck {available / NUMBER * 1e9:6.0f} ns, '
+                  f'pick_colour_demand {colour / NUMBER * 1e9:5.0f} ns, '
+                  f'pick_number_demand {number / NUMBER * 1e9:5.0f} ns')
+
+if __name__ == '__main__':
+    main()
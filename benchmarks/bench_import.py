@@ -0,0 +1,31 @@
+"""Measures how long fresh interpreter needs to import makao_game, e.g. when process pool starts a worker
+
+Run from project root: python -m benchmarks.bench_import
+"""
+import statistics
+import subprocess
+import sys
+
+REPEATS: int = 15
+HEAVY_MODULES: list[str] = ['pandas', 'numpy', 'asyncio', 'multiprocessing']
+
+def run_python(code: str) -> float:
+    """Returns seconds of running code in a new interpreter, measured inside it from start of the process"""
+    output: str = subprocess.run(
+        [sys.executable, '-c', f'import time; start = time.perf_counter(); {code}; print(time.perf_counter() - start)'],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.split()[-1])
+
+def main() -> None:
+    times: list[float] = [run_python('import makao_game') for _ in range(REPEATS)]
+    print(f'import makao_game: median {statistics.median(times) * 1e3:.1f} ms, min {min(times) * 1e3:.1f} ms')
+
+    loaded: str = subprocess.run(
+        [sys.executable, '-c', f'import sys, makao_game; print([m for m in {HEAVY_MODULES} if m in sys.modules])'],
+        capture_output=True, text=True, check=True
+    ).stdout.strip()
+    print(f'heavy modules loaded by import: {loaded}')
+
+if __name__ == '__main__':
+    main()
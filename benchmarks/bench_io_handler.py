@@ -0,0 +1,62 @@
+"""Compares per turn cost of output of ConsoleIOHandler, BufferedIOHandler and silent BufferedIOHandler
+
+Every handler plays the same seeded bot games of Game, output goes to os.devnull and stdin answers 'no'
+to the shuffle question, overhead is time per turn above the time of NullIOHandler, writes per turn count calls of write
+
+Run from project root: python -m benchmarks.bench_io_handler [games]
+"""
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+from typing import Callable, TextIO
+
+from makao_game import Game, IOHandler, ConsoleIOHandler, BufferedIOHandler, NullIOHandler
+
+BOTS: list[str] = ['Bot1', 'Bot2', 'Bot3', 'Bot4']
+
+async def play(io_handler: IOHandler, seed: int) -> int:
+    """Plays one game, returns number of its turns"""
+    game: Game = Game(io_handler=io_handler, rng=random.Random(seed), bots=BOTS)
+    try:
+        await game.run_game()
+        await game.show_leaderboard()
+    finally:
+        await io_handler.close()
+    return game._turn
+
+def bench(make_handler: Callable[[], IOHandler], num_games: int) -> tuple[float, int]:
+    """Returns seconds per turn and number of turns of num_games games"""
+    turns: int = 0
+    start: float = time.perf_counter()
+    for seed in range(num_games):
+        turns += asyncio.run(play(make_handler(), seed))
+    return (time.perf_counter() - start) / turns, turns
+
+def main() -> None:
+    num_games: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    sys.stdin = io.StringIO('no\n' * (4 * num_games + 1))
+    devnull: TextIO
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        handlers: dict[str, Callable[[], IOHandler]] = {
+            'NullIOHandler': NullIOHandler,
+            'ConsoleIOHandler': ConsoleIOHandler,
+            'BufferedIOHandler': lambda: BufferedIOHandler(output=devnull),
+            'BufferedIOHandler(silent)': lambda: BufferedIOHandler(silent=True),
+        }
+        results: dict[str, tuple[float, int]] = {name: bench(make, num_games) for name, make in handlers.items()}
+        buffered: BufferedIOHandler = BufferedIOHandler(output=devnull)
+        buffered_turns: int = asyncio.run(play(buffered, 0))
+
+    base, turns = results['NullIOHandler']
+    print(f'{num_games} games, {turns} turns, NullIOHandler {base * 1e6:.1f} µs/turn')
+    for name, (per_turn, _) in results.items():
+        if name != 'NullIOHandler':
+            print(f'{name + ":":<27} {per_turn * 1e6:7.1f} µs/turn, overhead {(per_turn - base) * 1e6:7.1f} µs/turn')
+    print(f'BufferedIOHandler writes per turn: {buffered.writes / buffered_turns:.2f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Measures rollouts per second of ISMCTSBot and its win rate against three random bots
+
+Run from project root: python -m benchmarks.bench_ismcts [games] [iterations]
+"""
+import sys
+
+from makao_game.ismcts import ISMCTSBot
+from makao_game.player import BotPlayer
+from makao_game.simulation import Simulation, SimulationReport
+
+BOTS: list[str] = ['ISMCTS', 'Bot1', 'Bot2', 'Bot3']
+
+def main() -> None:
+    num_games: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    iterations: int = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    searchers: list[ISMCTSBot] = []
+
+    def create_searcher(**kwargs) -> BotPlayer:
+        bot: ISMCTSBot = ISMCTSBot(iterations=iterations, **kwargs)
+        searchers.append(bot)
+        return bot
+
+    report: SimulationReport = Simulation(
+        bots=BOTS,
+        shuffle_players=True,
+        seed=0,
+        bot_types={'ISMCTS': create_searcher}
+    ).run(num_games)
+
+    rollouts: int = sum(bot.rollouts for bot in searchers)
+    search_time: float = sum(bot.search_time for bot in searchers)
+    print(f'{rollouts} rollouts in {search_time:.2f}s: {rollouts / search_time:.0f} rollouts/s, '
+          f'{iterations} per move')
+    print(f'ISMCTS won {report.wins["ISMCTS"]} of {report.games} games '
+          f'({report.wins["ISMCTS"] / report.games:.3f}, random bots win {1 / len(BOTS):.3f})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Measures memory of many games kept alive at once in one process
+
+Games are prepared and advanced by a few turns of bots, then memory traced by tracemalloc and objects tracked
+by the garbage collector are divided by the number of games. Cards are shared by all games (CARDS),
+so what is left per game are players, their hands, piles and game actions
+
+Run from project root: python -m benchmarks.bench_memory [games] [players]
+"""
+import gc
+import random
+import sys
+import tracemalloc
+
+from makao_game import CARDS
+from makao_game.simulation import HeadlessGame
+
+TURNS: int = 10
+
+def measure(num_games: int, bots: list[str]) -> tuple[float, float]:
+    """Returns bytes and gc tracked objects per game of num_games games kept alive after TURNS turns"""
+    gc.collect()
+    objects_before: int = len(gc.get_objects())
+    tracemalloc.start()
+    memory_before: int = tracemalloc.get_traced_memory()[0]
+    games: list[HeadlessGame] = []
+    for seed in range(num_games):
+        game: HeadlessGame = HeadlessGame(bots=bots, rng=random.Random(seed))
+        game._prepare_headless_game()
+        games.append(game)
+    for _ in range(TURNS):
+        for game in games:
+            if not game.is_over:
+                game.play_turn()
+    gc.collect()
+    memory: int = tracemalloc.get_traced_memory()[0] - memory_before
+    tracemalloc.stop()
+    objects: int = len(gc.get_objects()) - objects_before
+    return memory / num_games, objects / num_games
+
+def main() -> None:
+    num_games: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    bots: list[str] = [f'Bot{seat + 1}' for seat in range(int(sys.argv[2]) if len(sys.argv) > 2 else 4)]
+    memory, objects = measure(num_games, bots)
+    print(f'{num_games} games of {len(bots)} bots after {TURNS} turns: {memory / 1024:.2f} KiB per game, '
+          f'{objects:.0f} gc tracked objects per game')
+    print(f'Shared deck: {len(CARDS)} cards, {sys.getsizeof(CARDS[0])} B per card')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Compares list.pop(0)/insert(0) used before with DrawPile/DiscardPile on big multi-deck piles
+
+Run from project root: python -m benchmarks.bench_piles
+"""
+import random
+import timeit
+
+from makao_game import Card, CARDS, DrawPile, DiscardPile
+
+NUM_DECKS: list[int] = [1, 10, 100]
+
+def cycle_lists(cards: list[Card]) -> None:
+    """Draws every card with pop(0), plays it with insert(0) and recycles them card by card"""
+    main_deck: list[Card] = list(cards)
+    play_deck: list[Card] = []
+    while main_deck:
+        play_deck.insert(0, main_deck.pop(0))
+        _ = play_deck[0]
+    while len(play_deck) > 1:
+        main_deck.append(play_deck[-1])
+        play_deck.pop(-1)
+    random.Random(0).shuffle(main_deck)
+
+def cycle_piles(cards: list[Card]) -> None:
+    """The same as cycle_lists with piles"""
+    main_deck: DrawPile = DrawPile(cards)
+    play_deck: DiscardPile = DiscardPile()
+    while main_deck:
+        play_deck.place(main_deck.draw())
+        _ = play_deck.top
+    main_deck.refill(play_deck.take_all_but_top(), random.Random(0))
+
+def main() -> None:
+    deck: list[Card] = list(CARDS)
+    for num_decks in NUM_DECKS:
+        cards: list[Card] = deck * num_decks
+        lists: float = min(timeit.repeat(lambda: cycle_lists(cards), number=5, repeat=3)) / 5
+        piles: float = min(timeit.repeat(lambda: cycle_piles(cards), number=5, repeat=3)) / 5
+        print(f'{num_decks:>3} decks: lists {lists * 1e3:8.2f} ms, piles {piles * 1e3:8.2f} ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Measures incremental rating of many games in RatingTable and lookups of ratings
+
+Games of random players of a pool are rated one by one in a fresh table in a temporary directory.
+Rate is reported for every tenth of the games, it stays flat as the table grows, because a game
+only touches records of its own players. Lookups read random players straight from the memory-mapped file
+of a table opened read only, top scans all records
+
+Run from project root: python -m benchmarks.bench_ratings [games] [players in pool] [players per game]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from makao_game.ratings import RatingTable
+
+SEED: int = 2024
+LOOKUPS: int = 100_000
+
+def main() -> None:
+    num_games: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    pool: list[str] = [f'Player{number}' for number in range(int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)]
+    game_size: int = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    rng: random.Random = random.Random(SEED)
+    games: list[list[str]] = [rng.sample(pool, game_size) for _ in range(num_games)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, 'bench.mrat')
+        rates: list[float] = []
+        with RatingTable(path) as table:
+            start: float = time.perf_counter()
+            tenth: int = max(1, num_games // 10)
+            for first in range(0, num_games, tenth):
+                part_start: float = time.perf_counter()
+                for placings in games[first:first + tenth]:
+                    table.update(placings)
+                rates.append(len(games[first:first + tenth]) / (time.perf_counter() - part_start))
+            elapsed: float = time.perf_counter() - start
+            print(f'{num_games} games of {game_size} players rated in {elapsed:.2f}s: {num_games / elapsed:,.0f} games/s, '
+                  f'{len(table)} players in {table.capacity} slots, {os.path.getsize(path) / 1024 ** 2:.1f} MiB')
+            print('games/s by tenths: ' + ' '.join(f'{rate:,.0f}' for rate in rates))
+
+        names: list[str] = [rng.choice(pool) for _ in range(LOOKUPS)]
+        with RatingTable(path, read_only=True) as table:
+            start = time.perf_counter()
+            for name in names:
+                table.get(name)
+            lookup: float = (time.perf_counter() - start) / LOOKUPS
+            start = time.perf_counter()
+            best = table.top(10)
+            top_time: float = time.perf_counter() - start
+        print(f'get: {lookup * 1e6:.2f} us per player, top 10 of {len(pool)}: {top_time * 1e3:.0f} ms, '
+              f'best: {best[0].name} {best[0].conservative:.2f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Sends a burst of loopback clients (ScriptedAnswers) to GameServer and reports tables per second,
+most tables open at once, traced memory per open table at the most open tables and lobby metrics
+(queue wait, table start latency)
+
+All clients connect at once, the lobby seats them at tables of table size players (filled with bots after
+WAIT_TIMEOUT), at most max tables are open, the rest waits in the queue. Memory is sampled while tables are open,
+minus memory before the clients came, and divided by tables open when the most of them were
+
+Run from project root: python -m benchmarks.bench_server [clients] [table size] [max tables]
+"""
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from benchmarks.scripted_client import ScriptedAnswers
+from makao_game.client import play_client
+from makao_game.server import GameServer
+
+SAMPLE_INTERVAL: float = 0.05
+WAIT_TIMEOUT: float = 0.1
+
+async def sample_memory(server: GameServer, baseline: int, peak: list[int]) -> None:
+    """Keeps the most open tables seen and the largest traced memory sampled with that many tables in peak
+
+    Memory of tables that ended is freed later than they close, so samples with few tables open would inflate
+    memory per table, only samples at the largest occupancy count
+    """
+    while True:
+        await asyncio.sleep(SAMPLE_INTERVAL)
+        open_tables: int = len(server.tables)
+        memory: int = tracemalloc.get_traced_memory()[0] - baseline
+        if open_tables > peak[0] or (open_tables == peak[0] and memory > peak[1]):
+            peak[0], peak[1] = open_tables, memory
+
+async def bench(num_clients: int, table_size: int, max_tables: int) -> None:
+    async with GameServer(port=0, table_size=table_size, wait_timeout=WAIT_TIMEOUT, max_tables=max_tables,
+                          max_waiting=num_clients, max_joining=num_clients, seed=0) as server:
+        tracemalloc.start()
+        baseline: int = tracemalloc.get_traced_memory()[0]
+        peak: list[int] = [0, 0]
+        sampler: asyncio.Task[None] = asyncio.create_task(sample_memory(server, baseline, peak))
+        start: float = time.perf_counter()
+        await asyncio.gather(*[play_client(server.host, server.port, f'Player{num}', ScriptedAnswers(), keep_events=False)
+                               for num in range(num_clients)])
+        elapsed: float = time.perf_counter() - start
+        sampler.cancel()
+        tracemalloc.stop()
+        print(f'{num_clients} clients at {server.stats.tables_started} tables of {table_size} '
+              f'({server.lobby.stats.bots_added} bots) in {elapsed:.2f} s: {server.stats.tables_started / elapsed:.0f} tables/s')
+        print(f'Most open tables: {server.stats.max_open_tables}, finished {server.stats.tables_finished}, '
+              f'aborted {server.stats.tables_aborted}, rejected players {server.stats.rejected}')
+        if peak[0]:
+            print(f'Memory per open table (server and clients): {peak[1] / peak[0] / 1024:.0f} KiB '
+                  f'at {peak[0]} open tables')
+        print(f'Queue wait:  {server.lobby.stats.queue_wait}')
+        print(f'Table start: {server.lobby.stats.table_start}')
+
+def main() -> None:
+    num_clients: int = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    table_size: int = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    max_tables: int = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    asyncio.run(bench(num_clients, table_size, max_tables))
+
+if __name__ == '__main__':
+    main()
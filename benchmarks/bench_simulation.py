@@ -0,0 +1,43 @@
+"""Compares games per second of Game driven by a silent IOHandler with HeadlessGame
+
+Both play the same seeded games (game number i with random.Random(game_seed(SEED, i))), so only the engine differs.
+The target of the headless engine was TARGET_SPEEDUP times more games per second and it is not met:
+HeadlessGame drops the event loop, messages and data collection, but the rest of a turn is shared with Game
+and costs about the same in both. Printed shortfall is how far this run is from the target
+
+Run from project root: python -m benchmarks.bench_simulation
+"""
+import asyncio
+import random
+import time
+
+from makao_game import Game, NullIOHandler
+from makao_game.simulation import Simulation, game_seed
+
+BOTS: list[str] = ['Bot1', 'Bot2', 'Bot3', 'Bot4']
+SEED: int = 0
+TARGET_SPEEDUP: float = 50.0
+
+def bench_game(num_games: int) -> float:
+    """Returns games per second of Game.run_game with NullIOHandler"""
+    start: float = time.perf_counter()
+    for game_index in range(num_games):
+        game: Game = Game(io_handler=NullIOHandler(), rng=random.Random(game_seed(SEED, game_index)), bots=BOTS)
+        asyncio.run(game.run_game())
+    return num_games / (time.perf_counter() - start)
+
+def bench_headless(num_games: int) -> float:
+    """Returns games per second of Simulation"""
+    return Simulation(bots=BOTS, seed=SEED).run(num_games).games_per_sec
+
+def main() -> None:
+    game_rate: float = bench_game(200)
+    headless_rate: float = bench_headless(2000)
+    print(f'Game + NullIOHandler: {game_rate:.0f} games/s')
+    print(f'HeadlessGame:         {headless_rate:.0f} games/s')
+    speedup: float = headless_rate / game_rate
+    print(f'Speedup:              {speedup:.1f}x (target {TARGET_SPEEDUP:.0f}x'
+          f'{", met" if speedup >= TARGET_SPEEDUP else f", {TARGET_SPEEDUP / speedup:.0f}x short"})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Measures cost of TurnProfiler in Game and prints per phase timings of bot games
+
+Games with profiler disabled and enabled alternate over the same seeds (best of ROUNDS is taken),
+cost of disabled profiler is estimated from timing the checks of None that a turn makes
+
+Run from project root: python -m benchmarks.bench_timing [games] [players]
+"""
+import asyncio
+import random
+import sys
+import time
+import timeit
+
+from makao_game import Game, NullIOHandler, TurnProfiler
+
+ROUNDS: int = 5
+CHECKS_PER_TURN: int = 18
+
+async def play(num_games: int, bots: list[str], profiler: TurnProfiler | None) -> int:
+    """Plays seeded games, returns number of turns"""
+    turns: int = 0
+    for seed in range(num_games):
+        game: Game = Game(io_handler=NullIOHandler(), rng=random.Random(seed), profiler=profiler, bots=bots)
+        await game.run_game()
+        turns += game._turn
+    return turns
+
+def main() -> None:
+    num_games: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    bots: list[str] = [f'Bot{seat + 1}' for seat in range(int(sys.argv[2]) if len(sys.argv) > 2 else 4)]
+
+    best: dict[bool, float] = {False: float('inf'), True: float('inf')}
+    profiler: TurnProfiler = TurnProfiler()
+    turns: int = 0
+    for _ in range(ROUNDS):
+        for enabled in (False, True):
+            start: float = time.perf_counter()
+            turns = asyncio.run(play(num_games, bots, profiler if enabled else None))
+            best[enabled] = min(best[enabled], time.perf_counter() - start)
+
+    profiler_off: None = None
+    check: float = timeit.timeit('profiler is not None', globals={'profiler': profiler_off}, number=1_000_000) / 1_000_000
+    per_turn: float = best[False] / turns
+    print(f'{num_games} games, {turns} turns, {len(bots)} bots')
+    print(f'Profiler disabled: {per_turn * 1e6:.2f} µs/turn, '
+          f'checks of None ~{CHECKS_PER_TURN * check * 1e9:.0f} ns/turn ({CHECKS_PER_TURN * check / per_turn:.2%})')
+    print(f'Profiler enabled:  {best[True] / turns * 1e6:.2f} µs/turn ({best[True] / best[False] - 1:+.1%})')
+    print(profiler)
+
+if __name__ == '__main__':
+    main()
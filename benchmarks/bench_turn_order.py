@@ -0,0 +1,63 @@
+"""Compares list-based turn order used before (index + IndexError + remove) with TurnOrder on big tables
+
+Run from project root: python -m benchmarks.bench_turn_order
+"""
+import random
+import time
+
+from makao_game import TurnOrder
+
+TABLE_SIZES: list[int] = [6, 100, 10_000]
+NUM_TURNS: int = 200_000
+
+class ListOrder:
+    """Copy of the previous Game._next_player and player removal"""
+    def __init__(self, players: list[int]) -> None:
+        self.players: list[int] = list(players)
+        self.current: int = self.players[0]
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def advance(self, reversed_order: bool) -> int:
+        c_player: int = self.players.index(self.current)
+        if not reversed_order:
+            try:
+                self.current = self.players[c_player + 1]
+            except IndexError:
+                self.current = self.players[0]
+        else:
+            try:
+                self.current = self.players[c_player - 1]
+            except IndexError:
+                self.current = self.players[-1]
+        return self.current
+
+    def remove(self, player: int) -> None:
+        """Removes player, if he was current one, first player becomes current"""
+        self.players.remove(player)
+        if player == self.current:
+            self.current = self.players[0]
+
+def play(order: ListOrder | TurnOrder, rng: random.Random, table_size: int) -> float:
+    """Advances NUM_TURNS times, reversing order and removing players now and then, returns seconds"""
+    reversed_order: bool = False
+    start: float = time.perf_counter()
+    for turn in range(NUM_TURNS):
+        if rng.random() < 0.05:
+            reversed_order = not reversed_order
+        player: int = order.advance(reversed_order)
+        if turn % (NUM_TURNS // table_size + 1) == 0 and len(order) > 2:
+            order.remove(player)
+    return time.perf_counter() - start
+
+def main() -> None:
+    for size in TABLE_SIZES:
+        players: list[int] = list(range(size))
+        list_time: float = play(ListOrder(players), random.Random(0), size)
+        order_time: float = play(TurnOrder(players), random.Random(0), size)
+        print(f'{size:>6} players: list {list_time / NUM_TURNS * 1e9:8.0f} ns/turn, '
+              f'TurnOrder {order_time / NUM_TURNS * 1e9:6.0f} ns/turn')
+
+if __name__ == '__main__':
+    main()
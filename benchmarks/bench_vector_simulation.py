@@ -0,0 +1,75 @@
+"""Compares VectorSimulation with HeadlessGame: games per second and statistical agreement of results
+
+Both play bots with BotPlayer heuristics from seat 0, agreement is checked on average game length (Welch z),
+distribution of game lengths (two-sample Kolmogorov-Smirnov) and win rate of every seat (two-proportion z)
+
+Run from project root: python -m benchmarks.bench_vector_simulation [object games] [vector games] [players]
+"""
+import math
+import sys
+import time
+
+import numpy as np
+
+from makao_game.simulation import HeadlessGame, Simulation
+from makao_game.vector_simulation import LockstepGames, VectorSimulation
+
+MAX_Z: float = 4.0
+
+def play_objects(bots: list[str], num_games: int) -> tuple[np.ndarray, np.ndarray, float]:
+    """Returns turns and winner seats of games of HeadlessGame and how long they took"""
+    simulation: Simulation = Simulation(bots=bots, seed=0)
+    turns: list[int] = []
+    winners: list[int] = []
+    start: float = time.perf_counter()
+    for game_index in range(num_games):
+        game: HeadlessGame = simulation.new_game(game_index)
+        finished: bool = game.play()
+        turns.append(game.turns)
+        winners.append(game.seating.index(game.placings()[0]) if finished else -1)
+    return np.array(turns), np.array(winners), time.perf_counter() - start
+
+def play_vectors(bots: list[str], num_games: int) -> tuple[np.ndarray, np.ndarray, float]:
+    """Returns turns and winner seats of games of LockstepGames and how long they took"""
+    start: float = time.perf_counter()
+    games, _ = VectorSimulation(bots=bots, seed=0, batch_size=num_games).new_batch(num_games)
+    games.play()
+    return games.turns, games.winners, time.perf_counter() - start
+
+def ks_statistic(a: np.ndarray, b: np.ndarray) -> tuple[float, float]:
+    """Returns the largest distance between empirical distributions and its critical value at p = 0.001"""
+    values: np.ndarray = np.union1d(a, b)
+    cdf_a: np.ndarray = np.searchsorted(np.sort(a), values, side='right') / a.size
+    cdf_b: np.ndarray = np.searchsorted(np.sort(b), values, side='right') / b.size
+    return float(np.abs(cdf_a - cdf_b).max()), 1.95 * math.sqrt((a.size + b.size) / (a.size * b.size))
+
+def main() -> None:
+    object_games: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    vector_games: int = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    bots: list[str] = [f'Bot{seat + 1}' for seat in range(int(sys.argv[3]) if len(sys.argv) > 3 else 4)]
+
+    object_turns, object_winners, object_time = play_objects(bots, object_games)
+    vector_turns, vector_winners, vector_time = play_vectors(bots, vector_games)
+    object_rate: float = object_games / object_time
+    vector_rate: float = vector_games / vector_time
+    print(f'HeadlessGame:   {object_rate:.0f} games/s')
+    print(f'LockstepGames:  {vector_rate:.0f} games/s ({vector_rate / object_rate:.1f}x)')
+
+    agree: bool = True
+    z: float = (vector_turns.mean() - object_turns.mean()) / math.sqrt(
+        vector_turns.var() / vector_games + object_turns.var() / object_games)
+    agree &= abs(z) < MAX_Z
+    print(f'Average turns:  {object_turns.mean():.2f} vs {vector_turns.mean():.2f} (z = {z:.2f})')
+    distance, critical = ks_statistic(object_turns, vector_turns)
+    agree &= distance < critical
+    print(f'Turns KS:       {distance:.4f} (critical {critical:.4f})')
+    for seat in range(len(bots)):
+        object_rate, vector_rate = (object_winners == seat).mean(), (vector_winners == seat).mean()
+        pooled: float = ((object_winners == seat).sum() + (vector_winners == seat).sum()) / (object_games + vector_games)
+        z = (vector_rate - object_rate) / math.sqrt(pooled * (1 - pooled) * (1 / object_games + 1 / vector_games))
+        agree &= abs(z) < MAX_Z
+        print(f'Seat {seat} wins:    {object_rate:.4f} vs {vector_rate:.4f} (z = {z:.2f})')
+    print('Engines agree' if agree else 'ENGINES DISAGREE')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""Answers of loopback clients of play_client that play whole games without a human"""
+import re
+from typing import Any
+
+from makao_game.io_handler import IODataType
+
+
+class ScriptedAnswers:
+    """Answers of a client that always plays: tries cards of its deck one by one until one is accepted,
+    demands Hearts or 7 and says makao by the number of cards left in its deck
+    """
+    def __init__(self) -> None:
+        self.deck_size: int = 0
+        self._tried: int = 0
+
+    def __call__(self, event: dict[str, Any]) -> str | None:
+        if event['type'] == 'message':
+            if ' this is your deck:\n' in event['text']:
+                self.deck_size = len(re.findall(r'(?:^|, )\d+:', event['text'].split('\n', 1)[1]))
+            return None
+        data_type: str = event['data_type']
+        if data_type == IODataType.PLAY_PASS.value:
+            self._tried = 0
+            return 'play'
+        if data_type == IODataType.CARD.value:
+            self._tried += 1
+            return str((self._tried - 1) % self.deck_size + 1)
+        if data_type == IODataType.DEMAND.value:
+            return 'Hearts' if 'colour' in event['prompt'] else '7'
+        if data_type == IODataType.MAKAO.value:
+            left: int = self.deck_size - 1
+            return 'makao' if left == 1 else 'after makao' if left == 0 else ''
+        return ''
@@ -0,0 +1,258 @@
+"""Seeded benchmark suite of hot paths of the game and of whole bot-only games, with comparison to a baseline
+
+Cases (every setup is drawn from random.Random(SEED), so all runs measure the same work):
+- can_be_played/<state>: Card.can_be_played on every pair of cards in every game actions of the action state
+- have_valid_cards/<hand>_<size>: Player.have_valid_cards with Hand and BitHand of several sizes
+- pull_cards/recycle: Game._pull_cards of 5 cards that go back on the table, main deck is rebuilt by _update_main_deck
+- collect_data: Game._collect_data of a turn when cards were pulled
+- bot_choose_card: BotPlayer.choose_card of hands of 10 cards (with dealing them) on table cards it can play on
+- games/headless_<n>p: bot-only games per second of HeadlessGame (Simulation) for 2, 4 and 6 players
+- games/async_4p: bot-only games per second of Game with NullIOHandler
+Operations are timed as the best of --repeat samples of at least 20 ms in ns per operation,
+games as the best rate of --repeat runs.
+
+Run from project root:
+  python -m benchmarks.suite --output baseline.json
+  python -m benchmarks.suite --compare baseline.json [--threshold 0.15] [--output new.json]
+Comparison lists every case with its change and exits with 1 if any got worse by more than threshold
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import random
+import sys
+import time
+from typing import Any, Callable, Coroutine
+
+from makao_game import Card, CARDS, CardsActions, BotPlayer, Game, NullIOHandler, COLOURS, FUNCTIONS_TYPES_NAMES
+from makao_game.dictionaries import DEMAND_OPTIONS_NAMES, NAMES
+from makao_game.simulation import HeadlessGame, Simulation
+
+SEED: int = 2024
+HAND_SIZES: tuple[int, ...] = (5, 15, 40)
+GAME_SIZES: tuple[int, ...] = (2, 4, 6)
+DEFAULT_THRESHOLD: float = 0.15
+MIN_SAMPLE_NS: int = 20_000_000
+
+Result = dict[str, float | str | bool]
+
+def run_sync(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Runs coroutine that never suspends (game methods with NullIOHandler) without an event loop"""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError('Coroutine suspended, it needs an event loop')
+
+def time_operation(operation: Callable[[], int], repeat: int) -> float:
+    """Returns the best time in ns per operation of repeat samples, operation returns how many operations it made\n
+    Operation runs once to warm up, every sample calls it until it takes at least MIN_SAMPLE_NS
+    """
+    operation()
+    best: float = float('inf')
+    for _ in range(repeat):
+        done: int = 0
+        start: int = time.perf_counter_ns()
+        elapsed: int = 0
+        while elapsed < MIN_SAMPLE_NS:
+            done += operation()
+            elapsed = time.perf_counter_ns() - start
+        best = min(best, elapsed / done)
+    return best
+
+def full_deck() -> list[Card]:
+    return list(CARDS)
+
+def actions_of_states() -> dict[str, list[CardsActions]]:
+    """Returns game actions of every action state, grouped by kind of the state"""
+    def make(action_type: str | None, demanded_type: str | None = None, demanded_value: str | None = None) -> CardsActions:
+        actions: CardsActions = CardsActions()
+        actions.action_type = action_type
+        actions.demanded_type = demanded_type
+        actions.demanded_value = demanded_value
+        return actions
+
+    demand: str = FUNCTIONS_TYPES_NAMES['DEMAND']
+    return {
+        'none': [make(None)],
+        'pull': [make(FUNCTIONS_TYPES_NAMES['PULL'])],
+        'freeze': [make(FUNCTIONS_TYPES_NAMES['FREEZE'])],
+        'demand_number': [make(demand, DEMAND_OPTIONS_NAMES['JACK'], NAMES[num]) for num in NAMES] +
+                         [make(demand, DEMAND_OPTIONS_NAMES['JACK'])],
+        'demand_colour': [make(demand, DEMAND_OPTIONS_NAMES['ACE'], COLOURS[num]['name']) for num in COLOURS],
+    }
+
+def bench_can_be_played(repeat: int) -> dict[str, Result]:
+    deck: list[Card] = full_deck()
+    results: dict[str, Result] = {}
+    for state, all_actions in actions_of_states().items():
+        pairs: list[tuple[Card, Card, CardsActions]] = [(new, old, actions) for actions in all_actions
+                                                        for old in deck for new in deck]
+
+        def operation() -> int:
+            for new, old, actions in pairs:
+                new.can_be_played(old, actions)
+            return len(pairs)
+        results[f'can_be_played/{state}'] = ns_result(time_operation(operation, repeat))
+    return results
+
+def bench_have_valid_cards(repeat: int) -> dict[str, Result]:
+    rng: random.Random = random.Random(SEED)
+    deck: list[Card] = full_deck()
+    situations: list[tuple[Card, CardsActions]] = [(rng.choice(deck), rng.choice(all_actions))
+                                                   for all_actions in actions_of_states().values() for _ in range(200)]
+    results: dict[str, Result] = {}
+    for size in HAND_SIZES:
+        cards: list[Card] = [rng.choice(deck) for _ in range(size)]
+        for bit_hand in (False, True):
+            player: BotPlayer = BotPlayer('Bot', NullIOHandler(), rng=random.Random(SEED), bit_hand=bit_hand)
+            player.deck.extend(cards)
+
+            def operation() -> int:
+                for top, actions in situations:
+                    player.have_valid_cards(top, actions)
+                return len(situations)
+            results[f'have_valid_cards/{"bit_hand" if bit_hand else "hand"}_{size}'] = \
+                ns_result(time_operation(operation, repeat))
+    return results
+
+def prepared_game(num_players: int = 4) -> HeadlessGame:
+    game: HeadlessGame = HeadlessGame(bots=[f'Bot{seat + 1}' for seat in range(num_players)], rng=random.Random(SEED))
+    game._prepare_headless_game()
+    return game
+
+def bench_pull_cards(repeat: int) -> dict[str, Result]:
+    game: HeadlessGame = prepared_game()
+
+    def operation() -> int:
+        for _ in range(2000):
+            for card in run_sync(game._pull_cards(5)):
+                game._play_deck.place(card)
+        return 2000
+    return {'pull_cards/recycle': ns_result(time_operation(operation, repeat))}
+
+def bench_collect_data(repeat: int) -> dict[str, Result]:
+    game: HeadlessGame = prepared_game()
+    player: BotPlayer = game._current_player  # type: ignore[assignment]
+    top: Card = game._play_deck.top
+    deck_size: int = len(player.deck)
+    player.deck.extend(run_sync(game._pull_cards(2)))
+
+    def operation() -> int:
+        game._game_data = []
+        for _ in range(5000):
+            game._collect_data(False, deck_size, top)
+        return 5000
+    return {'collect_data': ns_result(time_operation(operation, repeat))}
+
+def bench_bot_choose_card(repeat: int) -> dict[str, Result]:
+    rng: random.Random = random.Random(SEED)
+    deck: list[Card] = full_deck()
+    actions: CardsActions = CardsActions()
+    bot: BotPlayer = BotPlayer('Bot', NullIOHandler(), rng=random.Random(SEED))
+    situations: list[tuple[list[Card], Card]] = []
+    while len(situations) < 200:
+        hand: list[Card] = rng.sample(deck, 10)
+        top: Card = rng.choice([card for card in deck if card not in hand])
+        if any(card.can_be_played(top, actions) for card in hand):
+            situations.append((hand, top))
+
+    def operation() -> int:
+        for hand, top in situations:
+            bot.deck.clear()
+            bot.deck.extend(hand)
+            run_sync(bot.choose_card(top, actions))
+        return len(situations)
+    return {'bot_choose_card': ns_result(time_operation(operation, repeat))}
+
+def bench_games(repeat: int, num_games: int) -> dict[str, Result]:
+    results: dict[str, Result] = {}
+    for num_players in GAME_SIZES:
+        bots: list[str] = [f'Bot{seat + 1}' for seat in range(num_players)]
+        rate: float = max(Simulation(bots=bots, seed=SEED).run(num_games).games_per_sec for _ in range(repeat))
+        results[f'games/headless_{num_players}p'] = {'value': rate, 'unit': 'games/s', 'higher_is_better': True}
+
+    async def play_async(games: int) -> None:
+        for game_index in range(games):
+            await Game(io_handler=NullIOHandler(), rng=random.Random(SEED + game_index),
+                       bots=['Bot1', 'Bot2', 'Bot3', 'Bot4']).run_game()
+    best: float = float('inf')
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        asyncio.run(play_async(num_games // 5))
+        best = min(best, time.perf_counter() - start)
+    results['games/async_4p'] = {'value': num_games // 5 / best, 'unit': 'games/s', 'higher_is_better': True}
+    return results
+
+def ns_result(ns: float) -> Result:
+    return {'value': ns, 'unit': 'ns/op', 'higher_is_better': False}
+
+def run_suite(repeat: int, num_games: int) -> dict[str, Any]:
+    results: dict[str, Result] = {}
+    for bench in (bench_can_be_played, bench_have_valid_cards, bench_pull_cards, bench_collect_data,
+                  bench_bot_choose_card):
+        results.update(bench(repeat))
+    results.update(bench_games(repeat, num_games))
+    return {
+        'meta': {
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': SEED,
+            'repeat': repeat,
+            'games': num_games,
+        },
+        'results': results,
+    }
+
+def compare(results: dict[str, Result], baseline: dict[str, Result], threshold: float) -> list[str]:
+    """Prints change of every case against baseline, returns names of cases that got worse by more than threshold"""
+    regressions: list[str] = []
+    print(f'{"case":<34}{"baseline":>14}{"now":>14}{"change":>9}')
+    for name, result in results.items():
+        old: Result | None = baseline.get(name)
+        if old is None:
+            print(f'{name:<34}{"-":>14}{result["value"]:>14.1f}   new case')
+            continue
+        change: float = float(result['value']) / float(old['value']) - 1
+        worse: bool = -change > threshold if result['higher_is_better'] else change > threshold
+        if worse:
+            regressions.append(name)
+        print(f'{name:<34}{float(old["value"]):>14.1f}{float(result["value"]):>14.1f}{change:>+9.1%}'
+              f' {result["unit"]}{"  REGRESSION" if worse else ""}')
+    for name in baseline:
+        if name not in results:
+            print(f'{name:<34} missing in this run')
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Seeded benchmarks of hot paths and whole games')
+    parser.add_argument('-o', '--output', help='write results to this json file')
+    parser.add_argument('-c', '--compare', help='json file of a previous run to compare with')
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative change that counts as regression')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='runs of every case, the best one counts')
+    parser.add_argument('-g', '--games', type=int, default=1000, help='games of every games case')
+    args = parser.parse_args()
+
+    report: dict[str, Any] = run_suite(args.repeat, args.games)
+    if args.output:
+        with open(args.output, 'w', encoding='UTF-8') as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='UTF-8') as file:
+            baseline: dict[str, Any] = json.load(file)
+        regressions: list[str] = compare(report['results'], baseline['results'], args.threshold)
+        if regressions:
+            print(f'{len(regressions)} regression(s) over {args.threshold:.0%}: {", ".join(regressions)}')
+            sys.exit(1)
+        print(f'No regressions over {args.threshold:.0%}')
+    else:
+        for name, result in report['results'].items():
+            print(f'{name:<34}{float(result["value"]):>14.1f} {result["unit"]}')
+
+if __name__ == '__main__':
+    main()
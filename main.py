@@ -1,13 +1,24 @@
 import asyncio
-from makao_game import Game, ConsoleIOHandler
+import os
+from makao_game import RecordedGame, BufferedIOHandler, RatingTable
+from makao_game.ratings import RATINGS_FILE_NAME
 
 async def main() -> None:
 
-    game = Game()
+    io_handler = BufferedIOHandler()
+    game = RecordedGame(io_handler=io_handler, log_batch_size=1)
 
-    await game.run_game()
-    await game.show_leaderboard()
-    game.save_data()
+    try:
+        await game.run_game()
+        await game.show_leaderboard()
+    finally:
+        await io_handler.close()
+    data_path = game.save_data()
+    try:
+        with RatingTable(os.path.join(os.path.dirname(data_path), RATINGS_FILE_NAME)) as ratings:
+            ratings.rate_game(data_path, game.placings())
+    except ValueError as error:   # e.g. names that the table cannot store
+        print(f'Game was not rated: {error}')
 
 if __name__ == '__main__':
     asyncio.run(main())
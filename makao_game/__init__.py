@@ -2,20 +2,86 @@
 # thanks to this you don't have to code 'from classes.game import Game' and just can 'from classes import Game'
 
 # importing classes
+from typing import TYPE_CHECKING
+
 from .game import Game
-from .player import Player, BotPlayer
-from .cards import Card
+from .player import Player, BotPlayer, BotPolicy
+from .cards import Card, CARDS
+from .hand import BitHand
+from .piles import Pile, DrawPile, DiscardPile
+from .turn_order import TurnOrder
+from .game_state import GameState, PlayerState
 from .utils import get_data_path, colour_string
 from .cards_actions import CardsActions
-from .io_handler import IOHandler, ConsoleIOHandler, IODataType
+from .rules import RuleSet, CompiledRules, compile_rules, VARIANTS
+from .data_logger import TurnLogWriter
+from .io_handler import IOHandler, ConsoleIOHandler, BufferedIOHandler, NullIOHandler, IODataType
+from .simulation import HeadlessGame, Simulation, SimulationReport, game_seed
+from .ismcts import ISMCTSBot
+from .timing import TurnProfiler, Histogram
+
+# classes that need heavy imports (multiprocessing, mmap, NumPy, asyncio) are imported on first use, see __getattr__
+_LAZY_IMPORTS: dict[str, str] = {
+    'Tournament': '.tournament',
+    'TournamentResult': '.tournament',
+    'PolicySweep': '.sweep',
+    'SweepResult': '.sweep',
+    'GameLog': '.binary_log',
+    'write_game_log': '.binary_log',
+    'convert_csv': '.binary_log',
+    'convert_data_dir': '.binary_log',
+    'GameDataAnalyzer': '.analytics',
+    'DataStats': '.analytics',
+    'RatingTable': '.ratings',
+    'Rating': '.ratings',
+    'RecordedGame': '.replay',
+    'ReplayGame': '.replay',
+    'GameRecord': '.replay',
+    'VectorSimulation': '.vector_simulation',
+    'LockstepGames': '.vector_simulation',
+    'VectorPolicy': '.vector_simulation',
+    'GameServer': '.server',
+    'SeatIOHandler': '.server',
+    'TableIOHandler': '.server',
+    'SeatLost': '.server',
+    'Lobby': '.lobby',
+    'LobbyStats': '.lobby',
+    'LatencyStats': '.lobby',
+}
+
+# type checkers do not run __getattr__, so they see the real types of lazy names here
+if TYPE_CHECKING:
+    from .tournament import Tournament, TournamentResult
+    from .sweep import PolicySweep, SweepResult
+    from .binary_log import GameLog, write_game_log, convert_csv, convert_data_dir
+    from .analytics import GameDataAnalyzer, DataStats
+    from .ratings import RatingTable, Rating
+    from .replay import RecordedGame, ReplayGame, GameRecord
+    from .vector_simulation import VectorSimulation, LockstepGames, VectorPolicy
+    from .server import GameServer, SeatIOHandler, TableIOHandler, SeatLost
+    from .lobby import Lobby, LobbyStats, LatencyStats
 
 # importing variables (consts)
-from .dictionaries import (NAMES, FUNCTIONS, COLOURS, CSV_HEADERS, DATA_DIR_NAME, MAX_NUM_OF_PLAYERS,
-                           ASCII_COLOURS, ASCII_END, ASCII_START, FUNCTIONS_TYPES_NAMES, FUNCTIONS_DESCRIPTIONS)
+from .dictionaries import (NAMES, FUNCTIONS, COLOURS, CSV_HEADERS, DATA_DIR_NAME, BINARY_LOG_EXTENSION, REPLAY_EXTENSION,
+                           MAX_NUM_OF_PLAYERS, MAX_NAME_BYTES, ASCII_COLOURS, ASCII_END, ASCII_START, FUNCTIONS_TYPES_NAMES, FUNCTIONS_DESCRIPTIONS)
 
 # tells what will ve imported if * used
-__all__ = ['Card', 'Player', 'BotPlayer', 'Game', 'CardsActions', 'get_data_path', 'colour_string', 'IOHandler',
-           'ConsoleIOHandler', 'IODataType', 'NAMES', 'FUNCTIONS', 'COLOURS', 'CSV_HEADERS', 'DATA_DIR_NAME', 'MAX_NUM_OF_PLAYERS',
+__all__ = ['Card', 'CARDS', 'Player', 'BotPlayer', 'BotPolicy', 'Game', 'CardsActions', 'RuleSet', 'CompiledRules', 'compile_rules', 'VARIANTS', 'get_data_path', 'colour_string', 'IOHandler',
+           'ConsoleIOHandler', 'BufferedIOHandler', 'NullIOHandler', 'IODataType', 'BitHand', 'Pile', 'DrawPile', 'DiscardPile', 'TurnOrder',
+           'GameState', 'PlayerState',
+           'TurnLogWriter', 'GameLog', 'write_game_log', 'convert_csv', 'convert_data_dir',
+           'HeadlessGame', 'Simulation', 'SimulationReport', 'game_seed', 'ISMCTSBot', 'TurnProfiler', 'Histogram', 'Tournament', 'TournamentResult', 'PolicySweep', 'SweepResult',
+           'GameDataAnalyzer', 'DataStats', 'RatingTable', 'Rating', 'RecordedGame', 'ReplayGame', 'GameRecord',
+           'VectorSimulation', 'LockstepGames', 'VectorPolicy', 'GameServer', 'SeatIOHandler', 'TableIOHandler', 'SeatLost',
+           'Lobby', 'LobbyStats', 'LatencyStats',
+           'NAMES', 'FUNCTIONS', 'COLOURS', 'CSV_HEADERS', 'DATA_DIR_NAME', 'BINARY_LOG_EXTENSION', 'REPLAY_EXTENSION', 'MAX_NUM_OF_PLAYERS', 'MAX_NAME_BYTES',
            'ASCII_START', 'ASCII_END', 'ASCII_COLOURS', 'FUNCTIONS_DESCRIPTIONS', 'FUNCTIONS_TYPES_NAMES']
 
-print("Module 'makao_game' was imported!") # telling if import was successful
+def __getattr__(name: str) -> object:
+    """Imports lazy names from _LAZY_IMPORTS when they are used for the first time"""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        value: object = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
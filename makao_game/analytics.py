@@ -0,0 +1,260 @@
+"""Aggregates of many game data files (game_data/*.csv and *.mlog) without loading them into one DataFrame
+
+Every file is read row by row into small DataStats, stats of files are merged.
+Stats of already analysed files are cached in the data directory, so only new or changed files are read again
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Iterable, Iterator
+
+from makao_game import dictionaries as c_dict
+from makao_game.data_logger import iter_csv_rows
+
+CACHE_FILE_NAME: str = '.analytics_cache.json'
+CACHE_VERSION: int = 1
+
+Row = dict[str, str | int | bool | None]
+
+# counters kept for every Card_function, 'next_*' describe the turn of the player right after the card was played
+FUNCTION_COUNTERS: list[str] = ['plays', 'next_played', 'next_frozen', 'next_pulled', 'next_pulled_cards']
+
+@dataclass
+class DataStats:
+    """Partial aggregates of game data files, can be merged and saved as JSON\n
+    seat_games[i]/seat_wins[i] - games with at least i + 1 players / games won from seat i,
+    seat is the order in which players made their first move,
+    functions[name] - FUNCTION_COUNTERS of every Card_function,
+    pull_stacks[n] - how many times player gave up and pulled n cards of stacked pull cards
+    """
+    files: int = 0
+    games: int = 0
+    unfinished: int = 0
+    turns: int = 0
+    min_turns: int = 0
+    max_turns: int = 0
+    seat_games: list[int] = field(default_factory=list)
+    seat_wins: list[int] = field(default_factory=list)
+    functions: dict[str, dict[str, int]] = field(default_factory=dict)
+    pull_stacks: dict[int, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'DataStats':
+        """Reverses asdict, JSON keeps dict keys as strings, so pull stack sizes are converted back to int"""
+        stats: DataStats = cls(**data)
+        stats.pull_stacks = {int(size): count for size, count in data['pull_stacks'].items()}
+        return stats
+
+    def _function(self, name: str) -> dict[str, int]:
+        if name not in self.functions:
+            self.functions[name] = {counter: 0 for counter in FUNCTION_COUNTERS}
+        return self.functions[name]
+
+    def merge(self, other: 'DataStats') -> None:
+        """Adds stats of other to self"""
+        if other.games + other.unfinished > 0:
+            both: bool = self.games + self.unfinished > 0
+            self.min_turns = min(self.min_turns, other.min_turns) if both else other.min_turns
+            self.max_turns = max(self.max_turns, other.max_turns)
+        self.files += other.files
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.turns += other.turns
+        for seat in range(len(other.seat_games)):
+            if seat == len(self.seat_games):
+                self.seat_games.append(0)
+                self.seat_wins.append(0)
+            self.seat_games[seat] += other.seat_games[seat]
+            self.seat_wins[seat] += other.seat_wins[seat]
+        for name, counters in other.functions.items():
+            own: dict[str, int] = self._function(name)
+            for counter, value in counters.items():
+                own[counter] += value
+        for size, count in other.pull_stacks.items():
+            self.pull_stacks[size] = self.pull_stacks.get(size, 0) + count
+
+    @property
+    def average_turns(self) -> float:
+        return self.turns / (self.games + self.unfinished) if self.games + self.unfinished else 0.0
+
+    def seat_win_rates(self) -> list[float]:
+        """Returns share of won games among finished games that had player at every seat"""
+        return [wins / games if games else 0.0 for wins, games in zip(self.seat_wins, self.seat_games)]
+
+    def function_effects(self) -> dict[str, dict[str, float]]:
+        """Returns for every Card_function how often it was played and what happened to the next player:
+        share of turns in which he played a card, was frozen, pulled cards and average number of cards he pulled
+        """
+        effects: dict[str, dict[str, float]] = {}
+        for name, counters in sorted(self.functions.items()):
+            plays: int = counters['plays']
+            effects[name] = {
+                'plays': plays,
+                'next_played_rate': counters['next_played'] / plays if plays else 0.0,
+                'next_frozen_rate': counters['next_frozen'] / plays if plays else 0.0,
+                'next_pulled_rate': counters['next_pulled'] / plays if plays else 0.0,
+                'next_avg_pulled_cards': counters['next_pulled_cards'] / plays if plays else 0.0,
+            }
+        return effects
+
+    def pull_stack_distribution(self) -> dict[int, float]:
+        """Returns share of every size of pulled stack"""
+        total: int = sum(self.pull_stacks.values())
+        return {size: self.pull_stacks[size] / total for size in sorted(self.pull_stacks)}
+
+    def __str__(self) -> str:
+        lines: list[str] = [
+            f'{self.files} files, {self.games} finished games, {self.unfinished} unfinished, analysed in {self.elapsed:.2f}s',
+            f'Turns: avg {self.average_turns:.1f}, min {self.min_turns}, max {self.max_turns}',
+            f'Seat win rates: {[round(rate, 3) for rate in self.seat_win_rates()]}',
+        ]
+        for name, effect in self.function_effects().items():
+            lines.append(f'{name}: played {effect["plays"]:.0f} times, next player played {effect["next_played_rate"]:.3f}, '
+                         f'was frozen {effect["next_frozen_rate"]:.3f}, pulled {effect["next_avg_pulled_cards"]:.2f} cards on avg')
+        distribution: dict[int, float] = self.pull_stack_distribution()
+        lines.append(f'Pull stacks: {", ".join(f"{size}: {share:.3f}" for size, share in distribution.items())}')
+        return '\n'.join(lines)
+
+
+def analyze_rows(rows: Iterable[Row]) -> DataStats:
+    """Returns stats of one game, rows are read once and only the previous one is kept"""
+    stats: DataStats = DataStats(files=1)
+    seats: dict[str, int] = {}
+    winner: str | None = None
+    last_move: int = 0
+    previous_function: str | None = None
+
+    for row in rows:
+        name: str = str(row['Player_name'])
+        seats.setdefault(name, len(seats))
+        last_move = max(last_move, int(row['Game_move'] or 0))
+        if row['Final_place'] == 1:
+            winner = name
+        played: int = int(row['Played_cards_count'] or 0)
+        pulled: int = int(row['Pulled_cards_count'] or 0)
+
+        if previous_function is not None:
+            counters: dict[str, int] = stats._function(previous_function)
+            counters['next_played'] += played > 0
+            counters['next_frozen'] += bool(row['Is_frozen'])
+            counters['next_pulled'] += pulled > 0
+            counters['next_pulled_cards'] += pulled
+        previous_function = None if row['Card_function'] is None else str(row['Card_function'])
+        if previous_function is not None:
+            stats._function(previous_function)['plays'] += 1
+
+        # without playing, player pulls one card, more means that he took the stack of pull cards
+        if played == 0 and pulled > 1:
+            stats.pull_stacks[pulled] = stats.pull_stacks.get(pulled, 0) + 1
+
+    stats.turns = stats.min_turns = stats.max_turns = last_move
+    if winner is None:
+        stats.unfinished = 1
+    else:
+        stats.games = 1
+        stats.seat_games = [1] * len(seats)
+        stats.seat_wins = [int(seat == seats[winner]) for seat in range(len(seats))]
+    return stats
+
+def iter_file_rows(path: str) -> Iterator[Row]:
+    """Yields rows of .csv or binary log file"""
+    if path.endswith(c_dict.BINARY_LOG_EXTENSION):
+        from makao_game.binary_log import GameLog
+        with GameLog(path) as log:
+            rows: list[Row] = log.to_rows()
+        yield from rows
+    else:
+        yield from iter_csv_rows(path)
+
+def analyze_files(paths: list[str]) -> list[tuple[str, DataStats]]:
+    """Returns stats of every file, runs in worker processes"""
+    return [(path, analyze_rows(iter_file_rows(path))) for path in paths]
+
+
+class GameDataAnalyzer:
+    """Analyses all game data files in directory, files are read in chunks spread across processes\n
+    If game has both .csv and binary log, binary log is read. Stats of every file are cached in
+    CACHE_FILE_NAME together with its size and modification time, so only new and changed files are read
+    """
+    def __init__(self,
+                 data_dir_path: str,
+                 workers: int | None = None,
+                 chunk_size: int = 64,
+                 use_cache: bool = True) -> None:
+        self.data_dir_path: str = data_dir_path
+        self.workers: int = workers or os.cpu_count() or 1
+        self.chunk_size: int = chunk_size
+        self.use_cache: bool = use_cache
+        self.files_read: int = 0
+
+    @property
+    def cache_path(self) -> str:
+        return os.path.join(self.data_dir_path, CACHE_FILE_NAME)
+
+    def data_files(self) -> list[str]:
+        """Returns paths of files to analyse, one per game"""
+        games: dict[str, str] = {}
+        for file_name in sorted(os.listdir(self.data_dir_path)):
+            base, extension = os.path.splitext(file_name)
+            if extension == c_dict.BINARY_LOG_EXTENSION or (extension == '.csv' and base not in games):
+                games[base] = os.path.join(self.data_dir_path, file_name)
+        return list(games.values())
+
+    @staticmethod
+    def _signature(path: str) -> list[int]:
+        file_stat: os.stat_result = os.stat(path)
+        return [file_stat.st_size, file_stat.st_mtime_ns]
+
+    def _load_cache(self) -> dict[str, Any]:
+        if not self.use_cache or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='UTF-8') as file:
+                cache: dict[str, Any] = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return cache['files'] if cache.get('version') == CACHE_VERSION else {}
+
+    def _save_cache(self, files: dict[str, Any]) -> None:
+        temp_path: str = self.cache_path + '.tmp'
+        with open(temp_path, 'w', encoding='UTF-8') as file:
+            json.dump({'version': CACHE_VERSION, 'files': files}, file, separators=(',', ':'))
+        os.replace(temp_path, self.cache_path)
+
+    def _read(self, paths: list[str]) -> list[tuple[str, DataStats]]:
+        chunks: list[list[str]] = [paths[i:i + self.chunk_size] for i in range(0, len(paths), self.chunk_size)]
+        if self.workers == 1 or len(chunks) <= 1:
+            return [result for chunk in chunks for result in analyze_files(chunk)]
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            return [result for results in executor.map(analyze_files, chunks) for result in results]
+
+    def run(self) -> DataStats:
+        """Returns stats of all games in directory"""
+        start_time: float = time.perf_counter()
+        cached: dict[str, Any] = self._load_cache()
+        files: dict[str, Any] = {}
+        to_read: list[str] = []
+
+        for path in self.data_files():
+            file_name: str = os.path.basename(path)
+            signature: list[int] = self._signature(path)
+            if file_name in cached and cached[file_name]['signature'] == signature:
+                files[file_name] = cached[file_name]
+            else:
+                files[file_name] = {'signature': signature}
+                to_read.append(path)
+
+        for path, file_stats in self._read(to_read):
+            files[os.path.basename(path)]['stats'] = asdict(file_stats)
+        self.files_read = len(to_read)
+        if self.use_cache and (to_read or files.keys() != cached.keys()):
+            self._save_cache(files)
+
+        stats: DataStats = DataStats()
+        for file_name in sorted(files):
+            stats.merge(DataStats.from_dict(files[file_name]['stats']))
+        stats.elapsed = time.perf_counter() - start_time
+        return stats
@@ -0,0 +1,219 @@
+"""Columnar binary format of game data files, much smaller and faster to load than .csv
+
+File layout:
+- 8 bytes magic, 4 bytes little endian length of header,
+- JSON header with number of rows, item sizes of blocks and categories,
+- data blocks of columns in fixed order (see GameLog.__init__), each little endian and aligned to 8 bytes, so they can be viewed straight from mmap
+
+Cards are stored as ids from card_codes, lists of played/pulled cards as offsets + ids,
+Player_name, Card_function and Demanded_* as codes of categories listed in header.
+Played_cards_count and Pulled_cards_count are lengths of those lists, so they are not stored
+"""
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Any, Iterable, Iterator
+
+from makao_game import dictionaries as c_dict
+from makao_game import card_codes
+from makao_game.data_logger import read_csv_rows
+
+MAGIC: bytes = b'MAKAOLOG'
+VERSION: int = 1
+ALIGNMENT: int = 8
+
+INT_COLUMNS: list[str] = ['Game_move', 'Player_turn', 'Final_place', 'Player_deck_size']  # None stored as 0
+BOOL_COLUMNS: list[str] = ['Is_bot', 'Is_finished', 'Is_frozen', 'Is_card_functional']
+CATEGORY_COLUMNS: list[str] = ['Player_name', 'Card_function', 'Demanded_num', 'Demanded_col']
+CARD_COLUMNS: list[str] = ['Top_card_met']
+CARDS_LIST_COLUMNS: dict[str, str] = {'Played_cards_names': 'Played_cards_count', 'Pulled_cards_names': 'Pulled_cards_count'}
+
+CARD_IDS: dict[str, int] = {card_repr: c_id for c_id, card_repr in enumerate(card_codes.REPR_BY_ID)}
+
+Row = dict[str, str | int | bool | None]
+
+def _smallest_typecode(max_value: int) -> str:
+    """Returns typecode of the smallest unsigned array type that fits max_value"""
+    for typecode in 'BHIQ':
+        if max_value < 1 << (8 * array.array(typecode).itemsize):
+            return typecode
+    raise OverflowError(f'Value {max_value} is too big to be stored')
+
+def _uint_array(values: list[int]) -> array.array:
+    return array.array(_smallest_typecode(max(values, default=0)), values)
+
+def _split_cards(names: Any) -> list[int]:
+    if not names:
+        return []
+    return [CARD_IDS[card_repr] for card_repr in str(names).split('|')]
+
+
+def write_game_log(path: str, rows: Iterable[Row]) -> None:
+    """Writes rows of game data (the same as Game._game_data) to binary log file"""
+    rows = list(rows)
+    blocks: list[array.array] = []
+    categories: dict[str, list[str | None]] = {}
+
+    for name in INT_COLUMNS:
+        blocks.append(_uint_array([int(row[name] or 0) for row in rows]))
+    for name in BOOL_COLUMNS:
+        blocks.append(array.array('B', [bool(row[name]) for row in rows]))
+    for name in CATEGORY_COLUMNS:
+        codes_of: dict[str | None, int] = {None: 0}
+        blocks.append(_uint_array([codes_of.setdefault(
+            None if row[name] is None else str(row[name]), len(codes_of)) for row in rows]))
+        categories[name] = list(codes_of)
+    for name in CARD_COLUMNS:
+        blocks.append(array.array('B', [CARD_IDS[str(row[name])] for row in rows]))
+    for name, count_name in CARDS_LIST_COLUMNS.items():
+        offsets: list[int] = [0]
+        values: list[int] = []
+        for row in rows:
+            cards: list[int] = _split_cards(row[name])
+            if len(cards) != int(row[count_name] or 0):
+                raise ValueError(f'{count_name} does not match number of cards in {name} in move {row["Game_move"]}')
+            values.extend(cards)
+            offsets.append(len(values))
+        blocks.append(_uint_array(offsets))
+        blocks.append(array.array('B', values))
+
+    header: bytes = json.dumps({
+        'version': VERSION,
+        'rows': len(rows),
+        'itemsizes': [block.itemsize for block in blocks],
+        'categories': categories,
+    }, separators=(',', ':')).encode('UTF-8')
+
+    with open(path, 'wb') as file:
+        file.write(MAGIC + struct.pack('<I', len(header)) + header)
+        file.write(b'\0' * (-file.tell() % ALIGNMENT))
+        for block in blocks:
+            if sys.byteorder != 'little':
+                block.byteswap()
+            data: bytes = block.tobytes()
+            file.write(data + b'\0' * (-len(data) % ALIGNMENT))
+
+def convert_csv(csv_path: str, log_path: str | None = None) -> str:
+    """Converts game data .csv file to binary log file next to it, returns path of the new file"""
+    if log_path is None:
+        log_path = os.path.splitext(csv_path)[0] + c_dict.BINARY_LOG_EXTENSION
+    write_game_log(log_path, read_csv_rows(csv_path))
+    return log_path
+
+def convert_data_dir(data_dir_path: str) -> list[str]:
+    """Converts every .csv file in directory that does not have binary log yet, returns paths of new files"""
+    converted: list[str] = []
+    for file_name in sorted(os.listdir(data_dir_path)):
+        base, extension = os.path.splitext(file_name)
+        if extension == '.csv' and not os.path.exists(os.path.join(data_dir_path, base + c_dict.BINARY_LOG_EXTENSION)):
+            converted.append(convert_csv(os.path.join(data_dir_path, file_name)))
+    return converted
+
+
+class GameLog:
+    """Reads binary log file, columns are NumPy arrays viewing memory mapped file without copying\n
+    Arrays are valid as long as GameLog is open
+    """
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        with open(path, 'rb') as file:
+            self._buffer: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f'{path} is not a makao binary log file')
+        header_length: int = struct.unpack_from('<I', self._buffer, len(MAGIC))[0]
+        header_end: int = len(MAGIC) + 4 + header_length
+        header: dict[str, Any] = json.loads(self._buffer[len(MAGIC) + 4:header_end].decode('UTF-8'))
+        if header['version'] != VERSION:
+            raise ValueError(f'Unsupported binary log version {header["version"]}')
+        self.num_rows: int = header['rows']
+        self._categories: dict[str, list[str | None]] = header['categories']
+        self._blocks: dict[str, tuple[int, str, int]] = {}   # name: (offset, dtype, count)
+
+        position: int = header_end + -header_end % ALIGNMENT
+        itemsizes: Iterator[int] = iter(header['itemsizes'])
+
+        def add_block(name: str, count: int) -> None:
+            nonlocal position
+            itemsize: int = next(itemsizes)
+            self._blocks[name] = (position, f'<u{itemsize}', count)
+            position += -(-count * itemsize // ALIGNMENT) * ALIGNMENT
+
+        for name in INT_COLUMNS + BOOL_COLUMNS + CATEGORY_COLUMNS + CARD_COLUMNS:
+            add_block(name, self.num_rows)
+        for name in CARDS_LIST_COLUMNS:
+            add_block(f'{name}.offsets', self.num_rows + 1)
+            add_block(f'{name}.values', int(self._block(f'{name}.offsets')[-1]) if self.num_rows else 0)
+
+    def __enter__(self) -> 'GameLog':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @property
+    def columns(self) -> list[str]:
+        return INT_COLUMNS + BOOL_COLUMNS + CATEGORY_COLUMNS + CARD_COLUMNS + list(CARDS_LIST_COLUMNS)
+
+    def _block(self, name: str) -> Any:
+        import numpy as np
+        offset, dtype, count = self._blocks[name]
+        return np.frombuffer(self._buffer, dtype=dtype, count=count, offset=offset)
+
+    def column(self, name: str) -> Any:
+        """Returns values of int/bool column, card ids of card column or codes of category column"""
+        if name in CARDS_LIST_COLUMNS:
+            raise KeyError(f'{name} is a list column, use offsets() and values()')
+        values = self._block(name)
+        if name in BOOL_COLUMNS:
+            return values.view('?')
+        return values
+
+    def categories(self, name: str) -> list[str | None]:
+        """Returns categories of category column, code is index in this list, code 0 is None"""
+        return self._categories[name]
+
+    def offsets(self, name: str) -> Any:
+        """Returns offsets of list column, cards of row i are values[offsets[i]:offsets[i + 1]]"""
+        return self._block(f'{name}.offsets')
+
+    def values(self, name: str) -> Any:
+        """Returns ids of cards of all rows of list column"""
+        return self._block(f'{name}.values')
+
+    def counts(self, name: str) -> Any:
+        """Returns number of cards in every row of list column"""
+        import numpy as np
+        return np.diff(self.offsets(name))
+
+    def to_rows(self) -> list[Row]:
+        """Decodes whole log back to rows the same as Game._game_data"""
+        decoded: dict[str, list[Any]] = {}
+        for name in INT_COLUMNS:
+            decoded[name] = self.column(name).tolist()
+        decoded['Final_place'] = [place or None for place in decoded['Final_place']]
+        for name in BOOL_COLUMNS:
+            decoded[name] = self.column(name).tolist()
+        for name in CATEGORY_COLUMNS:
+            categories: list[str | None] = self.categories(name)
+            decoded[name] = [categories[code] for code in self.column(name).tolist()]
+        for name in CARD_COLUMNS:
+            decoded[name] = [card_codes.REPR_BY_ID[c_id] for c_id in self.column(name).tolist()]
+        for name, count_name in CARDS_LIST_COLUMNS.items():
+            offsets: list[int] = self.offsets(name).tolist()
+            values: list[str] = [card_codes.REPR_BY_ID[c_id] for c_id in self.values(name).tolist()]
+            decoded[name] = ['|'.join(values[offsets[i]:offsets[i + 1]]) for i in range(self.num_rows)]
+            decoded[count_name] = [offsets[i + 1] - offsets[i] for i in range(self.num_rows)]
+        return [{header: decoded[header][i] for header in c_dict.CSV_HEADERS} for i in range(self.num_rows)]
+
+    def close(self) -> None:
+        """Closes the file, if some arrays still view it, it is closed when they are gone"""
+        try:
+            self._buffer.close()
+        except BufferError:
+            pass
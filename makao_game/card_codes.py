@@ -0,0 +1,167 @@
+"""Compact integer representation of cards and precomputed table of which card can be played on which
+
+Card id is rank * NUM_SUITS + suit, where rank = number - 2 (0 for '2', 12 for Ace)
+and suit = colour series - 1 (0 for Clubs, 3 for Spades), so ids go from 0 to 51 in the order of Game._create_deck
+"""
+from typing import TYPE_CHECKING, Mapping, Sequence
+
+from makao_game import dictionaries as c_dict
+
+if TYPE_CHECKING:
+    from makao_game.cards_actions import CardsActions
+
+NUM_RANKS: int = len(c_dict.NAMES)
+NUM_SUITS: int = len(c_dict.COLOURS)
+NUM_CARDS: int = NUM_RANKS * NUM_SUITS
+MIN_NUMBER: int = min(c_dict.NAMES)
+
+PULL: str = c_dict.FUNCTIONS_TYPES_NAMES['PULL']
+FREEZE: str = c_dict.FUNCTIONS_TYPES_NAMES['FREEZE']
+DEMAND: str = c_dict.FUNCTIONS_TYPES_NAMES['DEMAND']
+ABOLISH: str = c_dict.FUNCTIONS_TYPES_NAMES['ABOLISH']
+REVERSE: str = c_dict.FUNCTIONS_TYPES_NAMES['REVERSE']
+
+# action states - CardsActions squeezed into one small int
+STATE_NONE: int = 0
+STATE_PULL: int = 1
+STATE_FREEZE: int = 2
+STATE_DEMAND_NOTHING: int = 3   # demand that no card satisfies (value not chosen yet or not a card name/colour)
+STATE_DEMAND_NAME: int = 4      # + rank
+STATE_DEMAND_COLOUR: int = STATE_DEMAND_NAME + NUM_RANKS    # + suit
+NUM_STATES: int = STATE_DEMAND_COLOUR + NUM_SUITS
+
+# function of a card - (type, value) as values of dictionaries.FUNCTIONS, table of them by number of card
+CardFunction = tuple[str, str | int]
+FunctionsTable = Mapping[int, CardFunction | Mapping[str, CardFunction]]
+
+def card_id(num: int, colour_series: int) -> int:
+    """Returns id of card with number from NAMES keys and colour series from COLOURS keys"""
+    return (num - MIN_NUMBER) * NUM_SUITS + colour_series - 1
+
+def card_rank(c_id: int) -> int:
+    return c_id // NUM_SUITS
+
+def card_suit(c_id: int) -> int:
+    return c_id % NUM_SUITS
+
+def card_number(c_id: int) -> int:
+    """Returns number of card, the same as key of NAMES"""
+    return c_id // NUM_SUITS + MIN_NUMBER
+
+def card_colour_series(c_id: int) -> int:
+    """Returns colour series of card, the same as key of COLOURS"""
+    return c_id % NUM_SUITS + 1
+
+def card_function(c_id: int, functions: FunctionsTable = c_dict.FUNCTIONS) -> CardFunction | None:
+    """Returns function of card in functions table (by number, then by colour name if it depends on colour),
+    None for non-functional cards
+    """
+    function = functions.get(card_number(c_id))
+    if function is None or isinstance(function, tuple):
+        return function
+    return function.get(c_dict.COLOURS[card_colour_series(c_id)]['name'])
+
+NAMES_BY_ID: list[str] = [c_dict.NAMES[card_number(c_id)] for c_id in range(NUM_CARDS)]
+REPR_BY_ID: list[str] = [NAMES_BY_ID[c_id] + c_dict.COLOURS[card_colour_series(c_id)]['symbol'] for c_id in range(NUM_CARDS)]
+FUNCTIONS_BY_ID: list[CardFunction | None] = [card_function(c_id) for c_id in range(NUM_CARDS)]
+FUNCTION_TYPES_BY_ID: list[str | None] = [f[0] if f else None for f in FUNCTIONS_BY_ID]
+QUEEN_RANK: int = card_rank(card_id(12, 1))
+KING_RANK: int = card_rank(card_id(13, 1))   # Kings are never played together, not all of them are functional
+# non-functional numbers (5 - 10) that can be demanded with a Jack
+NUMBER_DEMAND_RANKS: range = range(card_rank(card_id(5, 1)), card_rank(card_id(10, 1)) + 1)
+
+_DEMAND_STATES: dict[tuple[str, str], int] = {
+    **{(c_dict.DEMAND_OPTIONS_NAMES['JACK'], c_dict.NAMES[num]): STATE_DEMAND_NAME + num - MIN_NUMBER
+       for num in c_dict.NAMES},
+    **{(c_dict.DEMAND_OPTIONS_NAMES['ACE'], c_dict.COLOURS[series]['name']): STATE_DEMAND_COLOUR + series - 1
+       for series in c_dict.COLOURS},
+}
+
+def action_state(game_actions: 'CardsActions') -> int:
+    """Returns action state of current game actions, used as index of PLAYABLE_ROWS"""
+    action_type: str | None = game_actions.action_type
+    if action_type is None:
+        return STATE_NONE
+    elif action_type == PULL:
+        return STATE_PULL
+    elif action_type == FREEZE:
+        return STATE_FREEZE
+    elif action_type == DEMAND:
+        if game_actions.demanded_type not in c_dict.DEMAND_OPTIONS_NAMES.values():
+            raise ValueError('Action type set to Demand but nor demand type set correctly')
+        assert isinstance(game_actions.demanded_type, str)
+        return _DEMAND_STATES.get((game_actions.demanded_type, str(game_actions.demanded_value)), STATE_DEMAND_NOTHING)
+    else:
+        raise ValueError('Action type is neither None or any other FUNCTIONS_TYPES_NAMES')
+
+ALL_CARDS_MASK: int = (1 << NUM_CARDS) - 1
+RANK_MASKS: list[int] = [sum(1 << c_id for c_id in range(NUM_CARDS) if card_rank(c_id) == rank) for rank in range(NUM_RANKS)]
+SUIT_MASKS: list[int] = [sum(1 << c_id for c_id in range(NUM_CARDS) if card_suit(c_id) == suit) for suit in range(NUM_SUITS)]
+FUNCTIONAL_MASK: int = sum(1 << c_id for c_id in range(NUM_CARDS) if FUNCTIONS_BY_ID[c_id] is not None)
+
+def build_legal_masks(function_types: Sequence[str | None],
+                      abolish_on_anything: bool = True,
+                      anything_on_abolish: bool = True) -> list[int]:
+    """Rules of playing cards as table like LEGAL_MASKS for cards with function types by id
+    (FUNCTION_TYPES_BY_ID for the default rules)
+
+    abolish_on_anything lets abolishing cards be played on any card in any state,
+    anything_on_abolish lets any card be played on an abolishing card
+    """
+    function_masks: dict[str, int] = {
+        function_type: sum(1 << c_id for c_id in range(NUM_CARDS) if function_types[c_id] == function_type)
+        for function_type in c_dict.FUNCTIONS_TYPES_NAMES.values()
+    }
+    functional: int = sum(1 << c_id for c_id in range(NUM_CARDS) if function_types[c_id] is not None)
+    always: int = function_masks[ABOLISH] if abolish_on_anything else 0
+
+    def legal_mask(old_id: int, state: int) -> int:
+        if anything_on_abolish and function_types[old_id] == ABOLISH:
+            return ALL_CARDS_MASK
+
+        matching: int = SUIT_MASKS[card_suit(old_id)] | RANK_MASKS[card_rank(old_id)]
+        legal: int
+        if state == STATE_NONE:
+            legal = matching
+        elif state == STATE_PULL:
+            legal = (function_masks[PULL] | function_masks[REVERSE]) & matching
+        elif state == STATE_FREEZE:
+            legal = function_masks[FREEZE]
+        else:
+            # functional card of the same name as the one that demanded
+            legal = functional & RANK_MASKS[card_rank(old_id)]
+            if STATE_DEMAND_NAME <= state < STATE_DEMAND_COLOUR:
+                legal |= RANK_MASKS[state - STATE_DEMAND_NAME]
+            elif STATE_DEMAND_COLOUR <= state < NUM_STATES:
+                legal |= SUIT_MASKS[state - STATE_DEMAND_COLOUR]
+        return legal | always
+
+    return [legal_mask(old_id, state) for state in range(NUM_STATES) for old_id in range(NUM_CARDS)]
+
+def build_playable_rows(legal_masks: list[int]) -> list[bytes]:
+    """Returns table like PLAYABLE_ROWS of legality table,
+    many rows are equal, so they are built once per distinct mask
+    """
+    rows_by_mask: dict[int, bytes] = {mask: _mask_to_row(mask) for mask in set(legal_masks)}
+    return [rows_by_mask[mask] for mask in legal_masks]
+
+def _mask_to_row(mask: int) -> bytes:
+    return bytes((mask >> c_id) & 1 for c_id in range(NUM_CARDS))
+
+# LEGAL_MASKS[state * NUM_CARDS + top card id] has bit card id set if that card can be played (default rules)
+LEGAL_MASKS: list[int] = build_legal_masks(FUNCTION_TYPES_BY_ID)
+
+# PLAYABLE_ROWS[state * NUM_CARDS + top card id][card id] is 1 if card can be played on top card in that state
+PLAYABLE_ROWS: list[bytes] = build_playable_rows(LEGAL_MASKS)
+
+def legal_mask(top_id: int, state: int) -> int:
+    return LEGAL_MASKS[state * NUM_CARDS + top_id]
+
+def ids_in_mask(mask: int) -> list[int]:
+    """Returns ids of cards which bits are set in mask, from the lowest"""
+    ids: list[int] = []
+    while mask:
+        lowest: int = mask & -mask
+        ids.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return ids
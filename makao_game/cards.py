@@ -1,32 +1,54 @@
 from __future__ import annotations
 
 from makao_game import dictionaries as c_dict
+from makao_game import card_codes
 from makao_game.utils import colour_string
 from makao_game.cards_actions import CardsActions
 
-PULL: str = c_dict.FUNCTIONS_TYPES_NAMES['PULL']
-FREEZE: str = c_dict.FUNCTIONS_TYPES_NAMES['FREEZE']
-DEMAND: str = c_dict.FUNCTIONS_TYPES_NAMES['DEMAND']
-ABOLISH: str = c_dict.FUNCTIONS_TYPES_NAMES['ABOLISH']
-REVERSE: str = c_dict.FUNCTIONS_TYPES_NAMES['REVERSE']
-
 class Card:
-    def __init__(self, num: int, colour_series: int, display_symbols: dict[str, str]) -> None:
+    """Immutable playing card\n
+    Cards of the deck are created once and shared by all games (CARDS, Card.from_id), so games do not build their own.
+    How a card is displayed depends on IOHandler, see display_names and IOHandler.card_names.
+    Functions of cards depend on rules of the game, see rules.py (CompiledRules.functions)
+    """
+    __slots__ = ('_number', 'id', 'rank', 'suit', 'name', 'symbol', 'colour')
+    _number: int
+    id: int
+    rank: int
+    suit: int
+    name: str
+    symbol: str
+    colour: str
+
+    def __init__(self, num: int, colour_series: int) -> None:
         """Creates a card object that represent a card from a deck in a game """
-        self._number: int = num
-        self.name: str = self._what_name()
-        self.symbol: str = self._what_colour(colour_series, 's')
-        self.colour: str = self._what_colour(colour_series, 'c')
-        self.function: tuple[str, str | int] | None = self._what_function()
-        self._str: str = display_symbols[self.colour]
+        set_attribute = object.__setattr__
+        set_attribute(self, '_number', num)
+        set_attribute(self, 'id', card_codes.card_id(num, colour_series))
+        set_attribute(self, 'rank', card_codes.card_rank(self.id))
+        set_attribute(self, 'suit', card_codes.card_suit(self.id))
+        set_attribute(self, 'name', self._what_name())
+        set_attribute(self, 'symbol', self._what_colour(colour_series, 's'))
+        set_attribute(self, 'colour', self._what_colour(colour_series, 'c'))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError('Card is immutable')
 
-    def __str__(self) -> str:
-        """Cards name and symbol to display provided at creation"""
-        return f'{self.name}{self._str}'
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('Card is immutable')
+
+    def __reduce__(self) -> tuple[object, tuple[int]]:
+        """Copies and unpickled cards are the shared ones"""
+        return Card.from_id, (self.id,)
+
+    @staticmethod
+    def from_id(c_id: int) -> Card:
+        """Returns shared card with id from card_codes"""
+        return CARDS[c_id]
 
     def __repr__(self) -> str:
-        """Cards name and symbol\n
-        Without any attachments
+        """Cards name and symbol, also used by str\n
+        Without any attachments, how cards are shown to players depends on IOHandler.card_names
         """
         return f'{self.name}{self.symbol}'
 
@@ -44,61 +66,25 @@ class Card:
         else:
             raise ValueError
 
-    def _is_functional(self) -> bool:
-        """Returns whether card has a function or not"""
-        if self._number == 13 and (self.colour == c_dict.COLOURS[3]['name'] or self.colour == c_dict.COLOURS[4]['name']):
-            return True
-        elif self._number in [2, 3, 4, 11, 12, 14]:
-            return True
-        else:
-            return False
-
-    def _what_function(self) -> tuple[str, str | int] | None:
-        """Returns what function does a card have"""
-        if self._is_functional():
-            function: tuple[str, str | int] | dict[str, tuple[str, str | int]] = c_dict.FUNCTIONS[self._number]
-            if isinstance(function, dict):
-                return function[self.colour]
-            elif isinstance(function, tuple):
-                return function
-        else:
-            return None
-
     def can_be_played(self, old_card: Card, game_actions: CardsActions) -> bool:
-        """Returns True if card can be played on old card, with current game actions"""
-
-        if isinstance(self.function, tuple):
-            if self.function[0] == ABOLISH:
-                return True
-        if isinstance(old_card.function, tuple):
-            if old_card.function[0] == ABOLISH:
-                return True
-
-        action_type: str | None = game_actions.action_type
-        if action_type is None:
-            return self.colour == old_card.colour or self.name == old_card.name
+        """Returns True if card can be played on old card, with current game actions\n
+        Looks the answer up in playable rows of the rules of the game (game_actions.rules)
+        """
+        return game_actions.rules.playable_rows[card_codes.action_state(game_actions) * card_codes.NUM_CARDS + old_card.id][self.id] == 1
 
-        elif action_type == PULL:
-            if isinstance(self.function, tuple):
-                return (self.function[0] == PULL or self.function[0] == REVERSE) and \
-                (self.colour == old_card.colour or self.name == old_card.name)
-            return False
 
-        elif action_type == FREEZE:
-            if isinstance(self.function, tuple):
-               return self.function[0] == FREEZE
-            return False
+CARDS: tuple[Card, ...] = tuple(Card(card_codes.card_number(c_id), card_codes.card_colour_series(c_id))
+                                for c_id in range(card_codes.NUM_CARDS))
 
-        elif action_type == DEMAND:
-            if isinstance(self.function, tuple):
-                if self.name == old_card.name:
-                    return True
+_DISPLAY_NAMES: dict[tuple[tuple[str, str], ...], tuple[str, ...]] = {}
 
-            if game_actions.demanded_type == c_dict.DEMAND_OPTIONS_NAMES['JACK']:
-                return self.name == game_actions.demanded_value
-            elif game_actions.demanded_type == c_dict.DEMAND_OPTIONS_NAMES['ACE']:
-                return self.colour == game_actions.demanded_value
-            else:
-                raise ValueError('Action type set to Demand but nor demand type set correctly')
-        else:
-            raise ValueError('Action type is neither None or any other FUNCTIONS_TYPES_NAMES')
+def display_names(display_symbols: dict[str, str]) -> tuple[str, ...]:
+    """Returns how every card is displayed with symbols of colours (IOHandler.supported_symbols), index is card id\n
+    Tables are cached, so handlers with the same symbols share one
+    """
+    key: tuple[tuple[str, str], ...] = tuple(sorted(display_symbols.items()))
+    names: tuple[str, ...] | None = _DISPLAY_NAMES.get(key)
+    if names is None:
+        names = tuple(f'{card.name}{display_symbols[card.colour]}' for card in CARDS)
+        _DISPLAY_NAMES[key] = names
+    return names
@@ -1,14 +1,25 @@
 from makao_game.dictionaries import FUNCTIONS_TYPES_NAMES, DEMAND_OPTIONS_NAMES
+from makao_game.rules import (CompiledRules, DEFAULT_RULES, EFFECT_NONE, EFFECT_PULL, EFFECT_FREEZE, EFFECT_DEMAND,
+                              EFFECT_ABOLISH)
 
 class CardsActions:
-    """Creates class responsible for storing and managing current actions in game dictated by played cards functions"""
-    def __init__(self) -> None:
+    """Creates class responsible for storing and managing current actions in game dictated by played cards functions\n
+    rules are compiled rules of the game (rules.compile_rules), they do not change during the game\n
+    demand_started is True only between playing a demanding card and the next turn,
+    so the game can tell a finisher who has just demanded from the others
+    """
+    __slots__ = ('action_type', 'pull_stack', 'freeze_stack', 'demanded_type', 'demanded_value', 'demands_duration',
+                 'demand_started', 'reversed_order', 'update_player_inputs', 'rules')
+
+    def __init__(self, rules: CompiledRules | None = None) -> None:
+        self.rules: CompiledRules = rules if rules is not None else DEFAULT_RULES
         self.action_type: str | None = None
         self.pull_stack: int = 0
         self.freeze_stack: int = 0
         self.demanded_type: str | None = None
         self.demanded_value: str | None = None   # set only when demanded number or colour
         self.demands_duration: int = 0
+        self.demand_started: bool = False
         self.reversed_order: bool = False
         self.update_player_inputs: bool = False
 
@@ -20,10 +31,31 @@ class CardsActions:
         self.demanded_type = None
         self.demanded_value = None
         self.demands_duration = 0
+        self.demand_started = False
         self.update_player_inputs = False
 
+    def snapshot(self) -> tuple[str | None, int, int, str | None, str | None, int, bool, bool, bool]:
+        """Returns all attributes as a tuple, restore sets them back"""
+        return (self.action_type, self.pull_stack, self.freeze_stack, self.demanded_type, self.demanded_value,
+                self.demands_duration, self.reversed_order, self.update_player_inputs, self.demand_started)
+
+    def restore(self, state: tuple[str | None, int, int, str | None, str | None, int, bool, bool, bool]) -> None:
+        (self.action_type, self.pull_stack, self.freeze_stack, self.demanded_type, self.demanded_value,
+         self.demands_duration, self.reversed_order, self.update_player_inputs, self.demand_started) = state
+
+    def shorten_demand(self) -> None:
+        """Demand lasts one turn less, resets all actions if it was its last turn\n
+        Used when a player did not play during a demand (pulled or was frozen)
+        """
+        self.demand_started = False
+        if self.demands_duration > 1:
+            self.demands_duration -= 1
+        else:
+            self.reset_actions()
+
     def _handle_non_functional_card(self, multi_cards_played: bool) -> None:
         """Reduces demands_duration or reset all actions"""
+        self.demand_started = False
         if self.demanded_value is not None:
             if (multi_cards_played and self.demanded_value == DEMAND_OPTIONS_NAMES['ACE']) or self.demands_duration == 1:
                 self.reset_actions()
@@ -40,11 +72,12 @@ class CardsActions:
         self.action_type = FUNCTIONS_TYPES_NAMES['FREEZE']
         self.freeze_stack += multiplier
 
-    def _handle_demand_action(self, demanded_type: str, num_players: int) -> None:
+    def _handle_demand_action(self, demanded_type: str, duration: int) -> None:
         self.action_type = FUNCTIONS_TYPES_NAMES['DEMAND']
         self.demanded_type = demanded_type
         self.demanded_value = None
-        self.demands_duration = num_players
+        self.demands_duration = duration
+        self.demand_started = True
         self.update_player_inputs = True
 
     def update_actions_with_player_inputs(self, user_input: str) -> None:
@@ -64,6 +97,7 @@ class CardsActions:
         if card with demand action played, sets update_player_inputs to True
         """
         multiple_cards_played: bool = num_cards_played > 1
+        self.demand_started = False
 
         if card_played_function is None:
             self._handle_non_functional_card(multiple_cards_played)
@@ -94,3 +128,22 @@ class CardsActions:
         else:
             raise ValueError('Card function is not None, and its name is not recognised')
         return None
+
+    def apply_card(self, c_id: int, num_cards_played: int, num_players: int) -> None:
+        """apply_card_effects of card with id, its effect is looked up in integer tables of the rules"""
+        rules: CompiledRules = self.rules
+        effect: int = rules.effects[c_id]
+        self.demand_started = False
+        if effect == EFFECT_NONE:
+            self._handle_non_functional_card(num_cards_played > 1)
+        elif effect == EFFECT_PULL:
+            self._handle_pull_action(rules.pull_counts[c_id], num_cards_played)
+        elif effect == EFFECT_FREEZE:
+            self._handle_freeze_action(num_cards_played)
+        elif effect == EFFECT_DEMAND:
+            self._handle_demand_action(rules.demand_types[c_id], rules.demand_turns[c_id] or num_players)  # type: ignore[arg-type]
+        elif effect == EFFECT_ABOLISH:
+            self.reset_actions()
+        else:
+            self.reversed_order = not self.reversed_order
+            self._handle_pull_action(rules.pull_counts[c_id], num_cards_played)
@@ -0,0 +1,40 @@
+"""Client side of the protocol of server.py, used by play_client.py and by loopback clients of benchmarks
+
+Client sends its name as the first line, then reads JSON line events of the server and answers
+every input event with one line
+"""
+import asyncio
+import inspect
+import json
+from typing import Any, Awaitable, Callable
+
+Event = dict[str, Any]
+
+async def play_client(host: str,
+                      port: int,
+                      name: str,
+                      answer: Callable[[Event], str | None | Awaitable[str | None]],
+                      keep_events: bool = True) -> list[Event]:
+    """Connects to server as name, passes every event to answer (function or coroutine function),
+    sends back what it returns for input events and returns events received until the server closed
+    the connection (none if keep_events is False)
+    """
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(name.encode() + b'\n')
+    events: list[Event] = []
+    try:
+        async for line in reader:
+            event: Event = json.loads(line)
+            if keep_events:
+                events.append(event)
+            response: str | None | Awaitable[str | None] = answer(event)
+            if inspect.isawaitable(response):
+                response = await response
+            if event['type'] == 'input':
+                writer.write((response or '').encode() + b'\n')
+                await writer.drain()
+    finally:
+        writer.close()
+    return events
@@ -0,0 +1,99 @@
+import csv
+import os
+from typing import Iterator, TextIO
+
+from makao_game import dictionaries as c_dict
+
+DEFAULT_BATCH_SIZE: int = 64
+
+def format_csv_value(header: str, value: str | int | bool | None) -> str:
+    """Returns value the way pandas.DataFrame.to_csv writes it in game data files\n
+    None is empty, bools are True/False, Final_place is float column (empty in most rows), so it gets .0
+    """
+    if value is None:
+        return ''
+    if header == 'Final_place':
+        return repr(float(value))
+    return str(value)
+
+def format_csv_row(turn_data: dict[str, str | int | bool | None]) -> list[str]:
+    """Returns values of turn data in CSV_HEADERS order, ready to be written"""
+    return [format_csv_value(header, turn_data.get(header)) for header in c_dict.CSV_HEADERS]
+
+
+class TurnLogWriter:
+    """Appends turns data to ;-separated .csv file while the game goes on\n
+    Writes header at once and keeps at most batch_size rows in memory, so a crash loses only unflushed rows.
+    Output is the same as Game.save_data writes with pandas
+    """
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+        self.path: str = path
+        self.batch_size: int = batch_size
+        self.rows_written: int = 0
+        self._buffer: list[list[str]] = []
+        self._file: TextIO = open(path, 'w', encoding='UTF-8', newline='')
+        self._writer = csv.writer(self._file, delimiter=';', lineterminator=os.linesep, quoting=csv.QUOTE_MINIMAL)
+        self._writer.writerow(c_dict.CSV_HEADERS)
+        self._file.flush()
+
+    def __enter__(self) -> 'TurnLogWriter':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, turn_data: dict[str, str | int | bool | None]) -> None:
+        """Adds one turn to the buffer and flushes it when it is full"""
+        self._buffer.append(format_csv_row(turn_data))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes buffered rows to the file and pushes them to the disk"""
+        if self._buffer:
+            self._writer.writerows(self._buffer)
+            self.rows_written += len(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if not self.closed:
+            self.flush()
+            self._file.close()
+
+
+_BOOL_HEADERS: set[str] = {'Is_bot', 'Is_finished', 'Is_frozen', 'Is_card_functional'}
+_INT_HEADERS: set[str] = {'Game_move', 'Player_turn', 'Player_deck_size', 'Played_cards_count', 'Pulled_cards_count'}
+_TEXT_HEADERS: set[str] = {'Player_name', 'Played_cards_names', 'Pulled_cards_names'}
+
+def parse_csv_value(header: str, text: str) -> str | int | bool | None:
+    """Reverses format_csv_value, returns value as it was in Game._game_data"""
+    if header in _TEXT_HEADERS:
+        return text
+    if text == '':
+        return None
+    if header in _BOOL_HEADERS:
+        return text == 'True'
+    if header in _INT_HEADERS:
+        return int(text)
+    if header == 'Final_place':
+        return int(float(text))
+    return text
+
+def iter_csv_rows(path: str) -> Iterator[dict[str, str | int | bool | None]]:
+    """Reads game data file row by row, yields dicts the same as Game._game_data"""
+    with open(path, 'r', encoding='UTF-8', newline='') as file:
+        reader = csv.DictReader(file, delimiter=';')
+        for row in reader:
+            yield {header: parse_csv_value(header, row[header]) for header in c_dict.CSV_HEADERS}
+
+def read_csv_rows(path: str) -> list[dict[str, str | int | bool | None]]:
+    """Reads game data file and returns its rows as dicts the same as Game._game_data"""
+    return list(iter_csv_rows(path))
@@ -56,8 +56,11 @@ CSV_HEADERS: list[str] = ['Game_move','Player_name','Is_bot','Player_turn','Is_f
                          'Demanded_num','Demanded_col']
 
 DATA_DIR_NAME: str = 'game_data'
+BINARY_LOG_EXTENSION: str = '.mlog'
+REPLAY_EXTENSION: str = '.replay.json'
 
 MAX_NUM_OF_PLAYERS: int = 6
+MAX_NAME_BYTES: int = 32   # longest name in UTF-8 that rating table stores
 
 ASCII_START: str = '\033['
 ASCII_END: str = '\033[0m'
@@ -1,39 +1,73 @@
-import asyncio
 from datetime import datetime
-import pandas as pd  # type: ignore
+from typing import Callable, Sequence, TypedDict, Unpack
+import copy
 import random
 import os
 
 from makao_game.player import Player, BotPlayer
 from makao_game import dictionaries as c_dict
 from makao_game.utils import get_data_path
-from makao_game.cards import Card
+from makao_game.cards import Card, CARDS
 from makao_game.cards_actions import CardsActions
+from makao_game.piles import DrawPile, DiscardPile
+from makao_game.turn_order import TurnOrder
+from makao_game.game_state import GameState, PlayerState
+from makao_game.data_logger import TurnLogWriter
 from makao_game.io_handler import IOHandler, IODataType, ConsoleIOHandler
+from makao_game.timing import TurnProfiler
+from makao_game.rules import RuleSet, DEFAULT_RULE_SET, compile_rules
+
+class PlayerNames(TypedDict, total=False):
+    """Names kwargs of Game: names of human players and of bots"""
+    players: list[str]
+    bots: list[str]
+
 
 class Game:
     def __init__(self, 
-                io_handler: IOHandler = ConsoleIOHandler(), 
-                data_dir_path: str = get_data_path(), 
-                **names: list[str]) -> None:
+                io_handler: IOHandler | None = None, 
+                data_dir_path: str | None = None, 
+                rng: random.Random | None = None,
+                bit_hands: bool = False,
+                log_batch_size: int | None = None,
+                bot_types: dict[str, Callable[..., BotPlayer]] | None = None,
+                profiler: TurnProfiler | None = None,
+                rules: RuleSet | None = None,
+                **names: Unpack[PlayerNames]) -> None:
         
         """available kwargs: players, bots\n
-        Creates class that handles all logic in a game
+        Creates class that handles all logic in a game\n
+        io_handler defaults to ConsoleIOHandler, data_dir_path to get_data_path()\n
+        rng is used for every random choice in the game (also by bots), pass seeded one to make game reproducible\n
+        bit_hands makes players keep their cards in BitHand\n
+        log_batch_size turns on streaming of turns data to .csv file during the game,
+        rows are written every log_batch_size turns instead of keeping all of them for save_data\n
+        bot_types maps names of bots from kwargs to classes (or factories with BotPlayer arguments) used instead of BotPlayer\n
+        profiler records durations of phases of every turn (see timing.py), without it nothing is timed\n
+        rules are the rules of the game (see rules.py), house variants are declared as RuleSet, defaults to standard rules
         """
-        self.io_handler: IOHandler = io_handler
-
-        self._names: dict[str, list[str]] = names
-        self._players: list[Player | BotPlayer] = []
+        self.io_handler: IOHandler = io_handler if io_handler is not None else ConsoleIOHandler()
+        self._rng: random.Random = rng if rng is not None else random.Random()
+        self._bit_hands: bool = bit_hands
+        self._bot_types: dict[str, Callable[..., BotPlayer]] = bot_types if bot_types is not None else {}
+        self.profiler: TurnProfiler | None = profiler
+        self.rules: RuleSet = rules if rules is not None else DEFAULT_RULE_SET
+
+        self._names: PlayerNames = names
+        self._players: TurnOrder[Player | BotPlayer] = TurnOrder()
         self._current_player: Player | BotPlayer | None = None
         self._finishers: list[Player | BotPlayer] = []
 
-        self._main_deck: list[Card] = []
-        self._play_deck: list[Card] = []
-        self._actions: CardsActions = CardsActions()
+        self._main_deck: DrawPile = DrawPile()
+        self._cards_by_id: Sequence[Card] = CARDS   # every card of the game, index is card id
+        self._play_deck: DiscardPile = DiscardPile()
+        self._actions: CardsActions = CardsActions(compile_rules(self.rules))
 
         self._turn: int = 0
         self._game_data: list[dict[str, str | int | bool | None]] = []
-        self._data_dir_path: str = data_dir_path
+        self._data_dir_path: str = data_dir_path if data_dir_path is not None else get_data_path()
+        self._log_batch_size: int | None = log_batch_size
+        self._data_writer: TurnLogWriter | None = None
 
     def __str__(self):
         return f'Game players: {[player.name for player in self._players]}'
@@ -41,19 +75,26 @@ class Game:
     async def run_game(self):
         """Starts the game and keeps it on until one player remains"""
         await self._prepare_game()
-        while len(self._players) > 1:
-            self._turn += 1
+        try:
+            while len(self._players) > 1:
+                self._turn += 1
 
-            assert isinstance(self._current_player, Player | BotPlayer)
-            await self._player_turn(self._current_player)
+                assert isinstance(self._current_player, Player | BotPlayer)
+                await self._player_turn(self._current_player)
+        finally:
+            if self._data_writer is not None:
+                self._data_writer.flush()
 
     async def _prepare_game(self) -> None:
-        self._players = (await asyncio.gather(self._handle_players_creation()))[0]
-        self._current_player = self._players[0]
+        self._players = TurnOrder(await self._handle_players_creation())
+        self._current_player = self._players.current
 
-        self._main_deck = self._create_deck()
+        self._main_deck = DrawPile(self._create_deck())
         self._dealing_cards()
-        self._play_deck = [self._start_card()]
+        self._play_deck = DiscardPile([self._start_card()])
+
+        if self._log_batch_size is not None:
+            self._data_writer = TurnLogWriter(self._data_file_path(), self._log_batch_size)
 
     async def _handle_players_creation(self) -> list[Player | BotPlayer]:
         """available kwargs: players, bots\n
@@ -73,8 +114,9 @@ class Game:
             username=None,
             message='Do you want to shuffle the order of players?'
         )
+        self._on_decision('shuffle', shuffle.lower() in ['yes', 'y'])
         if shuffle.lower() in ['yes', 'y']:
-            random.shuffle(all_players)
+            self._rng.shuffle(all_players)
         return all_players
 
     def _create_players_from_kwargs(self, pre_players_names: list[str], pre_bots_names: list[str]) -> list[Player | BotPlayer]:
@@ -95,17 +137,20 @@ class Game:
                 players.append(
                     Player(
                         player_name=name,
-                        io_handler=self.io_handler
+                        io_handler=self.io_handler,
+                        bit_hand=self._bit_hands
                     )
                 )
 
             for name in pre_bots_names:
-                bots.append(
-                    BotPlayer(
-                        bot_name=name,
-                        io_handler=self.io_handler
-                    )
+                bot: BotPlayer = self._bot_types.get(name, BotPlayer)(
+                    bot_name=name,
+                    io_handler=self.io_handler,
+                    rng=self._rng,
+                    bit_hand=self._bit_hands
                 )
+                bot.join_game(self)
+                bots.append(bot)
 
         return [*players, *bots]
 
@@ -175,113 +220,126 @@ class Game:
 
         name: str
         for i in range(num_players):
-            name = await self.io_handler.get_user_input(
-                data_type=IODataType.GAME,
-                username=None,
-                message=f'What is {i + 1}. player name?'
-            )
-            while name.replace(" ", "") in used_names:
-                await self.io_handler.display_message(
-                    message='Names cannot repeat!',
-                    warning=True
-                )
-                name = await self.io_handler.get_user_input(
-                    data_type=IODataType.GAME,
-                    username=None,
-                    message=f'What is {i + 1}. player name?'
-                )
+            name = await self._input_name(f'What is {i + 1}. player name?', used_names)
             players.append(
                 Player(
                     player_name=name,
-                    io_handler=self.io_handler
+                    io_handler=self.io_handler,
+                    bit_hand=self._bit_hands
                 )
             )
-            used_names.append(name)
 
         for i in range(num_bots):
-            name = await self.io_handler.get_user_input(
+            name = await self._input_name(f'What is {i + 1}. bot name?', used_names)
+            bots.append(
+                BotPlayer(
+                    bot_name=name,
+                    io_handler=self.io_handler,
+                    rng=self._rng,
+                    bit_hand=self._bit_hands
+                )
+            )
+
+        return [*players, *bots]
+
+    async def _input_name(self, message: str, used_names: list[str]) -> str:
+        """Asks for a name until it is not empty, differs from used names (ignoring spaces)
+        and can be stored in the rating table (at most MAX_NAME_BYTES in UTF-8, no null characters), adds it to them
+        """
+        while True:
+            name: str = await self.io_handler.get_user_input(
                 data_type=IODataType.GAME,
                 username=None,
-                message=f'What is {i + 1}. bot name?'
+                message=message
             )
-            while name.replace(" ", "") in used_names:
+            name_key: str = name.replace(" ", "")
+            if not name_key:
                 await self.io_handler.display_message(
-                    message='Names cannot repeat!',
+                    message='Name cannot be empty!',
                     warning=True
                 )
-                name = await self.io_handler.get_user_input(
-                    data_type=IODataType.GAME,
-                    username=None,
-                    message=f'What is {i + 1}. bot name?'
+            elif name_key in used_names:
+                await self.io_handler.display_message(
+                    message='Names cannot repeat!',
+                    warning=True
                 )
-            bots.append(
-                BotPlayer(
-                    bot_name=name,
-                    io_handler=self.io_handler
+            elif len(name.encode('UTF-8')) > c_dict.MAX_NAME_BYTES or '\0' in name:
+                await self.io_handler.display_message(
+                    message=f'Name is too long or has null characters (at most {c_dict.MAX_NAME_BYTES} bytes in UTF-8)!',
+                    warning=True
                 )
-            )
-            used_names.append(name)
-
-        return [*players, *bots]
+            else:
+                used_names.append(name_key)
+                return name
 
     def _create_deck(self) -> list[Card]:
-        """Returns list of card, representing whole standard cards deck"""
-        deck: list = []
-        symbols: dict[str, str] = self.io_handler.supported_symbols()
-        for num in range(2, 15):
-            for colour in range(1, 5):
-                deck.append(
-                    Card(
-                        num=num,
-                        colour_series=colour,
-                        display_symbols=symbols
-                    )
-                )
-        return deck
+        """Returns list of card, representing whole standard cards deck\n
+        Cards are the shared ones from cards.CARDS, ordered by id
+        """
+        return list(CARDS)
 
     def _dealing_cards(self):
         """Deals cards among players\n
         if number of players is grater than 3 deals each 5 cards, else 7
         """
-        random.shuffle(self._main_deck)
+        self._main_deck.shuffle(self._rng)
         if len(self._players) < 4:
             num_of_cards = 7
         else:
             num_of_cards = 5
         for num in range(0, num_of_cards):
             for player in self._players:
-                card = self._main_deck.pop(0)
+                card = self._main_deck.draw()
                 player.deck.append(card)
 
     def _start_card(self) -> Card:
         """Chose from deck one card that is put at the start of play_deck\n
         card is non-functional and is not a King
         """
-        card = random.choice(self._main_deck)
-        while isinstance(card.function, tuple) or card.name == 'King':
-            card = random.choice(self._main_deck)
+        functions: tuple[tuple[str, str | int] | None, ...] = self._actions.rules.functions
+        card = self._rng.choice(self._main_deck)
+        while functions[card.id] is not None or card.name == 'King':
+            card = self._rng.choice(self._main_deck)
         self._main_deck.remove(card)
         return card
 
     async def _player_turn(self, player: Player | BotPlayer) -> None:
-        """All logic about player's turn"""
+        """All logic about player's turn\n
+        If the game has a profiler, durations of phases of the turn are recorded in it
+        """
+        profiler: TurnProfiler | None = self.profiler
+        is_bot: bool = profiler is not None and isinstance(player, BotPlayer)
+        started: int = 0
 
         player.played_card = False # have to reset it every new turn so if he doesn't make it won't show he did from the last turn
         was_frozen: bool = False
         start_deck_size: int = len(player.deck)
-        start_top_card: Card = self._play_deck[0]
+        start_top_card: Card = self._play_deck.top
 
+        if profiler is not None:
+            started = profiler.now()
         await self._display_turn_start_info()
+        if profiler is not None:
+            profiler.record('display', is_bot, started)
 
         if player.frozen_rows > 0:
             was_frozen = True
             await self._handle_frozen_player()
         else:
-            player.have_valid_cards(self._play_deck[0], self._actions)
+            if profiler is not None:
+                started = profiler.now()
+            player.have_valid_cards(self._play_deck.top, self._actions)
+            if profiler is not None:
+                profiler.record('have_valid_cards', is_bot, started)
             pass_or_play: str = ''
 
             if player.valid_cards:
+                if profiler is not None:
+                    started = profiler.now()
                 pass_or_play = await player.play_or_pass()
+                if profiler is not None:
+                    profiler.record('play_or_pass', is_bot, started)
+                self._on_decision('play', pass_or_play == 'play')
 
                 if pass_or_play == 'play':
                     await self._handle_player_move()
@@ -293,14 +351,26 @@ class Game:
                     )
 
             if not player.valid_cards or pass_or_play == 'pass':
+                if profiler is not None:
+                    started = profiler.now()
                 await self._handle_no_play_action(pass_or_play == 'pass')
+                if profiler is not None:
+                    profiler.record('pull_cards', is_bot, started)
 
         player.turn += 1
+        if profiler is not None:
+            started = profiler.now()
         self._collect_data(was_frozen, start_deck_size, start_top_card)
+        if profiler is not None:
+            profiler.record('collect_data', is_bot, started)
+            started = profiler.now()
         self._next_player()
+        if profiler is not None:
+            profiler.record('next_player', is_bot, started)
 
         if len(player.deck) == 0:
             await self._handle_finisher(player)
+        await self.io_handler.flush()
 
     async def _display_turn_start_info(self) -> None:
         """Display info at the beginning of player's turn such as:\n
@@ -312,20 +382,21 @@ class Game:
         player: Player | BotPlayer = self._current_player
 
         await self.io_handler.display_message(
-            message=f'Card on a table: {self._play_deck[0]}'
+            message=f'Card on a table: {self.io_handler.card_names()[self._play_deck.top.id]}'
         )
         if self._actions.action_type == c_dict.FUNCTIONS_TYPES_NAMES['DEMAND']:
             await self.io_handler.display_message(
                 message=f'Your are demanded to play: {self._actions.demanded_value}'
             )
-        await self.io_handler.display_message(
+        await self.io_handler.display_private_message(
+            username=player.name,
             message=f'{player.name} this is your deck:\n{self._deck_to_print(player.deck)}'
         )
 
-    @staticmethod
-    def _deck_to_print(deck_to_show: list[Card]) -> str:
+    def _deck_to_print(self, deck_to_show: list[Card]) -> str:
         """Returns string of cards in chosen deck that is ready to be printed"""
-        return ', '.join([f'{i + 1}:{card}' for i, card in enumerate(deck_to_show)])
+        names: tuple[str, ...] = self.io_handler.card_names()
+        return ', '.join([f'{i + 1}:{names[card.id]}' for i, card in enumerate(deck_to_show)])
 
     async def _handle_frozen_player(self) -> None:
         """Handle cases when player was frozen at the start of his turn"""
@@ -335,33 +406,60 @@ class Game:
         await self.io_handler.display_message(
             message=f'{player.name} was frozen.'
         )
+        self._skip_frozen_turn(player)
+
+    def _skip_frozen_turn(self, player: Player | BotPlayer) -> None:
+        """Takes one frozen turn from player and shortens current demands by him"""
         player.frozen_rows -= 1
         # skip his turn in demands to colour/number
         if self._actions.action_type == c_dict.FUNCTIONS_TYPES_NAMES['DEMAND']:
-            if self._actions.demands_duration > 1:
-                self._actions.demands_duration -= 1
-            else:
-                # can this even happen?
-                self._actions.reset_actions()
+            self._actions.shorten_demand()
 
     async def _handle_player_move(self) -> None:
         """PLayer chooses and plays the cards and then if needed says makao"""
         assert isinstance(self._current_player, Player | BotPlayer)
         player: Player | BotPlayer = self._current_player
 
-        cards_to_play: list[Card] = await player.choose_card(self._play_deck[0], self._actions)
-        for card in cards_to_play:
-            self._play_deck.insert(0, card)
-            player.deck.remove(card)
-
-        self._actions.apply_card_effects(self._play_deck[0].function, len(cards_to_play), len(self._players))
+        profiler: TurnProfiler | None = self.profiler
+        is_bot: bool = profiler is not None and isinstance(player, BotPlayer)
+        started: int = profiler.now() if profiler is not None else 0
+        cards_to_play: list[Card] = await player.choose_card(self._play_deck.top, self._actions)
+        if profiler is not None:
+            profiler.record('choose_card', is_bot, started)
+        self._on_decision('cards', cards_to_play)
+        if profiler is not None:
+            started = profiler.now()
+        self._place_cards(player, cards_to_play)
+        if profiler is not None:
+            profiler.record('apply_card_effects', is_bot, started)
         if self._actions.update_player_inputs:
             assert isinstance(self._actions.demanded_type, str)
             demand: str = await player.handle_demanding(self._actions.demanded_type)
+            self._on_decision('demand', demand)
             self._actions.update_actions_with_player_inputs(demand)
 
-        if not await player.say_makao():
+        said_makao: bool = await player.say_makao()
+        self._on_decision('makao', said_makao)
+        if not said_makao:
+            if profiler is not None:
+                started = profiler.now()
             player.deck.extend(await self._pull_cards(5))
+            if profiler is not None:
+                profiler.record('pull_cards', is_bot, started)
+
+    def _on_decision(self, kind: str, value: bool | str | list[Card]) -> None:
+        """Called after every decision of a player (kinds: shuffle, play, cards, demand, makao), does nothing\n
+        Overridden by RecordedGame to record decisions for replay
+        """
+        return None
+
+    def _place_cards(self, player: Player | BotPlayer, cards_to_play: list[Card]) -> None:
+        """Moves chosen cards from player's deck on top of play_deck and applies their effects"""
+        for card in cards_to_play:
+            self._play_deck.place(card)
+            player.deck.remove(card)
+
+        self._actions.apply_card(self._play_deck.top.id, len(cards_to_play), len(self._players))
 
     async def _handle_no_play_action(self, passed: bool) -> None:
         """Handles logic when player didn't have valid cards or passed his turn
@@ -369,97 +467,114 @@ class Game:
         """
         assert isinstance(self._current_player, Player | BotPlayer)
         player: Player | BotPlayer = self._current_player
+        action_type: str | None = self._actions.action_type
+        pull_stack: int = self._actions.pull_stack
+
+        pulled: list[Card] | None = self._resolve_no_play_action(player)
+        if pulled is None:
+            await self._warn_empty_decks()
+
+        if action_type == c_dict.FUNCTIONS_TYPES_NAMES['FREEZE']:
+            return None
+        elif action_type == c_dict.FUNCTIONS_TYPES_NAMES['PULL']:
+            await self.io_handler.display_message(
+                message=f'{player.name} did not have valid cards, he pulled {pull_stack} new cards'
+            )
+        elif passed and action_type != c_dict.FUNCTIONS_TYPES_NAMES['DEMAND']:
+            await self.io_handler.display_message(
+                message=f'{player.name} did not want to play his cards, he pulled new one'
+            )
+        else:
+            await self.io_handler.display_message(
+                message=f'{player.name} did not have valid cards, he pulled new card'
+            )
+        return None
+
+    def _resolve_no_play_action(self, player: Player | BotPlayer) -> list[Card] | None:
+        """Changes demands and stacks after player didn't play and gives him cards he has to pull\n
+        Returns pulled cards or None if there were no cards left to pull
+        """
         # TODO 2. Make available to play first pulled card if it can be played
+        pulled: list[Card] | None = []
         if self._actions.action_type == c_dict.FUNCTIONS_TYPES_NAMES['FREEZE']:
             player.frozen_rows = self._actions.freeze_stack - 1  # - 1 because already he is frozen in this round
             self._actions.reset_actions()
 
         elif self._actions.action_type == c_dict.FUNCTIONS_TYPES_NAMES['DEMAND']:
-            player.deck.extend(await self._pull_cards(1))
-            await self.io_handler.display_message(
-                message=f'{player.name} did not have valid cards, he pulled new card'
-            )
-            if self._actions.demands_duration > 1:
-                self._actions.demands_duration -= 1
-            else:
-                self._actions.reset_actions()
+            pulled = self._draw_cards(1)
+            self._actions.shorten_demand()
 
         elif self._actions.action_type == c_dict.FUNCTIONS_TYPES_NAMES['PULL']:
-            player.deck.extend(await self._pull_cards(self._actions.pull_stack))
-            await self.io_handler.display_message(
-                message=f'{player.name} did not have valid cards, he pulled {self._actions.pull_stack} new cards'
-            )
+            pulled = self._draw_cards(self._actions.pull_stack)
             self._actions.reset_actions()
 
         else:
-            player.deck.extend(await self._pull_cards(1))
+            pulled = self._draw_cards(1)
             self._actions.reset_actions()
-            if passed:
-                await self.io_handler.display_message(
-                    message=f'{player.name} did not want to play his cards, he pulled new one'
-                )
-            else:
-                await self.io_handler.display_message(
-                    message=f'{player.name} did not have valid cards, he pulled new card'
-                )
+
+        if pulled:
+            player.deck.extend(pulled)
+        return pulled
 
     def _next_player(self) -> None:
         """Sets new current player for a next round"""
-        assert isinstance(self._current_player, Player | BotPlayer)
-        c_player =  self._players.index(self._current_player)
-        if not self._actions.reversed_order:
-            try:
-                self._current_player = self._players[c_player + 1]
-            except IndexError:
-                self._current_player = self._players[0]
-        else:
-            try:
-                self._current_player = self._players[c_player - 1]
-            except IndexError:
-                self._current_player = self._players[-1]
+        self._current_player = self._players.advance(self._actions.reversed_order)
 
     async def _handle_finisher(self, player: Player | BotPlayer):
         """Removes player from active players list adds him to finishers and checks if demands len should be shortened"""
-        # checking if he just played demands card
-        if (self._actions.action_type == c_dict.FUNCTIONS_TYPES_NAMES['DEMAND'] and
-                self._actions.demands_duration == len(self._players)):
-            self._actions.demands_duration -= 1
-
         await self.io_handler.display_message(
             message='Congrats!!! You finished the game!',
             warning=True
         )
+        self._remove_finisher(player)
+
+    def _remove_finisher(self, player: Player | BotPlayer) -> None:
+        """Moves player from active players to finishers\n
+        If he has just played a demanding card whose demand lasts a round, the round is one player shorter
+        """
+        if self._actions.demand_started and self._actions.rules.demand_turns[self._play_deck.top.id] == 0:
+            self._actions.demands_duration -= 1
+
         self._finishers.append(player)
         self._players.remove(player)
 
     async def _pull_cards(self, num_of_cards) -> list[Card]:
         """Returns list of cards for player to pull"""
+        new_cards: list[Card] | None = self._draw_cards(num_of_cards)
+        if new_cards is None:
+            await self._warn_empty_decks()
+            return []
+        return new_cards
+
+    async def _warn_empty_decks(self) -> None:
+        await self.io_handler.display_message(
+            message='You ran out of cards to pull\nPlay your damn cards!',
+            warning=True
+        )
+
+    def _draw_cards(self, num_of_cards: int) -> list[Card] | None:
+        """Returns list of cards taken from main_deck or None if both decks ran out of cards"""
         new_cards: list[Card] = []
         for num in range(0, num_of_cards):
             if len(self._main_deck) == 0:
                 self._update_main_deck()
             try:
-                new_cards.append(self._main_deck[0])
-                self._main_deck.pop(0)
+                new_cards.append(self._main_deck.draw())
             except IndexError:
-                await self.io_handler.display_message(
-                    message='You ran out of cards to pull\nPlay your damn cards!',
-                    warning=True
-                )
-                return []
+                return None
         return new_cards
 
     def _update_main_deck(self) -> None:
         """Takes cards from overstocking play_deck and returns them to main_deck so players can pull them from it"""
         if len(self._main_deck) < 21:
-            while len(self._play_deck) > 1:
-                self._main_deck.append(self._play_deck[-1])
-                self._play_deck.pop(-1)
-        random.shuffle(self._main_deck)
+            self._main_deck.refill(self._play_deck.take_all_but_top(), self._rng)
+        else:
+            self._main_deck.shuffle(self._rng)
 
     def _collect_data(self, frozen_before: bool, deck_size_before: int, top_card_before: Card) -> None:
         """Takes few data from the beginning of the turn as arguments, then collects actual data and saves it as dict"""
         assert isinstance(self._current_player, Player | BotPlayer)
+        top_function: tuple[str, str | int] | None = self._actions.rules.functions[self._play_deck.top.id]
         turn_data: dict[str, str | int | bool | None] = {
             'Game_move': self._turn,
             'Player_name': self._current_player.name,
@@ -474,7 +589,7 @@ class Game:
             'Played_cards_names': '',
             'Pulled_cards_count': 0,
             'Pulled_cards_names': '',
-            'Is_card_functional': isinstance(self._play_deck[0].function, tuple),
+            'Is_card_functional': top_function is not None,
             'Card_function': None,
             'Demanded_num': None,
             'Demanded_col': None,
@@ -488,24 +603,24 @@ class Game:
             # Normal case
             if cards_played > 0:
                 turn_data['Played_cards_count'] = cards_played
-                turn_data['Played_cards_names'] = '|'.join([repr(self._play_deck[i]) for i in range(cards_played)])
+                turn_data['Played_cards_names'] = '|'.join([repr(card) for card in self._play_deck.recent(cards_played)])
             # didn't say makao
             elif cards_played < 0:
                 turn_data['Played_cards_count'] = cards_played + 5
-                turn_data['Played_cards_names'] = '|'.join([repr(self._play_deck[i]) for i in range(cards_played + 5)])
+                turn_data['Played_cards_names'] = '|'.join([repr(card) for card in self._play_deck.recent(cards_played + 5)])
                 turn_data['Pulled_cards_count'] = 5
                 turn_data['Pulled_cards_names'] = '|'.join([repr(self._current_player.deck[-i]) for i in range(1, 6)])
 
             else:
                 raise ValueError("Player played a card but len of his deck didn't change!")
 
-            if isinstance(self._play_deck[0].function, tuple):
-                turn_data['Card_function'] = self._play_deck[0].function[0]
+            if top_function is not None:
+                turn_data['Card_function'] = top_function[0]
 
-                if self._play_deck[0].function[1] == c_dict.DEMAND_OPTIONS_NAMES['JACK']:
+                if top_function[1] == c_dict.DEMAND_OPTIONS_NAMES['JACK']:
                     turn_data['Demanded_num'] = self._actions.demanded_value
 
-                elif self._play_deck[0].function[1] == c_dict.DEMAND_OPTIONS_NAMES['ACE']:
+                elif top_function[1] == c_dict.DEMAND_OPTIONS_NAMES['ACE']:
                     turn_data['Demanded_col'] = self._actions.demanded_value
 
         elif not frozen_before:
@@ -513,7 +628,10 @@ class Game:
             turn_data['Pulled_cards_count'] = card_pulled
             turn_data['Pulled_cards_names'] = '|'.join([repr(self._current_player.deck[-i]) for i in range(1, card_pulled + 1)])
 
-        self._game_data.append(turn_data)
+        if self._data_writer is not None:
+            self._data_writer.write(turn_data)
+        else:
+            self._game_data.append(turn_data)
 
     async def show_leaderboard(self):
         """Prints the leaderboard of the game - who had which place and who was last """
@@ -524,11 +642,36 @@ class Game:
         await self.io_handler.display_message(
             message=f'Last place takes: {self._players[0].name}'
         )
+        await self.io_handler.flush()
+
+    def placings(self) -> list[str]:
+        """Returns names of players from first to last place, players still in the game after finishers"""
+        return [player.name for player in self._finishers] + [player.name for player in self._players]
 
-    def save_data(self) -> None:
-        """Takes list of dicts of data saved from game turns and saves it in .csv file"""
-        df: pd.DataFrame = pd.DataFrame(self._game_data, columns=c_dict.CSV_HEADERS)
-        df.to_csv(path_or_buf=self._data_file_path(), sep=';', encoding='UTF-8', index=False, header=True)
+    def save_data(self, binary: bool = False) -> str:
+        """Takes list of dicts of data saved from game turns and saves it in .csv file\n
+        If data was streamed during the game, only writes what is left and closes the file\n
+        If binary set to True, also saves the data in columnar binary log file next to .csv\n
+        Returns path of .csv file
+        """
+        csv_path: str
+        if self._data_writer is not None:
+            self._data_writer.close()
+            csv_path = self._data_writer.path
+        else:
+            import pandas as pd  # type: ignore  # imported here, because it is slow and needed only for saving
+            csv_path = self._data_file_path()
+            df: pd.DataFrame = pd.DataFrame(self._game_data, columns=c_dict.CSV_HEADERS)
+            df.to_csv(path_or_buf=csv_path, sep=';', encoding='UTF-8', index=False, header=True)
+
+        if binary:
+            from makao_game.binary_log import write_game_log, convert_csv
+            log_path: str = os.path.splitext(csv_path)[0] + c_dict.BINARY_LOG_EXTENSION
+            if self._data_writer is not None:
+                convert_csv(csv_path, log_path)
+            else:
+                write_game_log(log_path, self._game_data)
+        return csv_path
 
     def _data_file_path(self) -> str:
         """Returns path where to save data files\n
@@ -539,18 +682,91 @@ class Game:
         base_timestamp = datetime.now().strftime("%Y-%m-%d_%H.%M.%S")
         return f'{self._data_dir_path}/{base_timestamp}.csv'
 
+    def snapshot(self) -> GameState:
+        """Returns immutable state of the game: piles, players' cards, frozen rows and turns, actions and order
+
+        io_handler, rng and collected data are not part of the state
+        """
+        seats_left, current_seat = self._players.snapshot()
+        return GameState(
+            turn=self._turn,
+            main_deck=self._main_deck.snapshot(),
+            play_deck=self._play_deck.snapshot(),
+            players=tuple([
+                PlayerState(bytes([card.id for card in player.deck]), player.frozen_rows, player.turn,
+                            player.valid_cards, player.played_card)
+                for player in self._players.all_players
+            ]),
+            seats_left=bytes(seats_left),
+            current_seat=current_seat,
+            finishers=bytes([self._players.seat(player) for player in self._finishers]),
+            actions=self._actions.snapshot(),
+        )
+
+    def restore(self, state: GameState) -> None:
+        """Sets the game back to state from snapshot of this game or of its clone"""
+        players: list[Player | BotPlayer] = self._players.all_players
+        if len(state.players) != len(players):
+            raise ValueError('State is from a game with different number of players')
+        cards: Sequence[Card] = self._cards_by_id
+        self._turn = state.turn
+        self._main_deck.restore(state.main_deck, cards)
+        self._play_deck.restore(state.play_deck, cards)
+        for player, player_state in zip(players, state.players):
+            player.deck[:] = [cards[c_id] for c_id in player_state.deck]
+            player.frozen_rows = player_state.frozen_rows
+            player.turn = player_state.turn
+            player.valid_cards = player_state.valid_cards
+            player.played_card = player_state.played_card
+        self._players.restore(state.seats_left, state.current_seat)
+        self._current_player = players[state.current_seat]
+        self._finishers = [players[seat] for seat in state.finishers]
+        self._actions.restore(state.actions)
+
+    def clone(self, rng: random.Random | None = None) -> 'Game':
+        """Returns independent game in the same state, without deep copying
+
+        Clone shares io_handler and settings, but has its own players, piles and actions.
+        Bots of clone join it (BotPlayer.join_game), so bots that keep the game search the clone.
+        rng defaults to a copy of this game's generator, so clone makes the same random choices.
+        Collected data is not copied and clone does not stream it
+        """
+        game: Game = copy.copy(self)
+        if rng is None:
+            rng = random.Random()
+            rng.setstate(self._rng.getstate())
+        game._rng = rng
+
+        players: list[Player | BotPlayer] = []
+        for player in self._players.all_players:
+            twin: Player | BotPlayer = copy.copy(player)
+            twin.deck = type(player.deck)()
+            if isinstance(twin, BotPlayer):
+                twin._rng = rng
+                twin._available_deck = []
+                twin.join_game(game)
+            players.append(twin)
+        game._players = TurnOrder(players)
+        game._main_deck = DrawPile()
+        game._play_deck = DiscardPile()
+        game._actions = CardsActions(self._actions.rules)
+        game._game_data = []
+        game._data_writer = None
+        game.restore(self.snapshot())
+        return game
+
     def get_game_status(self) -> dict[str, str | list[str]]:
         """
             Returns dict with data of current state of game\n
             Provided data:
-            - top card,
+            - top card (displayed with io_handler.card_names),
             - current player,
             - players,
             - finishers,
             - turn,
         """
         return {
-            'top_card': str(self._play_deck[0]) if self._play_deck else 'None',
+            'top_card': self.io_handler.card_names()[self._play_deck.top.id] if self._play_deck else 'None',
             'current_player': self._current_player.name if self._current_player else 'None',
             'players': [player.name for player in self._players],
             'finishers': [player.name for player in self._finishers],
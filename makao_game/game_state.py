@@ -0,0 +1,146 @@
+"""Compact, immutable snapshot of everything that changes during a game
+
+Cards are kept as bytes of ids from card_codes, players by seats of TurnOrder,
+so snapshot can be shared, compared, hashed and turned into a small byte string
+"""
+import random
+import struct
+from typing import NamedTuple
+
+VERSION: int = 1
+
+ActionsState = tuple[str | None, int, int, str | None, str | None, int, bool, bool, bool]
+
+class PlayerState(NamedTuple):
+    """State of the player at one seat"""
+    deck: bytes
+    frozen_rows: int
+    turn: int
+    valid_cards: bool
+    played_card: bool
+
+
+class GameState(NamedTuple):
+    """State of the game, see Game.snapshot and Game.restore\n
+    main_deck and play_deck go from the bottom to the top,
+    players are indexed by seat, seats_left are seats still at the table in seating order,
+    finishers are seats of players who finished, from the first place,
+    actions are CardsActions fields in CardsActions.snapshot order
+    """
+    turn: int
+    main_deck: bytes
+    play_deck: bytes
+    players: tuple[PlayerState, ...]
+    seats_left: bytes
+    current_seat: int
+    finishers: bytes
+    actions: ActionsState
+
+    def determinized(self, seat: int, rng: random.Random) -> 'GameState':
+        """Returns state as seen by player at seat, with hidden cards (draw pile and hands of other players)
+        dealt again at random, every hand keeps its size
+        """
+        hidden: bytearray = bytearray(self.main_deck)
+        for other_seat, player in enumerate(self.players):
+            if other_seat != seat:
+                hidden += player.deck
+        rng.shuffle(hidden)
+        position: int = len(self.main_deck)
+        players: list[PlayerState] = []
+        for other_seat, player in enumerate(self.players):
+            if other_seat == seat or not player.deck:
+                players.append(player)
+            else:
+                players.append(player._replace(deck=bytes(hidden[position:position + len(player.deck)])))
+                position += len(player.deck)
+        return self._replace(main_deck=bytes(hidden[:len(self.main_deck)]), players=tuple(players))
+
+    def to_bytes(self) -> bytes:
+        """Returns state packed into a small byte string, reversed by from_bytes"""
+        (action_type, pull_stack, freeze_stack, demanded_type, demanded_value, duration, reversed_order, update,
+         demand_started) = self.actions
+        parts: list[bytes] = [
+            struct.pack('<BIBB', VERSION, self.turn, len(self.players), self.current_seat),
+            _pack_bytes(self.main_deck),
+            _pack_bytes(self.play_deck),
+            _pack_bytes(self.seats_left),
+            _pack_bytes(self.finishers),
+        ]
+        for player in self.players:
+            parts.append(_pack_bytes(player.deck))
+            parts.append(struct.pack('<HIB', player.frozen_rows, player.turn, player.valid_cards | player.played_card << 1))
+        parts.append(_pack_str(action_type))
+        parts.append(struct.pack('<HHH', pull_stack, freeze_stack, duration))
+        parts.append(_pack_str(demanded_type))
+        parts.append(_pack_str(demanded_value))
+        parts.append(struct.pack('<B', reversed_order | update << 1 | demand_started << 2))
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'GameState':
+        """Unpacks state from to_bytes"""
+        reader: _Reader = _Reader(data)
+        version, turn, num_players, current_seat = reader.unpack('<BIBB')
+        if version != VERSION:
+            raise ValueError(f'Unsupported game state version {version}')
+        main_deck: bytes = reader.bytes()
+        play_deck: bytes = reader.bytes()
+        seats_left: bytes = reader.bytes()
+        finishers: bytes = reader.bytes()
+        players: list[PlayerState] = []
+        for _ in range(num_players):
+            deck: bytes = reader.bytes()
+            frozen_rows, player_turn, flags = reader.unpack('<HIB')
+            players.append(PlayerState(deck, frozen_rows, player_turn, bool(flags & 1), bool(flags & 2)))
+        action_type: str | None = reader.str()
+        pull_stack, freeze_stack, duration = reader.unpack('<HHH')
+        demanded_type: str | None = reader.str()
+        demanded_value: str | None = reader.str()
+        flags = reader.unpack('<B')[0]
+        if reader.position != len(data):
+            raise ValueError('Game state has unexpected bytes at the end')
+        actions: ActionsState = (action_type, pull_stack, freeze_stack, demanded_type, demanded_value, duration,
+                                 bool(flags & 1), bool(flags & 2), bool(flags & 4))
+        return cls(turn, main_deck, play_deck, tuple(players), seats_left, current_seat, finishers, actions)
+
+
+def _pack_bytes(data: bytes) -> bytes:
+    return struct.pack('<B', len(data)) + data
+
+def _pack_str(text: str | None) -> bytes:
+    """Packs text with its length, None is stored as length 255"""
+    if text is None:
+        return b'\xff'
+    encoded: bytes = text.encode('UTF-8')
+    if len(encoded) >= 255:
+        raise ValueError('Text is too long to be stored in game state')
+    return struct.pack('<B', len(encoded)) + encoded
+
+
+class _Reader:
+    """Reads values packed by GameState.to_bytes one after another"""
+    def __init__(self, data: bytes) -> None:
+        self.data: bytes = data
+        self.position: int = 0
+
+    def unpack(self, fmt: str) -> tuple:
+        values: tuple = struct.unpack_from(fmt, self.data, self.position)
+        self.position += struct.calcsize(fmt)
+        return values
+
+    def bytes(self) -> bytes:
+        length: int = self.data[self.position]
+        start: int = self.position + 1
+        self.position = start + length
+        if self.position > len(self.data):
+            raise ValueError('Game state is cut off')
+        return self.data[start:self.position]
+
+    def str(self) -> str | None:
+        length: int = self.data[self.position]
+        self.position += 1
+        if length == 255:
+            return None
+        text: bytes = self.data[self.position:self.position + length]
+        self.position += length
+        return text.decode('UTF-8')
@@ -0,0 +1,193 @@
+from typing import Iterable, SupportsIndex
+
+from makao_game import card_codes
+from makao_game.cards import Card
+
+class Hand(list):
+    """List of cards that also counts cards of every rank and suit it holds\n
+    Counters are updated by every change of the list (dealing, pulling and playing cards),
+    so questions like 'how many Jacks' or 'which colour the most' are lookups instead of scans of the deck.
+    Setting Hand.check_counters to True verifies counters against the cards after every change
+    """
+    check_counters: bool = False
+
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        super().__init__()
+        self.rank_counts: list[int] = [0] * card_codes.NUM_RANKS
+        self.suit_counts: list[int] = [0] * card_codes.NUM_SUITS
+        self.extend(cards)
+
+    def _add(self, card: Card) -> None:
+        self.rank_counts[card.rank] += 1
+        self.suit_counts[card.suit] += 1
+
+    def _discard(self, card: Card) -> None:
+        self.rank_counts[card.rank] -= 1
+        self.suit_counts[card.suit] -= 1
+
+    def _reset(self) -> None:
+        """Sets counters as for an empty hand"""
+        self.rank_counts = [0] * card_codes.NUM_RANKS
+        self.suit_counts = [0] * card_codes.NUM_SUITS
+
+    def _rebuild(self) -> None:
+        self._reset()
+        for card in self:
+            self._add(card)
+
+    def verify(self) -> None:
+        """Raises ValueError if counters do not match cards in hand"""
+        rank_counts: list[int] = [0] * card_codes.NUM_RANKS
+        suit_counts: list[int] = [0] * card_codes.NUM_SUITS
+        for card in self:
+            rank_counts[card.rank] += 1
+            suit_counts[card.suit] += 1
+        if rank_counts != self.rank_counts or suit_counts != self.suit_counts:
+            raise ValueError(f'Counters of hand {list(self)} do not match its cards: ranks {self.rank_counts}, '
+                             f'suits {self.suit_counts}')
+
+    def append(self, card: Card) -> None:
+        super().append(card)
+        self._add(card)
+        if self.check_counters:
+            self.verify()
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        cards = list(cards)
+        super().extend(cards)
+        for card in cards:
+            self._add(card)
+        if self.check_counters:
+            self.verify()
+
+    def __iadd__(self, cards: Iterable[Card]) -> 'Hand':  # type: ignore[override, misc]
+        self.extend(cards)
+        return self
+
+    def __imul__(self, times: SupportsIndex) -> 'Hand':  # type: ignore[override, misc]
+        super().__imul__(times)
+        self._rebuild()
+        if self.check_counters:
+            self.verify()
+        return self
+
+    def insert(self, index: SupportsIndex, card: Card) -> None:
+        super().insert(index, card)
+        self._add(card)
+        if self.check_counters:
+            self.verify()
+
+    def remove(self, card: Card) -> None:
+        super().remove(card)
+        self._discard(card)
+        if self.check_counters:
+            self.verify()
+
+    def pop(self, index: SupportsIndex = -1) -> Card:
+        card: Card = super().pop(index)
+        self._discard(card)
+        if self.check_counters:
+            self.verify()
+        return card
+
+    def clear(self) -> None:
+        super().clear()
+        self._reset()
+
+    def __setitem__(self, index, value) -> None:  # type: ignore[no-untyped-def]
+        super().__setitem__(index, value)
+        self._rebuild()
+        if self.check_counters:
+            self.verify()
+
+    def __delitem__(self, index) -> None:  # type: ignore[no-untyped-def]
+        super().__delitem__(index)
+        self._rebuild()
+        if self.check_counters:
+            self.verify()
+
+    def most_common_suit(self) -> int | None:
+        """Returns suit hand has the most cards of, of tied suits the one that comes first in hand,
+        None for empty hand
+        """
+        most: int = max(self.suit_counts)
+        if most == 0:
+            return None
+        if self.suit_counts.count(most) == 1:
+            return self.suit_counts.index(most)
+        return next(card.suit for card in self if self.suit_counts[card.suit] == most)
+
+    def most_common_rank(self, ranks: range) -> int | None:
+        """Returns rank from ranks hand has the most cards of, of tied ranks the one that comes first in hand,
+        None if hand has none of them
+        """
+        counts: list[int] = self.rank_counts[ranks.start:ranks.stop]
+        most: int = max(counts)
+        if most == 0:
+            return None
+        if counts.count(most) == 1:
+            return ranks.start + counts.index(most)
+        return next(card.rank for card in self if card.rank in ranks and self.rank_counts[card.rank] == most)
+
+
+class BitHand(Hand):
+    """Hand that also keeps a bitmask of ids of cards it holds\n
+    Works wherever Player.deck list works, but checking for playable cards is a single AND of masks.
+    Cards with the same id (from different decks) are counted, bit of id is cleared after the last one leaves
+    """
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        self._mask: int = 0
+        self._by_id: dict[int, list[Card]] = {}
+        super().__init__(cards)
+
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    def _add(self, card: Card) -> None:
+        super()._add(card)
+        same_cards: list[Card] | None = self._by_id.get(card.id)
+        if same_cards is None:
+            self._by_id[card.id] = [card]
+            self._mask |= 1 << card.id
+        else:
+            same_cards.append(card)
+
+    def _discard(self, card: Card) -> None:
+        super()._discard(card)
+        same_cards: list[Card] = self._by_id[card.id]
+        same_cards.remove(card)
+        if not same_cards:
+            del self._by_id[card.id]
+            self._mask &= ~(1 << card.id)
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._mask = 0
+        self._by_id = {}
+
+    def verify(self) -> None:
+        """Raises ValueError if counters or mask do not match cards in hand"""
+        super().verify()
+        mask: int = 0
+        for card in self:
+            mask |= 1 << card.id
+        if mask != self._mask:
+            raise ValueError(f'Mask of hand {list(self)} does not match its cards')
+
+    def count_id(self, c_id: int) -> int:
+        """Returns how many cards with that id are in hand"""
+        return len(self._by_id.get(c_id, ()))
+
+    def has_playable(self, top_id: int, state: int, legal_masks: list[int] = card_codes.LEGAL_MASKS) -> bool:
+        """Returns True if any card in hand can be played on top card in action state from card_codes,
+        legal_masks are of the rules of the game (CompiledRules.legal_masks), default rules if not given
+        """
+        return self._mask & legal_masks[state * card_codes.NUM_CARDS + top_id] != 0
+
+    def playable_cards(self, top_id: int, state: int, legal_masks: list[int] = card_codes.LEGAL_MASKS) -> list[Card]:
+        """Returns cards that can be played on top card in action state, ordered by id"""
+        cards: list[Card] = []
+        for c_id in card_codes.ids_in_mask(self._mask & legal_masks[state * card_codes.NUM_CARDS + top_id]):
+            cards.extend(self._by_id[c_id])
+        return cards
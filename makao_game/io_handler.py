@@ -1,9 +1,14 @@
+import sys
 from abc import ABC, abstractmethod
-import asyncio
 from enum import Enum
+from typing import TYPE_CHECKING, TextIO
 
 from makao_game.utils import colour_string
 from makao_game.dictionaries import COLOURS
+from makao_game.cards import display_names
+
+if TYPE_CHECKING:
+    import asyncio
 
 class IODataType(Enum):
     MAKAO = 'makao'
@@ -14,6 +19,8 @@ class IODataType(Enum):
     YES_NO = 'yes'
 
 class IOHandler(ABC):
+    _card_names: tuple[str, ...] | None = None
+
     @abstractmethod
     async def get_user_input(self, data_type: IODataType, username: str | None, message: str = '') -> str:
         """Takes user's input and returns it"""
@@ -26,19 +33,46 @@ class IOHandler(ABC):
         """
         pass
 
+    async def display_private_message(self, username: str, message: str, warning: bool = False) -> None:
+        """Displays message meant only for player username (his cards, answers to his input),
+        handlers shared by a single screen display it as any other message
+        """
+        await self.display_message(message, warning)
+
     @abstractmethod
     def supported_symbols(self) -> dict[str, str]:
         """Returns dict with key of colour card and value of what to display to user instead of raw symbols"""
         pass
 
+    def card_names(self) -> tuple[str, ...]:
+        """Returns how cards are displayed by this handler, index is card id.
+        Made from supported_symbols on the first call, handlers with the same symbols share the table
+        """
+        if self._card_names is None:
+            self._card_names = display_names(self.supported_symbols())
+        return self._card_names
+
+    async def flush(self) -> None:
+        """Game calls it at the end of every turn and after the leaderboard,
+        handlers that keep messages back write them out here. Does nothing by default
+        """
+        return None
+
+    async def close(self) -> None:
+        """Writes everything the handler still keeps and stops its background work. Does nothing by default"""
+        return None
+
 class ConsoleIOHandler(IOHandler):
+    # asyncio is imported in methods, so processes that never talk to console (simulations) don't pay for its import
     async def get_user_input(self, data_type: IODataType, username: str | None, message: str = '') -> str:
+        import asyncio
         user_input: str = await asyncio.to_thread(input, message)
         return user_input
 
     async def display_message(self, message: str, warning: bool = False) -> None:
         if warning:
             message = colour_string(message, 'red')
+        import asyncio
         await asyncio.to_thread(print, message)
 
     def supported_symbols(self) -> dict[str, str]:
@@ -50,3 +84,106 @@ class ConsoleIOHandler(IOHandler):
                 symbols[colour] = colour_string(symbols[colour], colour='black', bg_colour='bg')
 
         return symbols
+
+class BufferedIOHandler(ConsoleIOHandler):
+    """Console handler that collects messages of a turn and writes them at once from a single writer task\n
+    display_message only appends to a buffer, flush (called by Game at the end of every turn) joins the buffer
+    into one chunk for the writer, which writes whatever chunks are waiting with one write in a thread.
+    Everything is written before the user is asked for input. With silent set nothing is ever written.
+    close has to be awaited before the event loop ends, otherwise the last messages are lost,
+    output defaults to sys.stdout at the time of writing. If a write fails, its chunks are dropped
+    and the error is raised by the next drain or close, later chunks are written again as usual
+    """
+    def __init__(self, output: TextIO | None = None, silent: bool = False) -> None:
+        self.output: TextIO | None = output
+        self.silent: bool = silent
+        self.writes: int = 0
+        self._buffer: list[str] = []
+        self._queue: 'asyncio.Queue[str] | None' = None
+        self._writer: 'asyncio.Task[None] | None' = None
+        self._loop: 'asyncio.AbstractEventLoop | None' = None
+        self._error: Exception | None = None
+
+    async def get_user_input(self, data_type: IODataType, username: str | None, message: str = '') -> str:
+        if self.silent:
+            message = ''
+        else:
+            await self.drain()
+        return await super().get_user_input(data_type, username, message)
+
+    async def display_message(self, message: str, warning: bool = False) -> None:
+        if self.silent:
+            return None
+        self._buffer.append(colour_string(message, 'red') if warning else message)
+
+    async def flush(self) -> None:
+        """Passes messages collected since the last flush to the writer without waiting for the write"""
+        if not self._buffer:
+            return None
+        chunk: str = '\n'.join(self._buffer) + '\n'
+        self._buffer = []
+        self._writer_queue().put_nowait(chunk)
+
+    async def drain(self) -> None:
+        """Flushes and waits until everything is written"""
+        await self.flush()
+        if self._queue is not None:
+            await self._queue.join()
+        if self._error is not None:
+            error: Exception = self._error
+            self._error = None
+            raise error
+
+    async def close(self) -> None:
+        try:
+            await self.drain()
+        finally:
+            if self._writer is not None:
+                self._writer.cancel()
+                import asyncio
+                try:
+                    await self._writer
+                except asyncio.CancelledError:
+                    pass
+            self._queue, self._writer, self._loop = None, None, None
+
+    def _writer_queue(self) -> 'asyncio.Queue[str]':
+        """Returns queue of the writer task, starts the task in the running loop if it has none yet"""
+        import asyncio
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._writer = loop.create_task(self._write_chunks(self._queue))
+        return self._queue
+
+    async def _write_chunks(self, queue: 'asyncio.Queue[str]') -> None:
+        import asyncio
+        while True:
+            chunks: list[str] = [await queue.get()]
+            while not queue.empty():
+                chunks.append(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._write, ''.join(chunks))
+            except Exception as error:   # writer keeps running, so drain does not wait forever
+                self._error = error
+            finally:
+                for _ in chunks:
+                    queue.task_done()
+
+    def _write(self, text: str) -> None:
+        output: TextIO = self.output if self.output is not None else sys.stdout
+        output.write(text)
+        output.flush()
+        self.writes += 1
+
+class NullIOHandler(IOHandler):
+    """Silent handler for games without humans, answers every question with an empty string and shows nothing"""
+    async def get_user_input(self, data_type: IODataType, username: str | None, message: str = '') -> str:
+        return ''
+
+    async def display_message(self, message: str, warning: bool = False) -> None:
+        return None
+
+    def supported_symbols(self) -> dict[str, str]:
+        return {COLOURS[num]['name']: COLOURS[num]['symbol'] for num in COLOURS}
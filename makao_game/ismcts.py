@@ -0,0 +1,190 @@
+"""Bot that chooses cards with information set Monte Carlo tree search (single observer ISMCTS)
+
+Every iteration deals hidden cards (draw pile and hands of opponents) again at random, consistently
+with what the bot has seen, walks down the tree of moves available in that deal choosing them by UCB,
+adds one new move and plays the game on with random bots (rollout) on HeadlessGame.
+Rollout stops after rollout_turns turns, players still in game are then ranked by number of their cards,
+reward is the place scaled from 1 (first) to 0 (last). Tree nodes keep rewards of players who made the move,
+so opponents play to win as well. Passing is searched only when there is a pull or freeze to take
+"""
+import math
+import random
+import time
+
+from makao_game.cards import Card
+from makao_game.cards_actions import CardsActions
+from makao_game.game_state import GameState
+from makao_game.io_handler import IOHandler
+from makao_game.player import BotPlayer
+from makao_game.simulation import HeadlessGame
+
+DEFAULT_ITERATIONS: int = 200
+DEFAULT_EXPLORATION: float = 0.7
+DEFAULT_ROLLOUT_TURNS: int = 40
+
+class _Node:
+    """Move in the tree, seat is the seat of player who made it"""
+    __slots__ = ('seat', 'visits', 'availability', 'reward', 'children')
+
+    def __init__(self, seat: int) -> None:
+        self.seat: int = seat
+        self.visits: int = 0
+        self.availability: int = 1
+        self.reward: float = 0.0
+        self.children: dict[tuple[int, ...], _Node] = {}
+
+
+class ISMCTSBot(BotPlayer):
+    """Bot that searches for the best cards to play, other decisions are the same as BotPlayer's,
+    apart from makao, which he never forgets\n
+    Search of every move stops after iterations rollouts or after time_limit seconds, whichever comes first
+    (at least one of them has to be set). Has to join the game (Game does it for bots from bot_types),
+    e.g. Game(bot_types={'Bot1': ISMCTSBot}, bots=['Bot1', 'Bot2']) or functools.partial(ISMCTSBot, iterations=500)
+    """
+    def __init__(self,
+                 bot_name: str,
+                 io_handler: IOHandler,
+                 rng: random.Random | None = None,
+                 bit_hand: bool = False,
+                 iterations: int | None = DEFAULT_ITERATIONS,
+                 time_limit: float | None = None,
+                 exploration: float = DEFAULT_EXPLORATION,
+                 rollout_turns: int = DEFAULT_ROLLOUT_TURNS) -> None:
+        super().__init__(bot_name, io_handler, rng, bit_hand)
+        if iterations is None and time_limit is None:
+            raise ValueError('ISMCTSBot needs iterations or time_limit')
+        self.iterations: int | None = iterations
+        self.time_limit: float | None = time_limit
+        self.exploration: float = exploration
+        self.rollout_turns: int = rollout_turns
+        self.rollouts: int = 0
+        self.search_time: float = 0.0
+        self._game: HeadlessGame | None = None
+        self._search_rng: random.Random = random.Random()
+        self._search_seeded: bool = False   # seeded when joining the first game
+        self._rollout_games: dict[int, HeadlessGame] = {}
+        self._chosen_ids: tuple[int, ...] | None = None
+
+    @property
+    def rollouts_per_sec(self) -> float:
+        return self.rollouts / self.search_time if self.search_time > 0 else 0.0
+
+    def join_game(self, game: object) -> None:
+        """Searches game from now on, with its own rollout games\n
+        The first game seeds the search generator from the bot's name and the next number of the game's rng,
+        without taking it, so the seed does not depend on the order bots are created in (RecordedGame and
+        ReplayGame create them in different orders). A bot copied by Game.clone joins with a copy of the search
+        generator, so it does not share it with the original one
+        """
+        self._game = game  # type: ignore[assignment]
+        self._rollout_games = {}
+        search_rng: random.Random = random.Random()
+        if not self._search_seeded:
+            search_rng.setstate(self._rng.getstate())
+            search_rng.seed(f'{self.name}:{search_rng.getrandbits(64)}')
+            self._search_seeded = True
+        else:
+            search_rng.setstate(self._search_rng.getstate())
+        self._search_rng = search_rng
+        self._chosen_ids = None
+
+    def decide_play(self) -> bool:
+        """Searches for the best move, returns False if passing is the best one"""
+        self._chosen_ids = self.search()
+        return len(self._chosen_ids) > 0
+
+    def pick_cards(self, cur_card: Card, game_actions: CardsActions) -> list[Card]:
+        """Returns cards found by the search in decide_play"""
+        if not self._chosen_ids:
+            self._chosen_ids = self.search()
+        cards_by_id: dict[int, Card] = {card.id: card for card in self.deck}
+        chosen: list[Card] = [cards_by_id[c_id] for c_id in self._chosen_ids]
+        self._chosen_ids = None
+        return chosen if chosen else super().pick_cards(cur_card, game_actions)
+
+    def decide_makao(self) -> bool:
+        return True
+
+    def search(self) -> tuple[int, ...]:
+        """Returns ids of cards of the most visited move from current state of the game, () means pass"""
+        if self._game is None:
+            raise ValueError('ISMCTSBot has to join a game before it decides')
+        start_time: float = time.perf_counter()
+        state: GameState = self._game.snapshot()
+        seat: int = state.current_seat
+        rollout: HeadlessGame = self._rollout_game(len(state.players))
+        rollout.restore(state)
+        moves: list[list[Card]] = rollout.legal_moves(useless_pass=False)
+        if len(moves) == 1:
+            return tuple([card.id for card in moves[0]])
+        root: _Node = _Node(-1)
+
+        iteration: int = 0
+        while ((self.iterations is None or iteration < self.iterations) and
+               (self.time_limit is None or time.perf_counter() - start_time < self.time_limit)):
+            rollout.restore(state.determinized(seat, self._search_rng))
+            self._iteration(root, rollout)
+            iteration += 1
+
+        self.rollouts += iteration
+        self.search_time += time.perf_counter() - start_time
+        if not root.children:
+            return ()
+        return max(root.children.items(), key=lambda item: item[1].visits)[0]
+
+    def _rollout_game(self, num_players: int) -> HeadlessGame:
+        """Returns game of random bots used for rollouts, created once for every number of players"""
+        game: HeadlessGame | None = self._rollout_games.get(num_players)
+        if game is None:
+            game = HeadlessGame(bots=[f'Seat{seat}' for seat in range(num_players)], rng=self._search_rng,
+                                rules=self._game.rules if self._game is not None else None)
+            game._prepare_headless_game()
+            self._rollout_games[num_players] = game
+        return game
+
+    def _iteration(self, root: _Node, game: HeadlessGame) -> None:
+        """Selects and expands one path of the tree in determinized game, plays rollout and updates rewards"""
+        node: _Node = root
+        path: list[_Node] = []
+        last_turn: int = game.turns + self.rollout_turns
+
+        while not game.is_over and game.turns < last_turn:
+            moves: list[list[Card]] = game.legal_moves(useless_pass=False)
+            if len(moves) == 1:
+                game.play_turn(moves[0])
+                continue
+
+            mover: int = game.current_seat
+            untried: list[tuple[tuple[int, ...], list[Card]]] = []
+            available: list[tuple[_Node, list[Card]]] = []
+            for cards in moves:
+                key: tuple[int, ...] = tuple([card.id for card in cards])
+                child: _Node | None = node.children.get(key)
+                if child is None:
+                    untried.append((key, cards))
+                else:
+                    child.availability += 1
+                    available.append((child, cards))
+
+            if untried:
+                key, cards = untried[self._search_rng.randrange(len(untried))]
+                child = _Node(mover)
+                node.children[key] = child
+                path.append(child)
+                game.play_turn(cards)
+                break
+
+            exploration: float = self.exploration
+            node, cards = max(available, key=lambda item: item[0].reward / item[0].visits +
+                              exploration * math.sqrt(math.log(item[0].availability) / item[0].visits))
+            path.append(node)
+            game.play_turn(cards)
+
+        game.play_out(max_turns=last_turn)
+        placings: list[int] = game.seat_placings()
+        rewards: list[float] = [0.0] * len(placings)
+        for place, placed_seat in enumerate(placings):
+            rewards[placed_seat] = (len(placings) - 1 - place) / (len(placings) - 1)
+        for visited in path:
+            visited.visits += 1
+            visited.reward += rewards[visited.seat]
@@ -0,0 +1,180 @@
+"""Matchmaking lobby of GameServer - queues players and forms tables of them
+
+Table starts as soon as table_size players wait, or when the first of them has waited wait_timeout seconds,
+then the rest of the table is filled with bots. Admission control keeps a burst of joins bounded:
+at most max_waiting players wait (the next ones are refused) and at most max_tables tables are open,
+when they all are, players wait in the queue until a table closes (backpressure instead of new tasks).
+Metrics: time players waited in the queue and latency from forming a table to the start of its game
+"""
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Protocol
+
+from makao_game import dictionaries as c_dict
+
+DEFAULT_WAIT_TIMEOUT: float = 10.0
+DEFAULT_MAX_WAITING: int = 1000
+DEFAULT_MAX_TABLES: int = 1000
+RECENT_SAMPLES: int = 1000
+
+class WaitingSeat(Protocol):
+    name: str
+
+    @property
+    def disconnected(self) -> bool: ...
+
+    async def close(self) -> None: ...
+
+
+class LatencyStats:
+    """Count, mean and maximum of latencies in seconds, percentiles of the last RECENT_SAMPLES of them"""
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self._recent: deque[float] = deque(maxlen=RECENT_SAMPLES)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self._recent.append(seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Returns latency percent of recent samples are not above, 0 if there are none"""
+        if not self._recent:
+            return 0.0
+        ordered: list[float] = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def __str__(self) -> str:
+        return (f'n={self.count} mean={self.mean * 1e3:.1f} ms p50={self.percentile(50) * 1e3:.1f} ms '
+                f'p95={self.percentile(95) * 1e3:.1f} ms max={self.max * 1e3:.1f} ms')
+
+
+@dataclass
+class LobbyStats:
+    joined: int = 0
+    refused: int = 0
+    left: int = 0
+    tables_formed: int = 0
+    bots_added: int = 0
+    queue_wait: LatencyStats = field(default_factory=LatencyStats)
+    table_start: LatencyStats = field(default_factory=LatencyStats)
+
+
+class Lobby:
+    """Queue of players waiting for a table, start_table(seats, num_bots, formed_at) is called for every formed table
+    and table_started/table_closed have to be called by the table when its game starts and ends\n
+    start has to be called in the running event loop, close disconnects players still waiting
+    """
+    def __init__(self,
+                 start_table: Callable[[list[WaitingSeat], int, float], None],
+                 table_size: int = c_dict.MAX_NUM_OF_PLAYERS,
+                 wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+                 max_waiting: int = DEFAULT_MAX_WAITING,
+                 max_tables: int = DEFAULT_MAX_TABLES) -> None:
+        if not 2 <= table_size <= c_dict.MAX_NUM_OF_PLAYERS:
+            raise ValueError(f'Table size must be within 2 and {c_dict.MAX_NUM_OF_PLAYERS}')
+        if max_waiting < 1 or max_tables < 1:
+            raise ValueError('max_waiting and max_tables must be at least 1')
+        self.table_size: int = table_size
+        self.wait_timeout: float = wait_timeout
+        self.max_waiting: int = max_waiting
+        self.max_tables: int = max_tables
+        self.open_tables: int = 0
+        self.stats: LobbyStats = LobbyStats()
+        self._start_table: Callable[[list[WaitingSeat], int, float], None] = start_table
+        self._waiting: deque[tuple[WaitingSeat, float]] = deque()
+        self._left: list[WaitingSeat] = []
+        self._changed: asyncio.Event | None = None
+        self._scheduler: asyncio.Task[None] | None = None
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiting)
+
+    def start(self) -> None:
+        self._changed = asyncio.Event()
+        self._scheduler = asyncio.get_running_loop().create_task(self._schedule())
+
+    async def close(self) -> None:
+        if self._scheduler is not None:
+            self._scheduler.cancel()
+            try:
+                await self._scheduler
+            except asyncio.CancelledError:
+                pass
+        while self._waiting:
+            await self._waiting.popleft()[0].close()
+
+    def join(self, seat: WaitingSeat) -> bool:
+        """Puts seat in the queue, returns False if the queue is full"""
+        if len(self._waiting) >= self.max_waiting:
+            self._drop_disconnected()
+            self._notify()
+        if len(self._waiting) >= self.max_waiting:
+            self.stats.refused += 1
+            return False
+        self._waiting.append((seat, time.perf_counter()))
+        self.stats.joined += 1
+        self._notify()
+        return True
+
+    def table_started(self, formed_at: float) -> None:
+        self.stats.table_start.add(time.perf_counter() - formed_at)
+
+    def table_closed(self) -> None:
+        self.open_tables -= 1
+        self._notify()
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+
+    async def _schedule(self) -> None:
+        """Forms tables whenever there is a full one or someone waited too long and a table can be opened"""
+        assert self._changed is not None
+        while True:
+            self._changed.clear()
+            self._drop_disconnected()
+            while self._left:
+                await self._left.pop().close()
+            timeout: float | None = None
+            while self._waiting and self.open_tables < self.max_tables:
+                waited: float = time.perf_counter() - self._waiting[0][1]
+                if len(self._waiting) < self.table_size and waited < self.wait_timeout:
+                    timeout = self.wait_timeout - waited
+                    break
+                self._form_table()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _form_table(self) -> None:
+        now: float = time.perf_counter()
+        seats: list[WaitingSeat] = []
+        while self._waiting and len(seats) < self.table_size:
+            seat, joined_at = self._waiting.popleft()
+            self.stats.queue_wait.add(now - joined_at)
+            seats.append(seat)
+        num_bots: int = self.table_size - len(seats)
+        self.open_tables += 1
+        self.stats.tables_formed += 1
+        self.stats.bots_added += num_bots
+        self._start_table(seats, num_bots, now)
+
+    def _drop_disconnected(self) -> None:
+        """Moves players who left while waiting out of the queue, the scheduler closes their connections"""
+        left: list[WaitingSeat] = [seat for seat, _ in self._waiting if seat.disconnected]
+        if left:
+            self._waiting = deque(entry for entry in self._waiting if not entry[0].disconnected)
+            self.stats.left += len(left)
+            self._left.extend(left)
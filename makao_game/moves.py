@@ -0,0 +1,69 @@
+"""Legal moves - every play allowed by the rules from a hand, top card and CardsActions
+
+Move is a list of cards in the order they are placed, the last one becomes the top card.
+Player plays one card or 3 or 4 cards of the same rank (not Kings, not all of them are functional,
+unless rules of the game allow it - CompiledRules.set_ranks),
+the first card has to be playable on the top card, the others are only matched by rank.
+Cards of the hand are split into per-rank buckets once, so finding moves is linear in hand size
+(plus the number of moves found)
+"""
+from itertools import combinations
+from typing import Iterable
+
+from makao_game import card_codes
+from makao_game.cards import Card
+from makao_game.cards_actions import CardsActions
+
+SET_SIZES: tuple[int, ...] = (3, 4)
+
+def rank_buckets(hand: Iterable[Card]) -> list[list[Card]]:
+    """Returns cards of hand grouped by rank, buckets[rank] keeps cards in hand order"""
+    buckets: list[list[Card]] = [[] for _ in range(card_codes.NUM_RANKS)]
+    for card in hand:
+        buckets[card.rank].append(card)
+    return buckets
+
+def playable_cards(hand: Iterable[Card], top_card: Card, game_actions: CardsActions) -> list[Card]:
+    """Returns cards of hand that can be played on top card, in hand order"""
+    playable: bytes = game_actions.rules.playable_rows[card_codes.action_state(game_actions) * card_codes.NUM_CARDS +
+                                                       top_card.id]
+    return [card for card in hand if playable[card.id]]
+
+def set_moves(first: Card, bucket: list[Card]) -> list[list[Card]]:
+    """Returns sets of 3 and 4 cards from bucket of the rank of first card that start with it\n
+    Cards in the middle keep hand order, every card can end the set, because it becomes the top card.
+    Does not check if the rank can be played in sets (CompiledRules.set_ranks)
+    """
+    others: list[Card] = [card for card in bucket if card is not first]
+    moves: list[list[Card]] = []
+    for size in SET_SIZES:
+        for chosen in combinations(others, size - 1):
+            for top in chosen:
+                moves.append([first, *[card for card in chosen if card is not top], top])
+    return moves
+
+def legal_moves(hand: Iterable[Card], top_card: Card, game_actions: CardsActions) -> list[list[Card]]:
+    """Returns every move that can be played from hand, ordered by the first card in hand order,
+    a single card before sets starting with it. Empty list if nothing can be played
+    """
+    hand = list(hand)
+    buckets: list[list[Card]] = rank_buckets(hand)
+    set_ranks: bytes = game_actions.rules.set_ranks
+    moves: list[list[Card]] = []
+    for card in playable_cards(hand, top_card, game_actions):
+        moves.append([card])
+        if len(buckets[card.rank]) >= SET_SIZES[0] and set_ranks[card.rank]:
+            moves.extend(set_moves(card, buckets[card.rank]))
+    return moves
+
+def is_legal_move(cards: list[Card], top_card: Card, game_actions: CardsActions) -> bool:
+    """Returns True if cards (taken from the hand of the player) can be played in that order"""
+    if len(cards) != 1 and len(cards) not in SET_SIZES:
+        return False
+    first: Card = cards[0]
+    if len(cards) > 1:
+        if not game_actions.rules.set_ranks[first.rank] or len({id(card) for card in cards}) != len(cards):
+            return False
+        if any(card.rank != first.rank for card in cards):
+            return False
+    return first.can_be_played(top_card, game_actions)
@@ -0,0 +1,76 @@
+import random
+from typing import Iterable, Iterator, Sequence
+
+from makao_game.cards import Card
+
+class Pile:
+    """Stack of cards kept in a list from the bottom to the top, so taking and placing on top is O(1)\n
+    Indexing goes from the top: pile[0] is the top card, pile[-1] is the bottom one
+    """
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        self._cards: list[Card] = list(cards)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __bool__(self) -> bool:
+        return bool(self._cards)
+
+    def __getitem__(self, index: int) -> Card:
+        return self._cards[-1 - index]
+
+    def __iter__(self) -> Iterator[Card]:
+        """Iterates from the top to the bottom"""
+        return reversed(self._cards)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({list(self)})'
+
+    @property
+    def top(self) -> Card:
+        return self._cards[-1]
+
+    def remove(self, card: Card) -> None:
+        self._cards.remove(card)
+
+    def shuffle(self, rng: random.Random) -> None:
+        rng.shuffle(self._cards)
+
+    def snapshot(self) -> bytes:
+        """Returns ids of cards from the bottom to the top"""
+        return bytes([card.id for card in self._cards])
+
+    def restore(self, card_ids: bytes, cards_by_id: Sequence[Card]) -> None:
+        """Replaces cards with ones from snapshot, cards_by_id maps ids to Card objects of the game"""
+        self._cards[:] = [cards_by_id[c_id] for c_id in card_ids]
+
+
+class DrawPile(Pile):
+    """Pile that players pull cards from"""
+    def draw(self) -> Card:
+        """Takes top card, raises IndexError if pile is empty"""
+        return self._cards.pop()
+
+    def refill(self, cards: list[Card], rng: random.Random) -> None:
+        """Puts cards into pile and shuffles it once"""
+        self._cards.extend(cards)
+        rng.shuffle(self._cards)
+
+
+class DiscardPile(Pile):
+    """Pile that players play cards on"""
+    def place(self, card: Card) -> None:
+        """Puts card on top"""
+        self._cards.append(card)
+
+    def recent(self, num_of_cards: int) -> list[Card]:
+        """Returns num_of_cards from the top, the top one first"""
+        if num_of_cards <= 0:
+            return []
+        return self._cards[:-num_of_cards - 1:-1]
+
+    def take_all_but_top(self) -> list[Card]:
+        """Removes every card apart from the top one and returns them"""
+        taken: list[Card] = self._cards[:-1]
+        del self._cards[:-1]
+        return taken
@@ -1,16 +1,25 @@
 import random
+from dataclasses import dataclass, fields
 # from time import sleep
 
 from makao_game.cards import Card
+from makao_game import card_codes
+from makao_game.hand import Hand, BitHand
+from makao_game.moves import SET_SIZES, is_legal_move
 from makao_game.dictionaries import COLOURS, DEMAND_OPTIONS_NAMES
 from makao_game.cards_actions import CardsActions
 from makao_game.io_handler import IOHandler, IODataType
 
 class Player:
-    def __init__(self, player_name: str, io_handler: IOHandler) -> None:
-        """Creates object that represents player in a game"""
+    __slots__ = ('name', 'deck', 'frozen_rows', 'valid_cards', 'io_handler', 'turn', 'played_card')
+
+    def __init__(self, player_name: str, io_handler: IOHandler, bit_hand: bool = False) -> None:
+        """Creates object that represents player in a game\n
+        deck is a Hand, which counts cards of every rank and suit,
+        if bit_hand set to True, deck is a BitHand which also answers playable cards queries with bitmasks
+        """
         self.name: str = player_name
-        self.deck: list[Card] = []
+        self.deck: Hand = BitHand() if bit_hand else Hand()
         self.frozen_rows: int = 0
         self.valid_cards: bool = False
         self.io_handler: IOHandler = io_handler
@@ -27,7 +36,8 @@ class Player:
         )
 
         while response.lower() not in ['pass', 'play']:
-            await self.io_handler.display_message(
+            await self.io_handler.display_private_message(
+                username=self.name,
                 message='You can only write: pass, play',
                 warning=True
             )
@@ -40,9 +50,14 @@ class Player:
 
     def have_valid_cards(self, cur_card:Card, game_actions: CardsActions) -> None:
         """Checks if player has valid cards and changes his attribute self.valid_cards"""
+        state: int = card_codes.action_state(game_actions)
+        if isinstance(self.deck, BitHand):
+            self.valid_cards = self.deck.has_playable(cur_card.id, state, game_actions.rules.legal_masks)
+            return None
 
+        playable: bytes = game_actions.rules.playable_rows[state * card_codes.NUM_CARDS + cur_card.id]
         for card in self.deck:
-            if card.can_be_played(cur_card, game_actions):
+            if playable[card.id]:
                 self.valid_cards = True
                 return None
         self.valid_cards = False
@@ -56,7 +71,8 @@ class Player:
         ]
         names_of_colours: list[str] = [COLOURS[col]['name'].capitalize() for col in COLOURS]
 
-        await self.io_handler.display_message(
+        await self.io_handler.display_private_message(
+            username=self.name,
             message=f'Available colours names: {available_colours}'
         )
         demanded_color: str = await self.io_handler.get_user_input(
@@ -66,7 +82,8 @@ class Player:
         )
 
         while demanded_color.capitalize() not in names_of_colours:
-            await self.io_handler.display_message(
+            await self.io_handler.display_private_message(
+                username=self.name,
                 message=f'Wrong colour!\nColours you can use are: {available_colours}\nDo not use symbols!',
                 warning=True
             )
@@ -89,7 +106,8 @@ class Player:
                     message='What number do you demand?: '
                 )
                 while 4 > int(demanded_number) or int(demanded_number) > 10:
-                    await self.io_handler.display_message(
+                    await self.io_handler.display_private_message(
+                        username=self.name,
                         message='Wrong number!\nNumbers you can demand are between 5 and 10',
                         warning=True
                     )
@@ -101,7 +119,8 @@ class Player:
                 return demanded_number
             
             except ValueError:
-                await self.io_handler.display_message(
+                await self.io_handler.display_private_message(
+                    username=self.name,
                     message='Typed char must be an int!',
                     warning=True
                 )
@@ -134,7 +153,8 @@ class Player:
                 if ',' in p_choice:
                     p_nums = p_choice.split(',')
                     while len(p_nums) not in [1, 3, 4]:
-                        await self.io_handler.display_message(
+                        await self.io_handler.display_private_message(
+                            username=self.name,
                             message='You can only play 1 or 3 cards at once!',
                             warning=True
                         )
@@ -152,7 +172,8 @@ class Player:
                     try:
                         card_num: int = int(num)
                         if card_num < 1 or card_num > len(self.deck):
-                            await self.io_handler.display_message(
+                            await self.io_handler.display_private_message(
+                                username=self.name,
                                 message='Given number must represent a card from deck!',
                                 warning=True
                             )
@@ -160,7 +181,8 @@ class Player:
                         else:
                             chosen_nums.append(card_num - 1)
                     except ValueError:
-                        await self.io_handler.display_message(
+                        await self.io_handler.display_private_message(
+                            username=self.name,
                             message='You have to get_user_input a number!',
                             warning=True)
                         break
@@ -173,22 +195,13 @@ class Player:
         while not good_cards:
             chosen_cards = [self.deck[card] for card in await _cards_from_deck()]
 
-            if chosen_cards[0] == 'King' and len(chosen_cards) > 1:
-                await self.io_handler.display_message(
+            if len(chosen_cards) > 1 and not game_actions.rules.set_ranks[chosen_cards[0].rank]:
+                await self.io_handler.display_private_message(
+                    username=self.name,
                     message="You can't play few Kings because not all of them are functional",
                     warning=True
                 )
-                good_cards = False
-
-            elif chosen_cards[0].can_be_played(cur_card, game_actions):
-                for card in chosen_cards:
-                    if card.name != chosen_cards[0].name:
-                        good_cards = False
-                        break
-                    else:
-                        good_cards = True
-            else:
-                good_cards = False
+            good_cards = is_legal_move(chosen_cards, cur_card, game_actions)
         return chosen_cards
 
     async def say_makao(self) -> bool:
@@ -202,14 +215,16 @@ class Player:
         makao_time = makao_time.lower()
 
         if len(self.deck) == 1 and makao_time != 'makao':
-            await self.io_handler.display_message(
+            await self.io_handler.display_private_message(
+                username=self.name,
                 message='FOOLLL!!!\nYou did not said makao\nYou pull 5 cards',
                 warning=True
             )
             return False
         
         elif len(self.deck) == 0 and makao_time != 'after makao':
-            await self.io_handler.display_message(
+            await self.io_handler.display_private_message(
+                username=self.name,
                 message='FOOLLL!!!\nYou did not said after makao\nYou pull 5 cards',
                 warning=True
             )
@@ -218,90 +233,157 @@ class Player:
             return True
 
 
+@dataclass(frozen=True)
+class BotPolicy:
+    """Tunable heuristics of BotPlayer, the defaults are how he always played\n
+    play_weight, pass_weight - weights of playing and passing when he has valid cards,
+    makao_weight, forget_weight - weights of saying makao/after makao and forgetting it,
+    play_sets - plays all cards of a rank when he has 3 or 4 of them and one is playable,
+    save_queens - plays a Queen only when he has nothing else to play
+    """
+    play_weight: float = 19
+    pass_weight: float = 1
+    makao_weight: float = 20
+    forget_weight: float = 1
+    play_sets: bool = True
+    save_queens: bool = True
+
+    def __post_init__(self) -> None:
+        if min(self.play_weight, self.pass_weight, self.makao_weight, self.forget_weight) < 0:
+            raise ValueError('Weights of BotPolicy cannot be negative')
+        if self.play_weight + self.pass_weight <= 0 or self.makao_weight + self.forget_weight <= 0:
+            raise ValueError('Weights of BotPolicy cannot be all zero')
+
+    def __str__(self) -> str:
+        """Fields that differ from the defaults, 'default' if none"""
+        changed: list[str] = [f'{field.name}={getattr(self, field.name)}' for field in fields(self)
+                              if getattr(self, field.name) != field.default]
+        return ', '.join(changed) if changed else 'default'
+
+
+DEFAULT_POLICY: BotPolicy = BotPolicy()
+
+
 class BotPlayer(Player):
-    """Creates object which inherits from Player class, makes all choices automatic and random"""
-    def __init__(self, bot_name: str, io_handler: IOHandler) -> None:
-        super().__init__(bot_name, io_handler)
+    """Creates object which inherits from Player class, makes all choices automatic and random\n
+    policy sets his heuristics (see BotPolicy), e.g. Game(bot_types={'Bot1': partial(BotPlayer, policy=...)})
+    """
+    __slots__ = ('_available_deck', '_rng', 'policy')
+
+    def __init__(self,
+                 bot_name: str,
+                 io_handler: IOHandler,
+                 rng: random.Random | None = None,
+                 bit_hand: bool = False,
+                 policy: BotPolicy | None = None) -> None:
+        super().__init__(bot_name, io_handler, bit_hand)
         self._available_deck: list[Card] = []
+        self._rng: random.Random = rng if rng is not None else random.Random()
+        self.policy: BotPolicy = policy if policy is not None else DEFAULT_POLICY
+
+    def join_game(self, game: object) -> None:
+        """Called by the game that created the bot, does nothing\n
+        Bots that look at the whole table (e.g. ISMCTSBot) keep the game
+        """
+        return None
 
     async def play_or_pass(self) -> str:
-        """Randomly choose whether bot plays or passes with 95% that he plays"""
-        response: list[str] = ['play', 'pass']
-        return random.choices(response, weights=[19, 1], k=1)[0]
+        """Randomly choose whether bot plays or passes, by default with 95% that he plays"""
+        return 'play' if self.decide_play() else 'pass'
+
+    def decide_play(self) -> bool:
+        """Returns True if bot decides to play in this turn, by default 95% that he plays"""
+        # same draw as random.choices(['play', 'pass'], weights=[19, 1]) without building cumulative weights
+        policy: BotPolicy = self.policy
+        return self._rng.random() * (policy.play_weight + policy.pass_weight) < policy.play_weight
 
     def _create_available_deck(self, cur_card:Card, game_actions: CardsActions) -> None:
         """Creates a deck of cards that can be played by bot in that turn"""
-        self._available_deck.clear()
-        for card in self.deck:
-            if card.can_be_played(cur_card,  game_actions):
-                self._available_deck.append(card)
+        state: int = card_codes.action_state(game_actions)
+        if isinstance(self.deck, BitHand):
+            self._available_deck = self.deck.playable_cards(cur_card.id, state, game_actions.rules.legal_masks)
+            return None
+
+        playable: bytes = game_actions.rules.playable_rows[state * card_codes.NUM_CARDS + cur_card.id]
+        self._available_deck = [card for card in self.deck if playable[card.id]]
+        return None
 
     async def _choose_colour_demands(self) -> str:
         """If bot played demanding card, returns what colour cards he has most in his deck"""
-        cards_colours: list[str] = [card.colour for card in self.deck]
-        most_col_name: str = COLOURS[3]['name']
-        most_col_num: int = 0
-        for colour in cards_colours:
-            if cards_colours.count(colour) > most_col_num:
-                most_col_num = cards_colours.count(colour)
-                most_col_name = colour
-        return most_col_name.capitalize()
+        return self.pick_colour_demand()
+
+    def pick_colour_demand(self) -> str:
+        """Returns what colour cards bot has most in his deck (of tied ones the first in his deck), Hearts if none"""
+        suit: int | None = self.deck.most_common_suit()
+        if suit is None:
+            return COLOURS[3]['name'].capitalize()
+        return COLOURS[suit + 1]['name'].capitalize()
 
     async def _choose_number_demands(self) -> str:
         """If bot played demanding card, returns what non-functional number cards he has most in his deck"""
-
-        cards_nums: list[str] = []
-        for card in self.deck:
-            try:
-                if 11 > int(card.name) > 4:
-                    cards_nums.append(card.name)
-            except ValueError:
-                pass
-        most_num_name: str = '5'
-        most_num_num: int = 0
-        for num in cards_nums:
-            if cards_nums.count(num) > most_num_num:
-                most_num_num = cards_nums.count(num)
-                most_num_name = num
-        return most_num_name
+        return self.pick_number_demand()
+
+    def pick_number_demand(self) -> str:
+        """Returns what non-functional number cards bot has most in his deck (of tied ones the first in his deck),
+        5 if none
+        """
+        rank: int | None = self.deck.most_common_rank(card_codes.NUMBER_DEMAND_RANKS)
+        if rank is None:
+            return '5'
+        return card_codes.NAMES_BY_ID[rank * card_codes.NUM_SUITS]
+
+    def pick_demand(self, demand_type: str) -> str:
+        """Synchronous counterpart of handle_demanding"""
+        if demand_type == DEMAND_OPTIONS_NAMES['JACK']:
+            return self.pick_number_demand()
+        elif demand_type == DEMAND_OPTIONS_NAMES['ACE']:
+            return self.pick_colour_demand()
+        else:
+            raise ValueError('wrong demand type, passed is nor Jack or Ace')
 
     async def choose_card(self, cur_card: Card, game_actions: CardsActions) -> list[Card]:
         """Returns list of cards that bot randomly chose based in demands and current card in game"""
-        self._create_available_deck(cur_card, game_actions)
-        chosen_cards: list[Card] = []
-        # playing 3 cards
-        cards_names: list[str] = [card.name for card in self.deck]
-        for card in self._available_deck:
-            if cards_names.count(card.name) > 2 and card.name != 'King':
-                chosen_cards.append(card)
-                first_card: Card = chosen_cards[0]
-                other_cards: list[Card] = [card for card in self.deck if
-                                           card.name == first_card.name and card != first_card]
-                chosen_cards.extend(other_cards)
+        chosen_cards: list[Card] = self.pick_cards(cur_card, game_actions)
+        if len(chosen_cards) > 1:
+            await self.io_handler.display_message(
+                message='Bot played multiple cards:'
+            )
+            for _card in chosen_cards:
                 await self.io_handler.display_message(
-                    message='Bot played multiple cards:'
+                    message=self.io_handler.card_names()[_card.id]
                 )
-                for _card in chosen_cards:
-                    await self.io_handler.display_message(
-                        message=str(_card)
-                    )
-                return chosen_cards
+        else:
+            await self.io_handler.display_message(
+                message=f'Playing {self.io_handler.card_names()[chosen_cards[0].id]}'
+            )
+        # sleep(3)
+        return chosen_cards
+
+    def pick_cards(self, cur_card: Card, game_actions: CardsActions) -> list[Card]:
+        """Synchronous part of choose_card, returns chosen cards without displaying them"""
+        self._create_available_deck(cur_card, game_actions)
+        chosen_cards: list[Card] = []
+        # playing 3 or 4 cards of the rank of the first available card he has enough of
+        policy: BotPolicy = self.policy
+        if policy.play_sets:
+            rank_counts: list[int] = self.deck.rank_counts
+            set_ranks: bytes = game_actions.rules.set_ranks
+            for card in self._available_deck:
+                if rank_counts[card.rank] >= SET_SIZES[0] and set_ranks[card.rank]:
+                    chosen_cards = [card, *[other for other in self.deck if other.rank == card.rank and other is not card]]
+                    return chosen_cards
         # if not able to play 3 cards
-        no_queen_deck: list[Card] = [card for card in self._available_deck if card.name != 'Queen']
+        no_queen_deck: list[Card] = ([card for card in self._available_deck if card.name != 'Queen']
+                                     if policy.save_queens else [])
         if len(no_queen_deck) > 0:
-            chosen_cards = [random.choice(no_queen_deck)]
+            chosen_cards = [self._rng.choice(no_queen_deck)]
         else:
-            chosen_cards = [random.choice(self._available_deck)]
-        await self.io_handler.display_message(
-            message=f'Playing {chosen_cards[0]}'
-        )
-        # sleep(3)
+            chosen_cards = [self._rng.choice(self._available_deck)]
         return chosen_cards
 
     async def say_makao(self) -> bool:
-        """If player needs to say makao, it returns it with 95% chance"""
-        options: list[bool] = [True, False]
-        saying = random.choices(options, weights=[20, 1], k=1)[0]
+        """If player needs to say makao, it returns it with 95% chance (by default)"""
+        saying: bool = self.decide_makao()
         # sleep(3)
         if len(self.deck) == 1:
             if saying:
@@ -325,3 +407,12 @@ class BotPlayer(Player):
             return saying
         else:
             return True
+
+    def decide_makao(self) -> bool:
+        """Returns False only if bot needed to say makao/after makao and forgot, by default 95% that he says it"""
+        # same draw as random.choices([True, False], weights=[20, 1])
+        policy: BotPolicy = self.policy
+        saying: bool = self._rng.random() * (policy.makao_weight + policy.forget_weight) < policy.makao_weight
+        if len(self.deck) > 1:
+            return True
+        return saying
@@ -0,0 +1,402 @@
+"""Skill ratings of players updated incrementally from finishing orders of games, kept in a memory-mapped table
+
+Every player has a Gaussian skill estimate (mu, sigma) like in TrueSkill. A game of n players is rated with
+the Bradley-Terry partial pairing update of Weng and Lin (A Bayesian Approximation Method for Online Ranking,
+2011): every player is compared only with the players placed right above and right below them, so a game
+costs O(n) closed-form updates, no iterations and no earlier games. Before every game sigma of its players
+grows by tau, so ratings of players follow changes of their skill. conservative = mu - 3 * sigma
+is what leaderboards are sorted by, new players start at 0.
+
+File layout (all little endian):
+- HEADER_SIZE bytes header: magic, version, record size, capacity, number of players, number of rated games,
+  parameters of the table (mu and sigma of new players, beta, tau),
+- capacity records of RECORD_SIZE bytes: hash of name (0 - empty slot), name in UTF-8 padded with zeros,
+  mu, sigma, games, wins.
+Records are an open addressing hash table with linear probing, capacity is a power of 2, so a player
+is found in O(1) straight in the mmap, without loading the table. When the table gets full over MAX_LOAD,
+it is rebuilt with twice the capacity, which is amortized O(1) per player.
+
+Names of game data files that were already rated are appended to a text file next to the table
+(RATED_FILES_SUFFIX), names of files that can never be rated (unfinished games, games the table rejects)
+to another one (SKIPPED_FILES_SUFFIX), so backfill reads only new files
+"""
+import hashlib
+import heapq
+import math
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from makao_game import dictionaries as c_dict
+
+RATINGS_FILE_NAME: str = 'ratings.mrat'
+RATED_FILES_SUFFIX: str = '.files'
+SKIPPED_FILES_SUFFIX: str = '.skipped'
+MAGIC: bytes = b'MAKAORAT'
+VERSION: int = 1
+
+DEFAULT_MU: float = 25.0
+DEFAULT_SIGMA: float = DEFAULT_MU / 3
+DEFAULT_BETA: float = DEFAULT_SIGMA / 2
+DEFAULT_TAU: float = DEFAULT_SIGMA / 100
+KAPPA: float = 1e-4   # the lowest factor by which sigma can shrink in one game
+DEFAULT_CAPACITY: int = 1024
+MAX_LOAD: float = 0.7
+
+HEADER_SIZE: int = 128
+NAME_SIZE: int = c_dict.MAX_NAME_BYTES
+RECORD_SIZE: int = 64
+_HEADER: struct.Struct = struct.Struct('<8sIIQQQdddd')
+_COUNTS: struct.Struct = struct.Struct('<QQ')   # number of players and games, at _COUNTS_OFFSET of header
+_COUNTS_OFFSET: int = 24
+_KEY: struct.Struct = struct.Struct('<Q')
+_RECORD: struct.Struct = struct.Struct(f'<Q{NAME_SIZE}sddII')
+_VALUES: struct.Struct = struct.Struct('<ddII')   # mu, sigma, games, wins, at _VALUES_OFFSET of record
+_VALUES_OFFSET: int = 8 + NAME_SIZE
+
+Row = dict[str, str | int | bool | None]
+Skill = tuple[float, float]
+
+def rate_placings(skills: list[Skill], beta: float = DEFAULT_BETA) -> list[Skill]:
+    """Returns new (mu, sigma) of players of one game, skills are (mu, sigma) of players from first to last place\n
+    Every player is compared with their neighbours in the finishing order (Bradley-Terry partial pairing)
+    """
+    two_beta_squared: float = 2 * beta * beta
+    rated: list[Skill] = []
+    for place, (mu, sigma) in enumerate(skills):
+        variance: float = sigma * sigma
+        mu_change: float = 0.0
+        variance_factor: float = 0.0
+        for other in (place - 1, place + 1):
+            if not 0 <= other < len(skills):
+                continue
+            other_mu, other_sigma = skills[other]
+            c: float = math.sqrt(variance + other_sigma * other_sigma + two_beta_squared)
+            win_chance: float = 1 / (1 + math.exp((other_mu - mu) / c))
+            mu_change += variance / c * ((other > place) - win_chance)
+            variance_factor += sigma / c * variance / (c * c) * win_chance * (1 - win_chance)
+        rated.append((mu + mu_change, sigma * math.sqrt(max(1 - variance_factor, KAPPA))))
+    return rated
+
+def _name_key(encoded: bytes) -> int:
+    """Returns hash of encoded name that is never 0, so 0 can mark empty slots"""
+    return _KEY.unpack(hashlib.blake2b(encoded, digest_size=8).digest())[0] | 1
+
+def _encode_name(name: str) -> bytes:
+    encoded: bytes = name.encode('UTF-8')
+    if not encoded or len(encoded) > NAME_SIZE or b'\0' in encoded:
+        raise ValueError(f'Name {name!r} must have 1 to {NAME_SIZE} bytes in UTF-8 and no null characters')
+    return encoded
+
+
+@dataclass(frozen=True)
+class Rating:
+    """Rating of one player, conservative is mu - 3 * sigma - skill the player has almost surely"""
+    name: str
+    mu: float
+    sigma: float
+    games: int
+    wins: int
+
+    @property
+    def conservative(self) -> float:
+        return self.mu - 3 * self.sigma
+
+    def __str__(self) -> str:
+        return (f'{self.name:<{NAME_SIZE}} {self.conservative:>8.2f} {self.mu:>8.2f} {self.sigma:>7.2f} '
+                f'{self.games:>8} {self.wins:>8}')
+
+
+class RatingTable:
+    """Ratings of players in a memory-mapped file, see module docstring\n
+    mu, sigma - rating of new players, beta - spread of performance in a single game, tau - growth of sigma
+    before every game, capacity - initial number of slots. They are used only when the file is created,
+    an existing table keeps its own. Changes are in the file right away (flush writes them to disk),
+    a table opened with read_only can only be queried
+    """
+    def __init__(self,
+                 path: str,
+                 mu: float = DEFAULT_MU,
+                 sigma: float = DEFAULT_SIGMA,
+                 beta: float = DEFAULT_BETA,
+                 tau: float = DEFAULT_TAU,
+                 capacity: int = DEFAULT_CAPACITY,
+                 read_only: bool = False) -> None:
+        self.path: str = path
+        self.read_only: bool = read_only
+        if not os.path.exists(path):
+            if read_only:
+                raise FileNotFoundError(f'Rating table {path} does not exist')
+            if sigma <= 0 or beta <= 0 or tau < 0:
+                raise ValueError('sigma and beta must be positive and tau not negative')
+            self._create(path, 1 << max(capacity - 1, 1).bit_length(), 0, 0, (mu, sigma, beta, tau))
+        self._open()
+
+    @staticmethod
+    def _create(path: str, capacity: int, count: int, games: int, parameters: tuple[float, ...]) -> None:
+        """Writes empty table of capacity slots"""
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, RECORD_SIZE, capacity, count, games, *parameters)
+                       .ljust(HEADER_SIZE, b'\0'))
+            file.truncate(HEADER_SIZE + capacity * RECORD_SIZE)
+
+    def _open(self) -> None:
+        with open(self.path, 'rb' if self.read_only else 'r+b') as file:
+            self._buffer: mmap.mmap = mmap.mmap(file.fileno(), 0,
+                                                access=mmap.ACCESS_READ if self.read_only else mmap.ACCESS_WRITE)
+        magic, version, record_size, capacity, count, games, *parameters = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            self._buffer.close()
+            raise ValueError(f'{self.path} is not a makao rating table')
+        if version != VERSION or record_size != RECORD_SIZE:
+            self._buffer.close()
+            raise ValueError(f'Unsupported rating table version {version}')
+        self.capacity: int = capacity
+        self._count: int = count
+        self._games: int = games
+        self.mu, self.sigma, self.beta, self.tau = parameters
+
+    def __enter__(self) -> 'RatingTable':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def games(self) -> int:
+        """Number of rated games"""
+        return self._games
+
+    def _find(self, encoded: bytes, key: int) -> tuple[int, bool]:
+        """Returns offset of record of name and if it is there, or offset of empty slot where it belongs"""
+        mask: int = self.capacity - 1
+        slot: int = key & mask
+        while True:
+            offset: int = HEADER_SIZE + slot * RECORD_SIZE
+            slot_key: int = _KEY.unpack_from(self._buffer, offset)[0]
+            if slot_key == 0:
+                return offset, False
+            if slot_key == key and self._buffer[offset + 8:offset + 8 + NAME_SIZE].rstrip(b'\0') == encoded:
+                return offset, True
+            slot = (slot + 1) & mask
+
+    def _rating(self, offset: int) -> Rating:
+        _, name, mu, sigma, games, wins = _RECORD.unpack_from(self._buffer, offset)
+        return Rating(name.rstrip(b'\0').decode('UTF-8'), mu, sigma, games, wins)
+
+    def get(self, name: str) -> Rating | None:
+        """Returns rating of player, None if they have not played a rated game"""
+        encoded: bytes = _encode_name(name)
+        offset, found = self._find(encoded, _name_key(encoded))
+        return self._rating(offset) if found else None
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def __iter__(self) -> Iterator[Rating]:
+        """Yields ratings of all players in order of slots"""
+        for offset in range(HEADER_SIZE, HEADER_SIZE + self.capacity * RECORD_SIZE, RECORD_SIZE):
+            if _KEY.unpack_from(self._buffer, offset)[0]:
+                yield self._rating(offset)
+
+    def top(self, num_players: int = 10, min_games: int = 0) -> list[Rating]:
+        """Returns num_players best ratings by conservative rating of players with at least min_games games"""
+        return heapq.nlargest(num_players, (rating for rating in self if rating.games >= min_games),
+                              key=lambda rating: rating.conservative)
+
+    def update(self, placings: list[str]) -> None:
+        """Rates one game, placings are names of its players from first to last place\n
+        Players not in the table are added with the rating of new players
+        """
+        if self.read_only:
+            raise ValueError('Rating table is opened read only')
+        if len(placings) < 2 or len(set(placings)) != len(placings):
+            raise ValueError('Game needs at least 2 players with different names')
+        encoded_names: list[bytes] = [_encode_name(name) for name in placings]
+        if self._count + len(placings) > self.capacity * MAX_LOAD:
+            self._grow(self._count + len(placings))
+
+        offsets: list[int] = []
+        skills: list[Skill] = []
+        tau_squared: float = self.tau * self.tau
+        for encoded in encoded_names:
+            key: int = _name_key(encoded)
+            offset, found = self._find(encoded, key)
+            if not found:
+                _RECORD.pack_into(self._buffer, offset, key, encoded, self.mu, self.sigma, 0, 0)
+                self._count += 1
+            mu, sigma, _, _ = _VALUES.unpack_from(self._buffer, offset + _VALUES_OFFSET)
+            offsets.append(offset)
+            skills.append((mu, math.sqrt(sigma * sigma + tau_squared)))
+
+        for place, (offset, (mu, sigma)) in enumerate(zip(offsets, rate_placings(skills, self.beta))):
+            _, _, games, wins = _VALUES.unpack_from(self._buffer, offset + _VALUES_OFFSET)
+            _VALUES.pack_into(self._buffer, offset + _VALUES_OFFSET, mu, sigma, games + 1, wins + (place == 0))
+        self._games += 1
+        _COUNTS.pack_into(self._buffer, _COUNTS_OFFSET, self._count, self._games)
+
+    def _grow(self, num_players: int) -> None:
+        """Rebuilds the table with capacity doubled until num_players fit, in a new file that replaces the old one"""
+        capacity: int = self.capacity
+        while num_players > capacity * MAX_LOAD:
+            capacity *= 2
+        temp_path: str = self.path + '.tmp'
+        self._create(temp_path, capacity, self._count, self._games, (self.mu, self.sigma, self.beta, self.tau))
+        with open(temp_path, 'r+b') as file, mmap.mmap(file.fileno(), 0) as new_buffer:
+            mask: int = capacity - 1
+            for offset in range(HEADER_SIZE, HEADER_SIZE + self.capacity * RECORD_SIZE, RECORD_SIZE):
+                key: int = _KEY.unpack_from(self._buffer, offset)[0]
+                if not key:
+                    continue
+                slot: int = key & mask
+                while _KEY.unpack_from(new_buffer, HEADER_SIZE + slot * RECORD_SIZE)[0]:
+                    slot = (slot + 1) & mask
+                new_offset: int = HEADER_SIZE + slot * RECORD_SIZE
+                new_buffer[new_offset:new_offset + RECORD_SIZE] = self._buffer[offset:offset + RECORD_SIZE]
+            new_buffer.flush()
+        self._buffer.close()
+        os.replace(temp_path, self.path)
+        self._open()
+
+    @property
+    def rated_files_path(self) -> str:
+        return self.path + RATED_FILES_SUFFIX
+
+    def rated_files(self) -> set[str]:
+        """Returns names of game data files (without extension) whose games are in the table"""
+        return _read_file_names(self.rated_files_path)
+
+    def add_rated_files(self, paths: Iterable[str]) -> None:
+        """Remembers that games of game data files are in the table, call after flush"""
+        _append_file_names(self.rated_files_path, paths)
+
+    @property
+    def skipped_files_path(self) -> str:
+        return self.path + SKIPPED_FILES_SUFFIX
+
+    def skipped_files(self) -> set[str]:
+        """Returns names of game data files (without extension) whose games will never be rated"""
+        return _read_file_names(self.skipped_files_path)
+
+    def add_skipped_files(self, paths: Iterable[str]) -> None:
+        """Remembers that games of game data files cannot be rated (unfinished or rejected by the table)"""
+        _append_file_names(self.skipped_files_path, paths)
+
+    def rate_game(self, path: str, placings: list[str]) -> None:
+        """Rates game that was saved to game data file path, so backfill will not rate it again"""
+        self.update(placings)
+        self.flush()
+        self.add_rated_files([path])
+
+    def flush(self) -> None:
+        if not self.read_only:
+            self._buffer.flush()
+
+    def close(self) -> None:
+        if not self._buffer.closed:
+            self.flush()
+            self._buffer.close()
+
+
+def _read_file_names(path: str) -> set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'r', encoding='UTF-8') as file:
+        return {line.rstrip('\n') for line in file if line.strip()}
+
+def _append_file_names(path: str, paths: Iterable[str]) -> None:
+    with open(path, 'a', encoding='UTF-8') as file:
+        file.writelines(f'{game_file_name(game_path)}\n' for game_path in paths)
+
+def game_file_name(path: str) -> str:
+    """Returns name of game data file without directory and extension, the same for .csv and binary log of game"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+def game_placings(rows: Iterable[Row]) -> list[str] | None:
+    """Returns names of players of one game from first to last place, None if the game was not finished\n
+    Players are placed by Final_place of the rows they finished in, the only one without it is the last
+    """
+    places: dict[str, int] = {}
+    unplaced: dict[str, None] = {}
+    for row in rows:
+        name: str = str(row['Player_name'])
+        if row['Final_place']:
+            places[name] = int(row['Final_place'])
+            unplaced.pop(name, None)
+        elif name not in places:
+            unplaced[name] = None
+    if 1 not in places.values() or len(unplaced) != 1:
+        return None
+    return sorted(places, key=places.__getitem__) + list(unplaced)
+
+def file_placings(path: str) -> list[str] | None:
+    """Returns placings of game of .csv or binary log file, of binary log only two columns are read"""
+    if path.endswith(c_dict.BINARY_LOG_EXTENSION):
+        from makao_game.binary_log import GameLog
+        with GameLog(path) as log:
+            names: list[str | None] = log.categories('Player_name')
+            rows: list[Row] = [{'Player_name': names[code], 'Final_place': place}
+                               for code, place in zip(log.column('Player_name').tolist(),
+                                                      log.column('Final_place').tolist())]
+        return game_placings(rows)
+    from makao_game.data_logger import iter_csv_rows
+    return game_placings(iter_csv_rows(path))
+
+def files_placings(paths: list[str]) -> list[tuple[str, list[str] | None]]:
+    """Returns placings of every file, runs in worker processes"""
+    return [(path, file_placings(path)) for path in paths]
+
+def backfill(table: RatingTable, data_dir_path: str, workers: int | None = None,
+             chunk_size: int = 256) -> tuple[int, int, int]:
+    """Rates games of data files in directory that are not in the table yet, in order of file names (start times)\n
+    Files are read in chunks spread across processes, games are rated in order as chunks come back.
+    Unfinished games and games the table rejects (e.g. names it cannot store) are not rated, their files
+    are recorded as skipped, so no later backfill reads them again. Rated and skipped files are recorded
+    even if backfill is interrupted. Returns number of rated, unfinished and rejected games
+    """
+    from makao_game.analytics import GameDataAnalyzer
+    known_files: set[str] = table.rated_files() | table.skipped_files()
+    paths: list[str] = [path for path in GameDataAnalyzer(data_dir_path).data_files()
+                        if game_file_name(path) not in known_files]
+    chunks: list[list[str]] = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    rated: int = 0
+    unfinished: int = 0
+    rejected: int = 0
+    workers = workers or os.cpu_count() or 1
+    executor: ProcessPoolExecutor | None = (ProcessPoolExecutor(max_workers=workers)
+                                            if workers > 1 and len(chunks) > 1 else None)
+    try:
+        results: Iterable[list[tuple[str, list[str] | None]]] = (
+            map(files_placings, chunks) if executor is None else executor.map(files_placings, chunks)
+        )
+        for chunk in results:
+            done: list[str] = []
+            skipped: list[str] = []
+            try:
+                for path, placings in chunk:
+                    if placings is None:
+                        unfinished += 1
+                        skipped.append(path)
+                        continue
+                    try:
+                        table.update(placings)
+                    except ValueError:   # update changes nothing when it rejects a game
+                        rejected += 1
+                        skipped.append(path)
+                        continue
+                    done.append(path)
+            finally:
+                table.flush()
+                table.add_rated_files(done)
+                table.add_skipped_files(skipped)
+                rated += len(done)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return rated, unfinished, rejected
@@ -0,0 +1,283 @@
+"""Recording games as seed + decisions of players and replaying them headlessly
+
+RecordedGame plays like Game and keeps GameRecord: seed of its rng, rules, seating, class and policy
+of every bot and every decision (shuffle, play/pass, chosen cards, demand, makao). ReplayGame plays the record
+again without any IO under the recorded rules, human decisions are taken from the record, bots decide again
+with the same rng and policies and have to make the same decisions, so any change in rules or bots
+shows up as a mismatch
+"""
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Callable, Iterator, Unpack
+
+from makao_game import dictionaries as c_dict
+from makao_game.game import Game, PlayerNames
+from makao_game.player import Player, BotPlayer, BotPolicy
+from makao_game.cards import Card
+from makao_game.io_handler import IOHandler, NullIOHandler
+from makao_game.piles import DrawPile, DiscardPile
+from makao_game.turn_order import TurnOrder
+from makao_game.rules import RuleSet, DEFAULT_RULE_SET
+
+RECORD_VERSION: int = 1
+
+Decision = tuple[str, bool | str | list[int]]
+Row = dict[str, str | int | bool | None]
+
+@dataclass
+class GameRecord:
+    """Everything needed to replay a game\n
+    seating - names of players in order they sat at the table, bots[i] - if player at seat i is a bot,
+    bot_classes[i], policies[i] - class name and BotPolicy of bot at seat i (None for humans),
+    decisions - (kind, value) of every decision in order they were made, chosen cards are stored as card ids,
+    duration - how long the original game took in seconds
+    """
+    seed: int
+    seating: list[str] = field(default_factory=list)
+    bots: list[bool] = field(default_factory=list)
+    bit_hands: bool = False
+    rules: RuleSet = DEFAULT_RULE_SET
+    bot_classes: list[str | None] = field(default_factory=list)
+    policies: list[BotPolicy | None] = field(default_factory=list)
+    decisions: list[Decision] = field(default_factory=list)
+    duration: float = 0.0
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'version': RECORD_VERSION,
+            'seed': self.seed,
+            'seating': self.seating,
+            'bots': self.bots,
+            'bit_hands': self.bit_hands,
+            'rules': self.rules.to_dict(),
+            'bot_classes': self.bot_classes,
+            'policies': [None if policy is None else asdict(policy) for policy in self.policies],
+            'decisions': self.decisions,
+            'duration': self.duration,
+        }, separators=(',', ':'), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text: str) -> 'GameRecord':
+        data: dict = json.loads(text)
+        if data.get('version') != RECORD_VERSION:
+            raise ValueError(f'Unsupported game record version {data.get("version")}')
+        return cls(
+            seed=data['seed'],
+            seating=data['seating'],
+            bots=data['bots'],
+            bit_hands=data['bit_hands'],
+            rules=RuleSet.from_dict(data['rules']),
+            bot_classes=data['bot_classes'],
+            policies=[None if policy is None else BotPolicy(**policy) for policy in data['policies']],
+            decisions=[(kind, value) for kind, value in data['decisions']],
+            duration=data['duration'],
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, 'w', encoding='UTF-8') as file:
+            file.write(self.to_json())
+
+    @classmethod
+    def load(cls, path: str) -> 'GameRecord':
+        with open(path, 'r', encoding='UTF-8') as file:
+            return cls.from_json(file.read())
+
+
+class RecordedGame(Game):
+    """Game that records its seed, rules, bots and decisions of players in self.record\n
+    seed defaults to a random one, save_data also saves the record next to .csv file.
+    bot_types and rules are the same as of Game, bots of other classes than BotPlayer
+    can be replayed only with the same bot_types passed to ReplayGame
+    """
+    def __init__(self,
+                 seed: int | None = None,
+                 io_handler: IOHandler | None = None,
+                 data_dir_path: str | None = None,
+                 bit_hands: bool = False,
+                 log_batch_size: int | None = None,
+                 bot_types: dict[str, Callable[..., BotPlayer]] | None = None,
+                 rules: RuleSet | None = None,
+                 **names: Unpack[PlayerNames]) -> None:
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        super().__init__(io_handler=io_handler, data_dir_path=data_dir_path, rng=random.Random(seed),
+                         bit_hands=bit_hands, log_batch_size=log_batch_size, bot_types=bot_types, rules=rules,
+                         **names)
+        self.record: GameRecord = GameRecord(seed=seed, bit_hands=bit_hands, rules=self.rules)
+
+    async def run_game(self):
+        start_time: float = time.perf_counter()
+        try:
+            await super().run_game()
+        finally:
+            self.record.duration = time.perf_counter() - start_time
+
+    async def _prepare_game(self) -> None:
+        await super()._prepare_game()
+        self.record.seating = [player.name for player in self._players]
+        self.record.bots = [isinstance(player, BotPlayer) for player in self._players]
+        self.record.bot_classes = [type(player).__name__ if isinstance(player, BotPlayer) else None
+                                   for player in self._players]
+        self.record.policies = [player.policy if isinstance(player, BotPlayer) else None for player in self._players]
+
+    def _on_decision(self, kind: str, value: bool | str | list[Card]) -> None:
+        if isinstance(value, list):
+            self.record.decisions.append((kind, [card.id for card in value]))
+        else:
+            self.record.decisions.append((kind, value))
+
+    def save_data(self, binary: bool = False) -> str:
+        """Saves data like Game.save_data and the record in file with REPLAY_EXTENSION next to it"""
+        csv_path: str = super().save_data(binary)
+        self.record.save(os.path.splitext(csv_path)[0] + c_dict.REPLAY_EXTENSION)
+        return csv_path
+
+
+class ReplayGame(Game):
+    """Plays GameRecord again synchronously and without any IO, under its rules and with its bot policies\n
+    bot_types are needed for bots of other classes than BotPlayer (as passed to RecordedGame).
+    Raises ValueError as soon as replay stops matching the record
+    """
+    def __init__(self, record: GameRecord, bot_types: dict[str, Callable[..., BotPlayer]] | None = None) -> None:
+        super().__init__(io_handler=NullIOHandler(), data_dir_path='', rng=random.Random(record.seed),
+                         bit_hands=record.bit_hands, bot_types=bot_types, rules=record.rules)
+        self.record: GameRecord = record
+        self._decisions: Iterator[Decision] = iter(())
+
+    def play(self) -> list[Row]:
+        """Replays whole game and returns its turns data"""
+        self._decisions = iter(self.record.decisions)
+        self._game_data = []
+        self._prepare_replay()
+        while len(self._players) > 1:
+            self._turn += 1
+            assert isinstance(self._current_player, Player | BotPlayer)
+            self._replay_turn(self._current_player)
+        if next(self._decisions, None) is not None:
+            raise ValueError('Game ended before all recorded decisions were made')
+        return self._game_data
+
+    @property
+    def turns(self) -> int:
+        return self._turn
+
+    def verify(self, expected_rows: list[Row]) -> None:
+        """Replays the game and compares its turns data with expected ones (e.g. original _game_data)"""
+        rows: list[Row] = self.play()
+        for expected, row in zip(expected_rows, rows):
+            if expected != row:
+                differences: list[str] = [header for header in c_dict.CSV_HEADERS if expected.get(header) != row.get(header)]
+                raise ValueError(f'Replay differs in move {row["Game_move"]} in {differences}')
+        if len(expected_rows) != len(rows):
+            raise ValueError(f'Replay has {len(rows)} moves, expected {len(expected_rows)}')
+
+    def _next_decision(self, kind: str) -> bool | str | list[int]:
+        decision: Decision | None = next(self._decisions, None)
+        if decision is None:
+            raise ValueError(f'Record has no more decisions, needed {kind} in move {self._turn}')
+        if decision[0] != kind:
+            raise ValueError(f'Record has {decision[0]} decision, needed {kind} in move {self._turn}')
+        return decision[1]
+
+    def _check_bot(self, kind: str, decided: bool | str | list[int]) -> None:
+        recorded: bool | str | list[int] = self._next_decision(kind)
+        if recorded != decided:
+            raise ValueError(f'Bot decided {decided!r} instead of recorded {recorded!r} ({kind} in move {self._turn})')
+
+    def _prepare_replay(self) -> None:
+        players: list[Player | BotPlayer] = []
+        for name, is_bot, bot_class, policy in zip(self.record.seating, self.record.bots, self.record.bot_classes,
+                                                   self.record.policies):
+            if is_bot:
+                bot_type: Callable[..., BotPlayer] = self._bot_types.get(name, partial(BotPlayer, policy=policy))
+                bot: BotPlayer = bot_type(bot_name=name, io_handler=self.io_handler, rng=self._rng,
+                                          bit_hand=self._bit_hands)
+                if type(bot).__name__ != bot_class:
+                    raise ValueError(f'Bot {name} was {bot_class}, not {type(bot).__name__}, pass its bot_types')
+                if bot.policy != policy:
+                    raise ValueError(f'Bot {name} played with policy {policy}, not {bot.policy}')
+                bot.join_game(self)
+                players.append(bot)
+            else:
+                players.append(Player(name, self.io_handler, bit_hand=self._bit_hands))
+        # shuffle draws depend only on number of players, so shuffling seats keeps rng in the same state
+        if self._next_decision('shuffle'):
+            self._rng.shuffle(list(range(len(players))))
+        self._players = TurnOrder(players)
+        self._current_player = self._players.current
+
+        self._main_deck = DrawPile(self._create_deck())
+        self._dealing_cards()
+        self._play_deck = DiscardPile([self._start_card()])
+
+    def _replay_turn(self, player: Player | BotPlayer) -> None:
+        """Synchronous counterpart of Game._player_turn with decisions from the record"""
+        player.played_card = False
+        was_frozen: bool = False
+        start_deck_size: int = len(player.deck)
+        start_top_card: Card = self._play_deck.top
+
+        if player.frozen_rows > 0:
+            was_frozen = True
+            self._skip_frozen_turn(player)
+        else:
+            player.have_valid_cards(self._play_deck.top, self._actions)
+            passed: bool = False
+
+            if player.valid_cards:
+                play: bool
+                if isinstance(player, BotPlayer):
+                    play = player.decide_play()
+                    self._check_bot('play', play)
+                else:
+                    play = bool(self._next_decision('play'))
+                if play:
+                    self._replay_move(player)
+                    player.played_card = True
+                else:
+                    passed = True
+
+            if not player.valid_cards or passed:
+                self._resolve_no_play_action(player)
+
+        player.turn += 1
+        self._collect_data(was_frozen, start_deck_size, start_top_card)
+        self._next_player()
+
+        if len(player.deck) == 0:
+            self._remove_finisher(player)
+
+    def _replay_move(self, player: Player | BotPlayer) -> None:
+        """Synchronous counterpart of Game._handle_player_move with decisions from the record"""
+        cards: list[Card]
+        if isinstance(player, BotPlayer):
+            cards = player.pick_cards(self._play_deck.top, self._actions)
+            self._check_bot('cards', [card.id for card in cards])
+        else:
+            card_ids = self._next_decision('cards')
+            assert isinstance(card_ids, list)
+            cards = [self._cards_by_id[c_id] for c_id in card_ids]
+        self._place_cards(player, cards)
+
+        if self._actions.update_player_inputs:
+            assert isinstance(self._actions.demanded_type, str)
+            demand: str
+            if isinstance(player, BotPlayer):
+                demand = player.pick_demand(self._actions.demanded_type)
+                self._check_bot('demand', demand)
+            else:
+                demand = str(self._next_decision('demand'))
+            self._actions.update_actions_with_player_inputs(demand)
+
+        said_makao: bool
+        if isinstance(player, BotPlayer):
+            said_makao = player.decide_makao()
+            self._check_bot('makao', said_makao)
+        else:
+            said_makao = bool(self._next_decision('makao'))
+        if not said_makao:
+            player.deck.extend(self._draw_cards(5) or [])
@@ -0,0 +1,174 @@
+"""Rules of the game declared as data and compiled into integer tables
+
+RuleSet says which cards have which functions (the same way as dictionaries.FUNCTIONS) and which house variants
+are played. compile_rules turns it once into CompiledRules - tables indexed by card id and action state:
+legality masks and rows (as card_codes.LEGAL_MASKS and PLAYABLE_ROWS), effect codes and values of cards
+and ranks that can be played in sets. CardsActions of a game carries them, so Card.can_be_played, players,
+moves and CardsActions.apply_card look rules up the same way for every variant, and a variant costs nothing
+more than the default rules. Compiled rules are cached, games with equal rule sets share them
+"""
+from dataclasses import dataclass, field
+from typing import Any
+
+from makao_game import card_codes
+from makao_game import dictionaries as c_dict
+from makao_game.card_codes import CardFunction, FunctionsTable
+
+# effect codes of cards in CompiledRules.effects
+EFFECT_NONE: int = 0
+EFFECT_PULL: int = 1
+EFFECT_FREEZE: int = 2
+EFFECT_DEMAND: int = 3
+EFFECT_ABOLISH: int = 4
+EFFECT_REVERSE: int = 5
+
+EFFECT_CODES: dict[str, int] = {
+    card_codes.PULL: EFFECT_PULL,
+    card_codes.FREEZE: EFFECT_FREEZE,
+    card_codes.DEMAND: EFFECT_DEMAND,
+    card_codes.ABOLISH: EFFECT_ABOLISH,
+    card_codes.REVERSE: EFFECT_REVERSE,
+}
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Rules of the game as data, the defaults are the rules of Game\n
+    functions - functions of cards by number, as dictionaries.FUNCTIONS: (type, number of cards to pull) for pull
+    and reverse, (type, demand option) for demand, values of freeze and abolish are not used\n
+    abolish_on_anything - abolishing cards (Queens) can be played on any card, even when there is something to take\n
+    anything_on_abolish - any card can be played on an abolishing card, without it the next card has to match it\n
+    stacking_kings - Kings can be played in sets of 3 or 4 like other ranks, their effects stack\n
+    jack_demand_turns, ace_demand_turns - how many turns demands of Jacks and Aces last, None for a round
+    (number of players in the game)
+    """
+    functions: FunctionsTable = field(default_factory=lambda: c_dict.FUNCTIONS, compare=False)
+    abolish_on_anything: bool = True
+    anything_on_abolish: bool = True
+    stacking_kings: bool = False
+    jack_demand_turns: int | None = None
+    ace_demand_turns: int | None = None
+    card_functions: tuple[CardFunction | None, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        card_functions: tuple[CardFunction | None, ...] = tuple(card_codes.card_function(c_id, self.functions)
+                                                                for c_id in range(card_codes.NUM_CARDS))
+        for function in card_functions:
+            if function is None:
+                continue
+            function_type, value = function
+            if function_type not in EFFECT_CODES:
+                raise ValueError(f'Card function {function_type} is not one of FUNCTIONS_TYPES_NAMES')
+            if function_type == card_codes.DEMAND and value not in c_dict.DEMAND_OPTIONS_NAMES.values():
+                raise ValueError(f'Demand option {value} is not one of DEMAND_OPTIONS_NAMES')
+            if function_type in (card_codes.PULL, card_codes.REVERSE) and (not isinstance(value, int) or value < 0):
+                raise ValueError(f'Number of cards to pull must be a non-negative int, not {value}')
+        for turns in (self.jack_demand_turns, self.ace_demand_turns):
+            if turns is not None and turns < 1:
+                raise ValueError('Demands have to last at least 1 turn')
+        object.__setattr__(self, 'card_functions', card_functions)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns rule set as JSON-compatible dict, numbers of cards in functions are strings"""
+        functions: dict[str, Any] = {}
+        for number, function in self.functions.items():
+            functions[str(number)] = (list(function) if isinstance(function, tuple) else
+                                      {colour: list(colour_function) for colour, colour_function in function.items()})
+        return {
+            'functions': functions,
+            'abolish_on_anything': self.abolish_on_anything,
+            'anything_on_abolish': self.anything_on_abolish,
+            'stacking_kings': self.stacking_kings,
+            'jack_demand_turns': self.jack_demand_turns,
+            'ace_demand_turns': self.ace_demand_turns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'RuleSet':
+        """Returns rule set saved with to_dict"""
+        functions: dict[int, CardFunction | dict[str, CardFunction]] = {}
+        for number, function in data['functions'].items():
+            functions[int(number)] = (tuple(function) if isinstance(function, list) else  # type: ignore[assignment]
+                                      {colour: tuple(colour_function) for colour, colour_function in function.items()})
+        return cls(
+            functions=functions,
+            abolish_on_anything=data['abolish_on_anything'],
+            anything_on_abolish=data['anything_on_abolish'],
+            stacking_kings=data['stacking_kings'],
+            jack_demand_turns=data['jack_demand_turns'],
+            ace_demand_turns=data['ace_demand_turns'],
+        )
+
+
+DEFAULT_RULE_SET: RuleSet = RuleSet()
+
+VARIANTS: dict[str, RuleSet] = {
+    'default': DEFAULT_RULE_SET,
+    'queen_on_anything': RuleSet(anything_on_abolish=False),
+    'stacking_kings': RuleSet(stacking_kings=True),
+    'short_demands': RuleSet(jack_demand_turns=1, ace_demand_turns=1),
+}
+
+
+class CompiledRules:
+    """Integer tables of a RuleSet, index by card id (or state * card_codes.NUM_CARDS + top card id)\n
+    legal_masks, playable_rows - as card_codes.LEGAL_MASKS and PLAYABLE_ROWS\n
+    effects - EFFECT_ code of card, pull_counts - cards to pull of pull and reverse cards,
+    demand_types - demand option of demanding cards, demand_turns - duration of their demands, 0 for a round\n
+    functions - function of card, (type, value) as in RuleSet.functions, set_ranks - 1 for ranks that can be played in sets
+    """
+    __slots__ = ('rule_set', 'legal_masks', 'playable_rows', 'effects', 'pull_counts', 'demand_types',
+                 'demand_turns', 'functions', 'set_ranks')
+
+    def __init__(self, rule_set: RuleSet) -> None:
+        self.rule_set: RuleSet = rule_set
+        self.functions: tuple[CardFunction | None, ...] = rule_set.card_functions
+        function_types: list[str | None] = [function[0] if function else None for function in self.functions]
+        if (function_types == card_codes.FUNCTION_TYPES_BY_ID and
+                rule_set.abolish_on_anything and rule_set.anything_on_abolish):
+            self.legal_masks: list[int] = card_codes.LEGAL_MASKS
+            self.playable_rows: list[bytes] = card_codes.PLAYABLE_ROWS
+        else:
+            self.legal_masks = card_codes.build_legal_masks(function_types, rule_set.abolish_on_anything,
+                                                            rule_set.anything_on_abolish)
+            self.playable_rows = card_codes.build_playable_rows(self.legal_masks)
+
+        self.effects: bytes = bytes(EFFECT_CODES[function_type] if function_type else EFFECT_NONE
+                                    for function_type in function_types)
+        self.pull_counts: tuple[int, ...] = tuple(
+            int(function[1]) if function and function[0] in (card_codes.PULL, card_codes.REVERSE) else 0
+            for function in self.functions
+        )
+        self.demand_types: tuple[str | None, ...] = tuple(
+            str(function[1]) if function and function[0] == card_codes.DEMAND else None for function in self.functions
+        )
+        demand_turns: dict[str | None, int | None] = {
+            c_dict.DEMAND_OPTIONS_NAMES['JACK']: rule_set.jack_demand_turns,
+            c_dict.DEMAND_OPTIONS_NAMES['ACE']: rule_set.ace_demand_turns,
+        }
+        self.demand_turns: tuple[int, ...] = tuple(demand_turns.get(demand_type) or 0
+                                                   for demand_type in self.demand_types)
+        self.set_ranks: bytes = bytes(rank != card_codes.KING_RANK or rule_set.stacking_kings
+                                      for rank in range(card_codes.NUM_RANKS))
+
+    def __reduce__(self) -> tuple[object, tuple[RuleSet]]:
+        """Copies and unpickled tables are the cached ones"""
+        return compile_rules, (self.rule_set,)
+
+    def __repr__(self) -> str:
+        return f'CompiledRules({self.rule_set!r})'
+
+
+_COMPILED: dict[RuleSet, CompiledRules] = {}
+
+def compile_rules(rule_set: RuleSet | None = None) -> CompiledRules:
+    """Returns tables of rule set (default rules if None), compiled on the first call for equal rule sets"""
+    if rule_set is None:
+        rule_set = DEFAULT_RULE_SET
+    compiled: CompiledRules | None = _COMPILED.get(rule_set)
+    if compiled is None:
+        compiled = CompiledRules(rule_set)
+        _COMPILED[rule_set] = compiled
+    return compiled
+
+DEFAULT_RULES: CompiledRules = compile_rules()
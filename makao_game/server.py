@@ -0,0 +1,321 @@
+"""TCP server hosting many tables of Game at once in a single event loop
+
+Protocol is line based: client sends its name as the first line, then one line for every question.
+Server sends JSON lines: {"type": "message", "text": ..., "warning": ...} and
+{"type": "input", "data_type": ..., "prompt": ...} (answer is the next line of the client).
+Players are grouped into tables by the Lobby (see lobby.py), names of seats and bots are passed
+to the game as players/bots kwargs. Every human seat talks through its own SeatIOHandler, TableIOHandler of a table sends public messages
+to all seats and private ones (cards, answers to input) only to their player. Bots play in-process.
+Output of a turn is written at once with backpressure (drain with timeout) and every table yields to the others
+after each turn. Tables keep no turns data unless it is streamed to files, so their memory does not grow with
+the length of the game. A seat that disconnects or does not answer in input_timeout closes its table
+"""
+import asyncio
+import json
+import random
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from makao_game import dictionaries as c_dict
+from makao_game.cards import Card
+from makao_game.game import Game
+from makao_game.io_handler import IOHandler, IODataType
+from makao_game.lobby import Lobby, DEFAULT_WAIT_TIMEOUT, DEFAULT_MAX_WAITING, DEFAULT_MAX_TABLES
+
+DEFAULT_PORT: int = 7777
+MAX_LINE: int = 1024
+MAX_NAME_LENGTH: int = 16
+DEFAULT_INPUT_TIMEOUT: float = 120.0
+DEFAULT_WRITE_TIMEOUT: float = 10.0
+DEFAULT_MAX_JOINING: int = 100
+OUTPUT_BUFFER_LIMIT: int = 64 * 1024
+
+class SeatLost(ConnectionError):
+    """Player of a seat disconnected, stopped reading or did not answer in time"""
+
+
+class SeatIOHandler(IOHandler):
+    """IOHandler of one connection, messages are kept until flush and written with one write\n
+    Raises SeatLost when the connection is closed, input does not come in input_timeout seconds
+    or output is not read in write_timeout seconds
+    """
+    def __init__(self,
+                 name: str,
+                 reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter,
+                 input_timeout: float = DEFAULT_INPUT_TIMEOUT,
+                 write_timeout: float = DEFAULT_WRITE_TIMEOUT) -> None:
+        self.name: str = name
+        self.input_timeout: float = input_timeout
+        self.write_timeout: float = write_timeout
+        self.closed: bool = False
+        self._reader: asyncio.StreamReader = reader
+        self._writer: asyncio.StreamWriter = writer
+        self._lines: list[bytes] = []
+        writer.transport.set_write_buffer_limits(high=OUTPUT_BUFFER_LIMIT)
+
+    def send(self, event: dict[str, Any]) -> None:
+        """Adds event to the output of the next flush"""
+        if not self.closed:
+            self._lines.append(json.dumps(event).encode() + b'\n')
+
+    async def get_user_input(self, data_type: IODataType, username: str | None, message: str = '') -> str:
+        self.send({'type': 'input', 'data_type': data_type.value, 'prompt': message})
+        await self.flush()
+        try:
+            line: bytes = await asyncio.wait_for(self._reader.readline(), self.input_timeout)
+        except asyncio.TimeoutError:
+            raise self._lost(f'{self.name} did not answer in {self.input_timeout:g} s')
+        except (ConnectionError, ValueError):
+            # ValueError - line longer than MAX_LINE
+            raise self._lost(f'{self.name} disconnected')
+        if not line:
+            raise self._lost(f'{self.name} disconnected')
+        return line.decode(errors='replace').strip()
+
+    async def display_message(self, message: str, warning: bool = False) -> None:
+        self.send({'type': 'message', 'text': message, 'warning': warning})
+
+    async def flush(self) -> None:
+        """Writes kept messages and waits until the client reads them, if he is too far behind"""
+        if self.closed or not self._lines:
+            return None
+        self._writer.write(b''.join(self._lines))
+        self._lines.clear()
+        try:
+            await asyncio.wait_for(self._writer.drain(), self.write_timeout)
+        except asyncio.TimeoutError:
+            raise self._lost(f'{self.name} stopped reading')
+        except ConnectionError:
+            raise self._lost(f'{self.name} disconnected')
+
+    async def close(self) -> None:
+        try:
+            await self.flush()
+        except SeatLost:
+            pass
+        self.closed = True
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    @property
+    def disconnected(self) -> bool:
+        """True if the seat was lost or the client closed the connection"""
+        return self.closed or self._reader.at_eof()
+
+    def supported_symbols(self) -> dict[str, str]:
+        return {c_dict.COLOURS[num]['name']: c_dict.COLOURS[num]['symbol'] for num in c_dict.COLOURS}
+
+    def _lost(self, reason: str) -> SeatLost:
+        self.closed = True
+        self._lines.clear()
+        return SeatLost(reason)
+
+
+class TableIOHandler(IOHandler):
+    """IOHandler of Game played at one table, routes questions and private messages to seats of their players
+    and sends the other messages to every seat\n
+    The only question without a player (shuffle of the order) is answered with shuffle
+    """
+    def __init__(self, seats: list[SeatIOHandler], shuffle: bool = True) -> None:
+        self.seats: dict[str, SeatIOHandler] = {seat.name: seat for seat in seats}
+        self.shuffle: bool = shuffle
+
+    async def get_user_input(self, data_type: IODataType, username: str | None, message: str = '') -> str:
+        if username is None:
+            return 'yes' if self.shuffle else 'no'
+        # others see the table while the player thinks
+        for seat in self.seats.values():
+            if seat.name != username:
+                await seat.flush()
+        return await self.seats[username].get_user_input(data_type, username, message)
+
+    async def display_message(self, message: str, warning: bool = False) -> None:
+        for seat in self.seats.values():
+            await seat.display_message(message, warning)
+
+    async def display_private_message(self, username: str, message: str, warning: bool = False) -> None:
+        seat: SeatIOHandler | None = self.seats.get(username)
+        if seat is not None:
+            await seat.display_message(message, warning)
+
+    async def flush(self) -> None:
+        """Writes output of the turn to every seat and lets other tables play"""
+        for seat in self.seats.values():
+            await seat.flush()
+        await asyncio.sleep(0)
+
+    async def close(self) -> None:
+        for seat in self.seats.values():
+            await seat.close()
+
+    def supported_symbols(self) -> dict[str, str]:
+        return {c_dict.COLOURS[num]['name']: c_dict.COLOURS[num]['symbol'] for num in c_dict.COLOURS}
+
+
+class TableGame(Game):
+    """Game of a server table, collects turns data only when it is streamed to a file (log_batch_size set)"""
+    def _collect_data(self, frozen_before: bool, deck_size_before: int, top_card_before: Card) -> None:
+        if self._log_batch_size is not None:
+            super()._collect_data(frozen_before, deck_size_before, top_card_before)
+
+
+@dataclass
+class ServerStats:
+    connections: int = 0
+    rejected: int = 0
+    tables_started: int = 0
+    tables_finished: int = 0
+    tables_aborted: int = 0
+    max_open_tables: int = 0
+
+
+class GameServer:
+    """Accepts players over TCP and puts them in the Lobby, which seats them at tables of table_size players,
+    filled with bots when they waited wait_timeout seconds\n
+    Every table is a task playing TableGame, at most max_tables of them are open and at most max_waiting players wait.
+    At most max_joining connections may be sending their names at once, players beyond that limit
+    or the limit of the lobby are told so and disconnected. port 0 picks a free port (see port after start).
+    Turns data is streamed to data_dir_path only if log_batch_size is set
+    """
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = DEFAULT_PORT,
+                 table_size: int = c_dict.MAX_NUM_OF_PLAYERS,
+                 wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+                 input_timeout: float = DEFAULT_INPUT_TIMEOUT,
+                 write_timeout: float = DEFAULT_WRITE_TIMEOUT,
+                 max_tables: int = DEFAULT_MAX_TABLES,
+                 max_waiting: int = DEFAULT_MAX_WAITING,
+                 max_joining: int = DEFAULT_MAX_JOINING,
+                 shuffle_players: bool = True,
+                 data_dir_path: str | None = None,
+                 log_batch_size: int | None = None,
+                 seed: int | None = None) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.input_timeout: float = input_timeout
+        self.write_timeout: float = write_timeout
+        self.max_joining: int = max_joining
+        self.shuffle_players: bool = shuffle_players
+        self.data_dir_path: str | None = data_dir_path
+        self.log_batch_size: int | None = log_batch_size
+        self.stats: ServerStats = ServerStats()
+        self.lobby: Lobby = Lobby(self._open_table, table_size, wait_timeout, max_waiting, max_tables)  # type: ignore[arg-type]
+        self.tables: dict[int, asyncio.Task[None]] = {}
+        self._rng: random.Random = random.Random(seed)
+        self._joining: int = 0
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> 'GameServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        self.lobby.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port, limit=MAX_LINE)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stops accepting players, cancels open tables and disconnects everyone"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.lobby.close()
+        for task in list(self.tables.values()):
+            task.cancel()
+        await asyncio.gather(*self.tables.values(), return_exceptions=True)
+
+    async def wait_tables(self) -> None:
+        """Waits until every open table ends"""
+        while self.tables:
+            await asyncio.gather(*self.tables.values(), return_exceptions=True)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats.connections += 1
+        seat: SeatIOHandler = SeatIOHandler('', reader, writer, self.input_timeout, self.write_timeout)
+        if self._joining >= self.max_joining:
+            await self._reject(seat, 'Too many players are joining, try again later')
+            return None
+        self._joining += 1
+        try:
+            name: bytes = await asyncio.wait_for(reader.readline(), self.input_timeout)
+        except (asyncio.TimeoutError, ConnectionError, ValueError):
+            name = b''
+        finally:
+            self._joining -= 1
+        if not name.strip():
+            await seat.close()
+            return None
+        seat.name = name.decode(errors='replace').strip()
+        if not self.lobby.join(seat):
+            await self._reject(seat, 'Lobby is full, try again later')
+            return None
+        await seat.display_message('Waiting for other players')
+        try:
+            await seat.flush()
+        except SeatLost:
+            pass
+
+    async def _reject(self, seat: SeatIOHandler, reason: str) -> None:
+        self.stats.rejected += 1
+        await seat.display_message(reason, warning=True)
+        await seat.close()
+
+    def _open_table(self, seats: list[SeatIOHandler], num_bots: int, formed_at: float) -> None:
+        """Called by the lobby for every table it forms"""
+        table_id: int = self.stats.tables_started
+        self.stats.tables_started += 1
+        self.tables[table_id] = asyncio.get_running_loop().create_task(
+            self._run_table(table_id, seats, num_bots, formed_at))
+        self.stats.max_open_tables = max(self.stats.max_open_tables, len(self.tables))
+
+    async def _run_table(self, table_id: int, seats: list[SeatIOHandler], num_bots: int, formed_at: float) -> None:
+        bots: list[str] = table_names(seats, num_bots)
+        io_handler: TableIOHandler = TableIOHandler(seats, self.shuffle_players)
+        game: TableGame = TableGame(io_handler=io_handler, data_dir_path=self.data_dir_path,
+                                    rng=random.Random(self._rng.getrandbits(64)), log_batch_size=self.log_batch_size,
+                                    players=[seat.name for seat in seats], bots=bots)
+        self.lobby.table_started(formed_at)
+        try:
+            await game.run_game()
+            await game.show_leaderboard()
+            if self.log_batch_size is not None:
+                game.save_data()
+            self.stats.tables_finished += 1
+        except SeatLost as error:
+            self.stats.tables_aborted += 1
+            await io_handler.display_message(f'Table closed: {error}', warning=True)
+        finally:
+            await io_handler.close()
+            del self.tables[table_id]
+            self.lobby.table_closed()
+
+
+def table_names(seats: list[SeatIOHandler], num_bots: int) -> list[str]:
+    """Makes names of seats short, printable and unique at the table, returns names of bots for the rest of it"""
+    taken: set[str] = set()
+    bots: list[str] = [f'Bot{num + 1}' for num in range(num_bots)]
+    for num, seat in enumerate(seats):
+        name: str = re.sub(r'[^\w -]', '', seat.name)[:MAX_NAME_LENGTH].strip()
+        fallback: int = num + 1
+        while not name or name in taken or name in bots:
+            name = f'Player{fallback}'
+            fallback += 1
+        seat.name = name
+        taken.add(name)
+    return bots
+
@@ -0,0 +1,229 @@
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from makao_game.game import Game
+from makao_game.player import Player, BotPlayer
+from makao_game.cards import Card
+from makao_game.moves import legal_moves
+from makao_game import dictionaries as c_dict
+from makao_game.io_handler import NullIOHandler
+from makao_game.piles import DrawPile, DiscardPile
+from makao_game.turn_order import TurnOrder
+from makao_game.rules import RuleSet
+
+DEFAULT_MAX_TURNS: int = 10_000
+
+def game_seed(seed: int, game_index: int) -> int:
+    """Returns seed of game number game_index in series started with seed\n
+    Every game gets its own stream, so results do not depend on how games were split between processes
+    """
+    return (seed << 32) + game_index
+
+class HeadlessGame(Game):
+    """Bot-only game that runs synchronously, without event loop and without displaying anything\n
+    Uses the same rules as Game, only skips messages and questions
+    """
+    def __init__(self,
+                 bots: list[str],
+                 shuffle_players: bool = False,
+                 collect_data: bool = False,
+                 max_turns: int = DEFAULT_MAX_TURNS,
+                 rng: random.Random | None = None,
+                 bit_hands: bool = False,
+                 bot_types: dict[str, Callable[..., BotPlayer]] | None = None,
+                 rules: RuleSet | None = None) -> None:
+        super().__init__(io_handler=NullIOHandler(), data_dir_path='', rng=rng, bit_hands=bit_hands,
+                         bot_types=bot_types, rules=rules, bots=bots)
+        self._shuffle_players: bool = shuffle_players
+        self._collect: bool = collect_data
+        self._max_turns: int = max_turns
+        self._seating: list[str] = []
+
+    def play(self) -> bool:
+        """Plays whole game and returns True if it ended before reaching max_turns"""
+        self._prepare_headless_game()
+        return self.play_out()
+
+    def play_out(self, max_turns: int | None = None) -> bool:
+        """Plays the game on from its current state, returns True if it ended before turn max_turns
+        (defaults to max_turns of the game)
+        """
+        last_turn: int = self._max_turns if max_turns is None else max_turns
+        while len(self._players) > 1:
+            if self._turn >= last_turn:
+                return False
+            self._turn += 1
+
+            assert isinstance(self._current_player, BotPlayer)
+            self._bot_turn(self._current_player)
+        return True
+
+    def play_turn(self, chosen: list[Card] | None = None) -> None:
+        """Plays one turn of current player, chosen cards are played instead of what bot would decide,
+        empty list makes him pass (or take what he has to when he can't play)
+        """
+        self._turn += 1
+        assert isinstance(self._current_player, BotPlayer)
+        self._bot_turn(self._current_player, chosen)
+
+    def legal_moves(self, useless_pass: bool = True) -> list[list[Card]]:
+        """Returns moves current player can choose from: [] (pass) and moves.legal_moves of his hand.
+        Returns only [] if he is frozen or has nothing to play\n
+        If useless_pass set to False, [] is left out when player can play and passing would only make him pull a card
+        (there is no pull or freeze to take)
+        """
+        player: BotPlayer = self._current_player  # type: ignore[assignment]
+        moves: list[list[Card]] = [[]]
+        if player.frozen_rows > 0:
+            return moves
+        moves.extend(legal_moves(player.deck, self._play_deck.top, self._actions))
+        if (not useless_pass and len(moves) > 1 and
+                self._actions.action_type not in (c_dict.FUNCTIONS_TYPES_NAMES['PULL'], c_dict.FUNCTIONS_TYPES_NAMES['FREEZE'])):
+            del moves[0]
+        return moves
+
+    @property
+    def current_seat(self) -> int:
+        return self._players.current_seat
+
+    @property
+    def is_over(self) -> bool:
+        return len(self._players) <= 1
+
+    def seat_placings(self) -> list[int]:
+        """Returns seats from first to last place, players still in game are ordered by number of their cards"""
+        players: list[Player | BotPlayer] = [*self._finishers, *sorted(self._players, key=lambda player: len(player.deck))]
+        return [self._players.seat(player) for player in players]
+
+    def _prepare_headless_game(self) -> None:
+        players = self._create_players_from_kwargs(pre_players_names=[], pre_bots_names=self._names['bots'])
+        if self._shuffle_players:
+            self._rng.shuffle(players)
+        self._players = TurnOrder(players)
+        self._seating = [player.name for player in players]
+        self._current_player = self._players.current
+
+        self._main_deck = DrawPile(self._create_deck())
+        self._dealing_cards()
+        self._play_deck = DiscardPile([self._start_card()])
+
+    def _bot_turn(self, bot: BotPlayer, chosen: list[Card] | None = None) -> None:
+        """Synchronous counterpart of Game._player_turn for bots, see play_turn for chosen"""
+        bot.played_card = False
+        was_frozen: bool = False
+        start_deck_size: int = len(bot.deck)
+        start_top_card: Card = self._play_deck.top
+
+        if bot.frozen_rows > 0:
+            was_frozen = True
+            self._skip_frozen_turn(bot)
+        else:
+            bot.have_valid_cards(self._play_deck.top, self._actions)
+            passed: bool = False
+
+            if bot.valid_cards:
+                if bot.decide_play() if chosen is None else len(chosen) > 0:
+                    self._bot_move(bot, chosen)
+                    bot.played_card = True
+                else:
+                    passed = True
+
+            if not bot.valid_cards or passed:
+                self._resolve_no_play_action(bot)
+
+        bot.turn += 1
+        if self._collect:
+            self._collect_data(was_frozen, start_deck_size, start_top_card)
+        self._next_player()
+
+        if len(bot.deck) == 0:
+            self._remove_finisher(bot)
+
+    def _bot_move(self, bot: BotPlayer, chosen: list[Card] | None = None) -> None:
+        """Synchronous counterpart of Game._handle_player_move for bots"""
+        self._place_cards(bot, chosen if chosen is not None else bot.pick_cards(self._play_deck.top, self._actions))
+        if self._actions.update_player_inputs:
+            assert isinstance(self._actions.demanded_type, str)
+            self._actions.update_actions_with_player_inputs(bot.pick_demand(self._actions.demanded_type))
+
+        if not bot.decide_makao():
+            bot.deck.extend(self._draw_cards(5) or [])
+
+    @property
+    def turns(self) -> int:
+        return self._turn
+
+    @property
+    def seating(self) -> list[str]:
+        """Names of players in order they sat at the table at the start of the game"""
+        return self._seating
+
+
+@dataclass
+class SimulationReport:
+    """Summary of many headless games"""
+    games: int = 0
+    unfinished: int = 0
+    turns: int = 0
+    elapsed: float = 0.0
+    wins: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (f'{self.games} games in {self.elapsed:.2f}s ({self.games_per_sec:.0f} games/s), '
+                f'{self.turns} turns, {self.unfinished} unfinished, wins: {self.wins}')
+
+
+class Simulation:
+    """Runs many bot-only games in one process and reports how fast they were played"""
+    def __init__(self,
+                 bots: list[str],
+                 shuffle_players: bool = False,
+                 max_turns: int = DEFAULT_MAX_TURNS,
+                 seed: int | None = None,
+                 bit_hands: bool = False,
+                 bot_types: dict[str, Callable[..., BotPlayer]] | None = None,
+                 rules: RuleSet | None = None) -> None:
+        """If seed is given, game number i is played with random.Random(game_seed(seed, i))\n
+        bot_types maps names of bots to classes used instead of BotPlayer (see Game), rules are rules of games
+        """
+        self.bots: list[str] = bots
+        self.shuffle_players: bool = shuffle_players
+        self.max_turns: int = max_turns
+        self.seed: int | None = seed
+        self.bit_hands: bool = bit_hands
+        self.bot_types: dict[str, Callable[..., BotPlayer]] | None = bot_types
+        self.rules: RuleSet | None = rules
+
+    def new_game(self, game_index: int) -> HeadlessGame:
+        """Returns not started game number game_index of this simulation"""
+        return HeadlessGame(
+            bots=self.bots,
+            shuffle_players=self.shuffle_players,
+            max_turns=self.max_turns,
+            rng=random.Random(game_seed(self.seed, game_index)) if self.seed is not None else None,
+            bit_hands=self.bit_hands,
+            bot_types=self.bot_types,
+            rules=self.rules
+        )
+
+    def run(self, num_games: int) -> SimulationReport:
+        """Plays num_games games and returns SimulationReport"""
+        report: SimulationReport = SimulationReport(wins={name: 0 for name in self.bots})
+        start: float = time.perf_counter()
+        for game_index in range(num_games):
+            game: HeadlessGame = self.new_game(game_index)
+            if game.play():
+                report.wins[game.placings()[0]] += 1
+            else:
+                report.unfinished += 1
+            report.games += 1
+            report.turns += game.turns
+        report.elapsed = time.perf_counter() - start
+        return report
+
@@ -0,0 +1,277 @@
+"""Sweep of BotPolicy configurations played against each other, stopped by sequential tests
+
+Every game seats one evaluated configuration (at a random seat) against opponents drawn at random from all
+configurations, so every configuration is measured against the same field. Games are played in rounds:
+every configuration still evaluated gets batch games, spread across worker processes like in Tournament
+(game number i of configuration c always uses the same seed, hashed from the seed of the sweep, c and i,
+so results do not depend on the number of workers and sweeps with different seeds play different games).
+After every round each configuration gets a confidence interval of its win rate (Chernoff bound of Bernoulli
+KL divergence, error rate split over configurations and rounds), the intervals are valid at every round at once,
+so looking at them after every round does not inflate errors. Configuration stops being evaluated as soon as
+its order against every other one is settled: their intervals do not overlap, or both fit in tie_margin
+(they are tied - closer than tie_margin). With top set, only the best top configurations have to be ranked,
+the others stop once they are surely not among them. Configurations that are not settled stop after max_games.
+Configurations far from the others settle after a few rounds, only the close ones need many games,
+unlike a sweep that plays the same number of games for all
+"""
+import hashlib
+import itertools
+import math
+import os
+import random
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import Any
+
+from makao_game.player import BotPlayer, BotPolicy
+from makao_game.rules import RuleSet
+from makao_game.simulation import HeadlessGame, DEFAULT_MAX_TURNS
+
+DEFAULT_BATCH: int = 200
+DEFAULT_MAX_GAMES: int = 20_000
+DEFAULT_ERROR_RATE: float = 0.05
+DEFAULT_TIE_MARGIN: float = 0.05
+BISECTION_STEPS: int = 40
+
+def policy_grid(values: dict[str, list[Any]]) -> list[BotPolicy]:
+    """Returns policies of every combination of values of BotPolicy fields, fields not given keep defaults"""
+    names: list[str] = list(values)
+    return [BotPolicy(**dict(zip(names, combination))) for combination in itertools.product(*values.values())]
+
+def sample_policies(values: dict[str, list[Any]], num_policies: int, seed: int | None = None) -> list[BotPolicy]:
+    """Returns num_policies different policies drawn at random from policy_grid of values"""
+    grid: list[BotPolicy] = policy_grid(values)
+    if num_policies > len(grid):
+        raise ValueError(f'Grid has only {len(grid)} policies')
+    return random.Random(seed).sample(grid, num_policies)
+
+def policy_fields() -> dict[str, type]:
+    """Returns names and types of BotPolicy fields that can be swept"""
+    return {field.name: field.type for field in fields(BotPolicy)}  # type: ignore[misc]
+
+def kl_bernoulli(p: float, q: float) -> float:
+    """Returns KL divergence of Bernoulli(q) from Bernoulli(p)"""
+    q = min(max(q, 1e-12), 1 - 1e-12)
+    divergence: float = 0.0
+    if p > 0:
+        divergence += p * math.log(p / q)
+    if p < 1:
+        divergence += (1 - p) * math.log((1 - p) / (1 - q))
+    return divergence
+
+def kl_interval(wins: int, games: int, log_term: float) -> tuple[float, float]:
+    """Returns win rates q around wins / games with games * kl(wins / games, q) <= log_term"""
+    if games == 0:
+        return 0.0, 1.0
+    rate: float = wins / games
+    bound: float = log_term / games
+
+    def search(inside: float, outside: float) -> float:
+        for _ in range(BISECTION_STEPS):
+            middle: float = (inside + outside) / 2
+            if kl_bernoulli(rate, middle) <= bound:
+                inside = middle
+            else:
+                outside = middle
+        return inside
+    return search(rate, 0.0), search(rate, 1.0)
+
+def sweep_game_seed(seed: int, candidate: int, game_number: int) -> int:
+    """Returns seed of game number game_number of configuration candidate in sweep started with seed\n
+    Seed is a hash of all three, so no two of them share a game (unlike shifted sums of them)
+    """
+    key: bytes = f'{seed}:{candidate}:{game_number}'.encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+def play_batch(policies: list[BotPolicy], candidate: int, start: int, stop: int, num_players: int, seed: int,
+               max_turns: int = DEFAULT_MAX_TURNS, rules: RuleSet | None = None) -> tuple[int, int, int, int]:
+    """Plays games number start to stop of policy candidate, returns (candidate, games, wins, turns)\n
+    Runs in worker processes, unfinished games count as not won
+    """
+    seats: list[str] = [f'Seat{seat + 1}' for seat in range(num_players)]
+    wins: int = 0
+    turns: int = 0
+    for game_number in range(start, stop):
+        rng: random.Random = random.Random(sweep_game_seed(seed, candidate, game_number))
+        candidate_seat: int = rng.randrange(num_players)
+        seat_policies: list[BotPolicy] = [policies[candidate] if seat == candidate_seat else rng.choice(policies)
+                                          for seat in range(num_players)]
+        game: HeadlessGame = HeadlessGame(
+            bots=seats,
+            max_turns=max_turns,
+            rng=rng,
+            bot_types={name: partial(BotPlayer, policy=policy) for name, policy in zip(seats, seat_policies)},
+            rules=rules
+        )
+        if game.play() and game.placings()[0] == seats[candidate_seat]:
+            wins += 1
+        turns += game.turns
+    return candidate, stop - start, wins, turns
+
+
+STATUS_RUNNING: str = 'running'
+STATUS_SETTLED: str = 'settled'
+STATUS_OUT_OF_TOP: str = 'out of top'
+STATUS_MAX_GAMES: str = 'max games'
+
+@dataclass
+class PolicyResult:
+    """Games and wins of one configuration, low and high are bounds of its win rate,
+    status tells why it stopped being evaluated
+    """
+    policy: BotPolicy
+    games: int = 0
+    wins: int = 0
+    low: float = 0.0
+    high: float = 1.0
+    status: str = STATUS_RUNNING
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+
+@dataclass
+class SweepResult:
+    """Results of all configurations of a sweep"""
+    results: list[PolicyResult]
+    num_players: int
+    error_rate: float
+    rounds: int = 0
+    turns: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def games(self) -> int:
+        return sum(result.games for result in self.results)
+
+    @property
+    def fixed_games(self) -> int:
+        """Games of a sweep that plays as many games of every configuration as of the most played one"""
+        return len(self.results) * max(result.games for result in self.results)
+
+    def ranking(self) -> list[PolicyResult]:
+        """Returns results from the highest win rate"""
+        return sorted(self.results, key=lambda result: result.win_rate, reverse=True)
+
+    def __str__(self) -> str:
+        lines: list[str] = [f'{"#":>3} {"win rate":>9} {"interval":>13} {"games":>7} {"status":>11}  policy']
+        for place, result in enumerate(self.ranking()):
+            lines.append(f'{place + 1:>3} {result.win_rate:>9.3f} {f"{result.low:.3f}-{result.high:.3f}":>13} '
+                         f'{result.games:>7} {result.status:>11}  {result.policy}')
+        lines.append(f'{self.games} games in {self.rounds} rounds ({self.elapsed:.1f}s) with {self.num_players} players, '
+                     f'fixed-N sweep: {self.fixed_games} games ({self.games / self.fixed_games:.0%}), '
+                     f'intervals hold with probability {1 - self.error_rate:.0%}')
+        return '\n'.join(lines)
+
+
+class PolicySweep:
+    """Plays BotPolicy configurations against each other until their ranking is settled, see module docstring\n
+    batch - games of every configuration per round, max_games - games after which configuration stops anyway,
+    error_rate - chance that any interval misses the true win rate, tie_margin - win rates closer than that are tied,
+    top - number of the best configurations to rank (None for all of them), rules are rules of games (see rules.py)
+    """
+    def __init__(self,
+                 policies: list[BotPolicy],
+                 num_players: int = 4,
+                 seed: int = 0,
+                 workers: int | None = None,
+                 batch: int = DEFAULT_BATCH,
+                 max_games: int = DEFAULT_MAX_GAMES,
+                 error_rate: float = DEFAULT_ERROR_RATE,
+                 tie_margin: float = DEFAULT_TIE_MARGIN,
+                 top: int | None = None,
+                 max_turns: int = DEFAULT_MAX_TURNS,
+                 rules: RuleSet | None = None) -> None:
+        if len(policies) < 2:
+            raise ValueError('Sweep needs at least 2 policies')
+        if len(set(policies)) != len(policies):
+            raise ValueError('Policies of sweep have to be different')
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate must be within 0 and 1')
+        if batch < 1 or max_games < batch:
+            raise ValueError('batch must be at least 1 and max_games at least batch')
+        if top is not None and not 1 <= top < len(policies):
+            raise ValueError('top must be at least 1 and less than number of policies')
+        self.policies: list[BotPolicy] = policies
+        self.num_players: int = num_players
+        self.seed: int = seed
+        self.workers: int = workers or os.cpu_count() or 1
+        self.batch: int = batch
+        self.max_games: int = max_games
+        self.error_rate: float = error_rate
+        self.tie_margin: float = tie_margin
+        self.top: int | None = top
+        self.max_turns: int = max_turns
+        self.rules: RuleSet | None = rules
+
+    def _chunks(self, start: int, stop: int, num_active: int) -> list[tuple[int, int]]:
+        """Splits games of one configuration in a round, so all configurations make a few chunks per worker"""
+        num_chunks: int = max(1, min(stop - start, self.workers * 4 // num_active))
+        bounds: list[int] = [start + (stop - start) * i // num_chunks for i in range(num_chunks + 1)]
+        return [(bounds[i], bounds[i + 1]) for i in range(num_chunks)]
+
+    def _update(self, sweep: SweepResult, active: list[int]) -> list[int]:
+        """Sets intervals of active configurations after round, returns those that go on"""
+        log_term: float = math.log(2 * len(self.policies) * sweep.rounds * (sweep.rounds + 1) / self.error_rate)
+        for index in active:
+            result: PolicyResult = sweep.results[index]
+            result.low, result.high = kl_interval(result.wins, result.games, log_term)
+        still_active: list[int] = []
+        for index in active:
+            result = sweep.results[index]
+            others: list[PolicyResult] = [other for other in sweep.results if other is not result]
+            if self.top is not None and result.high < sorted(other.low for other in others)[-self.top]:
+                result.status = STATUS_OUT_OF_TOP
+            elif all(self._ordered(result, other) for other in others):
+                result.status = STATUS_SETTLED
+            elif result.games >= self.max_games:
+                result.status = STATUS_MAX_GAMES
+            else:
+                still_active.append(index)
+        return still_active
+
+    def _ordered(self, result: PolicyResult, other: PolicyResult) -> bool:
+        """Returns True if intervals of configurations do not overlap or both fit in tie_margin"""
+        return (result.high < other.low or result.low > other.high or
+                max(result.high, other.high) - min(result.low, other.low) <= self.tie_margin)
+
+    def run(self) -> SweepResult:
+        """Plays rounds until every configuration is settled or played max_games games"""
+        sweep: SweepResult = SweepResult([PolicyResult(policy) for policy in self.policies], self.num_players,
+                                         self.error_rate)
+        start_time: float = time.perf_counter()
+        active: list[int] = list(range(len(self.policies)))
+        executor: ProcessPoolExecutor | None = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            while active:
+                jobs: list[tuple[int, int, int]] = []
+                for index in active:
+                    played: int = sweep.results[index].games
+                    for start, stop in self._chunks(played, min(played + self.batch, self.max_games), len(active)):
+                        jobs.append((index, start, stop))
+                arguments: tuple[int, int, int, RuleSet | None] = (self.num_players, self.seed, self.max_turns,
+                                                                   self.rules)
+                if executor is None:
+                    batches: list[tuple[int, int, int, int]] = [
+                        play_batch(self.policies, index, start, stop, *arguments) for index, start, stop in jobs
+                    ]
+                else:
+                    futures: list[Future[tuple[int, int, int, int]]] = [
+                        executor.submit(play_batch, self.policies, index, start, stop, *arguments)
+                        for index, start, stop in jobs
+                    ]
+                    batches = [future.result() for future in futures]
+                for index, games, wins, turns in batches:
+                    sweep.results[index].games += games
+                    sweep.results[index].wins += wins
+                    sweep.turns += turns
+                sweep.rounds += 1
+                active = self._update(sweep, active)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        sweep.elapsed = time.perf_counter() - start_time
+        return sweep
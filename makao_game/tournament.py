@@ -0,0 +1,167 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+from makao_game.simulation import Simulation, DEFAULT_MAX_TURNS
+from makao_game.player import BotPlayer
+from makao_game.rules import RuleSet
+
+@dataclass
+class TournamentResult:
+    """Aggregated results of many games, small enough to be sent between processes\n
+    placings[name][i] - how many times player took place i + 1,
+    seat_wins[i] - how many games were won by player starting at seat i
+    """
+    games: int = 0
+    unfinished: int = 0
+    turns: int = 0
+    min_turns: int = 0
+    max_turns: int = 0
+    placings: dict[str, list[int]] = field(default_factory=dict)
+    seat_wins: list[int] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @classmethod
+    def empty(cls, bots: list[str]) -> 'TournamentResult':
+        return cls(placings={name: [0] * len(bots) for name in bots}, seat_wins=[0] * len(bots))
+
+    def add_game(self, seating: list[str], placings: list[str], turns: int, finished: bool) -> None:
+        """Adds result of one game"""
+        self.min_turns = turns if self.games == 0 else min(self.min_turns, turns)
+        self.max_turns = max(self.max_turns, turns)
+        self.games += 1
+        self.turns += turns
+        if not finished:
+            self.unfinished += 1
+            return None
+        for place, name in enumerate(placings):
+            self.placings[name][place] += 1
+        self.seat_wins[seating.index(placings[0])] += 1
+        return None
+
+    def merge(self, other: 'TournamentResult') -> None:
+        """Adds results of other to self"""
+        if other.games == 0:
+            return None
+        self.min_turns = other.min_turns if self.games == 0 else min(self.min_turns, other.min_turns)
+        self.max_turns = max(self.max_turns, other.max_turns)
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.turns += other.turns
+        for name, counts in other.placings.items():
+            self.placings[name] = [a + b for a, b in zip(self.placings[name], counts)]
+        self.seat_wins = [a + b for a, b in zip(self.seat_wins, other.seat_wins)]
+        return None
+
+    @property
+    def finished(self) -> int:
+        return self.games - self.unfinished
+
+    @property
+    def average_turns(self) -> float:
+        return self.turns / self.games if self.games else 0.0
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    def win_rates(self) -> dict[str, float]:
+        """Returns share of finished games won by every player"""
+        return {name: counts[0] / self.finished if self.finished else 0.0 for name, counts in self.placings.items()}
+
+    def seat_win_rates(self) -> list[float]:
+        """Returns share of finished games won from every seat"""
+        return [wins / self.finished if self.finished else 0.0 for wins in self.seat_wins]
+
+    def __str__(self) -> str:
+        lines: list[str] = [
+            f'{self.games} games in {self.elapsed:.2f}s ({self.games_per_sec:.0f} games/s), {self.unfinished} unfinished',
+            f'Turns: avg {self.average_turns:.1f}, min {self.min_turns}, max {self.max_turns}',
+        ]
+        for name, rate in self.win_rates().items():
+            lines.append(f'{name}: win rate {rate:.3f}, placings {self.placings[name]}')
+        lines.append(f'Seat win rates: {[round(rate, 3) for rate in self.seat_win_rates()]}')
+        return '\n'.join(lines)
+
+
+def play_games(bots: list[str], seed: int, start: int, stop: int, shuffle_players: bool = False,
+               max_turns: int = DEFAULT_MAX_TURNS, bit_hands: bool = False,
+               bot_types: dict[str, Callable[..., BotPlayer]] | None = None,
+               rules: RuleSet | None = None) -> TournamentResult:
+    """Plays games with indexes from start to stop and returns their aggregated results\n
+    Runs in worker processes, only the small TournamentResult is sent back
+    """
+    simulation: Simulation = Simulation(
+        bots=bots,
+        shuffle_players=shuffle_players,
+        max_turns=max_turns,
+        seed=seed,
+        bit_hands=bit_hands,
+        bot_types=bot_types,
+        rules=rules
+    )
+    result: TournamentResult = TournamentResult.empty(bots)
+    for game_index in range(start, stop):
+        game = simulation.new_game(game_index)
+        finished: bool = game.play()
+        result.add_game(game.seating, game.placings(), game.turns, finished)
+    return result
+
+
+class Tournament:
+    """Plays many bot-only games spread across processes\n
+    Game number i always uses seed game_seed(seed, i), so results are the same for any number of workers\n
+    bot_types (see Game) and rules are sent to workers, so they have to be picklable, e.g. classes or functools.partial
+    """
+    def __init__(self,
+                 bots: list[str],
+                 seed: int = 0,
+                 workers: int | None = None,
+                 shuffle_players: bool = True,
+                 max_turns: int = DEFAULT_MAX_TURNS,
+                 bit_hands: bool = False,
+                 bot_types: dict[str, Callable[..., BotPlayer]] | None = None,
+                 rules: RuleSet | None = None) -> None:
+        self.bots: list[str] = bots
+        self.seed: int = seed
+        self.workers: int = workers or os.cpu_count() or 1
+        self.shuffle_players: bool = shuffle_players
+        self.max_turns: int = max_turns
+        self.bit_hands: bool = bit_hands
+        self.bot_types: dict[str, Callable[..., BotPlayer]] | None = bot_types
+        self.rules: RuleSet | None = rules
+
+    def _chunks(self, num_games: int) -> list[tuple[int, int]]:
+        """Splits games into few chunks per worker, so faster workers can take more of them"""
+        num_chunks: int = max(1, min(num_games, self.workers * 4))
+        bounds: list[int] = [num_games * i // num_chunks for i in range(num_chunks + 1)]
+        return [(bounds[i], bounds[i + 1]) for i in range(num_chunks)]
+
+    def run(self, num_games: int) -> TournamentResult:
+        """Plays num_games games and returns their aggregated results"""
+        result: TournamentResult = TournamentResult.empty(self.bots)
+        start_time: float = time.perf_counter()
+        chunks: list[tuple[int, int]] = self._chunks(num_games)
+
+        if self.workers == 1:
+            for start, stop in chunks:
+                result.merge(play_games(
+                    self.bots, self.seed, start, stop, self.shuffle_players, self.max_turns, self.bit_hands, self.bot_types,
+                    self.rules
+                ))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [
+                    executor.submit(
+                        play_games, self.bots, self.seed, start, stop, self.shuffle_players, self.max_turns,
+                        self.bit_hands, self.bot_types, self.rules
+                    )
+                    for start, stop in chunks
+                ]
+                for future in futures:
+                    result.merge(future.result())
+
+        result.elapsed = time.perf_counter() - start_time
+        return result
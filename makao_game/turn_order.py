@@ -0,0 +1,102 @@
+from typing import Generic, Iterable, Iterator, Sequence, TypeVar
+
+T = TypeVar('T')
+
+class TurnOrder(Generic[T]):
+    """Circular order of players at the table kept as doubly linked seats\n
+    Moving to the next player in any direction and removing a player are O(1),
+    reversing the order is free, because direction is chosen at every advance
+    """
+    def __init__(self, players: Iterable[T] = ()) -> None:
+        self._seats: list[T] = list(players)
+        num_seats: int = len(self._seats)
+        self._seat_of: dict[int, int] = {id(player): seat for seat, player in enumerate(self._seats)}
+        self._next: list[int] = [(seat + 1) % num_seats for seat in range(num_seats)]
+        self._prev: list[int] = [(seat - 1) % num_seats for seat in range(num_seats)]
+        self._first: int = 0
+        self._current: int = 0
+        self._size: int = num_seats
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterates over players still at the table, from the first seat"""
+        seat: int = self._first
+        for _ in range(self._size):
+            yield self._seats[seat]
+            seat = self._next[seat]
+
+    def __getitem__(self, index: int) -> T:
+        """Returns player by position in seating order, O(n)"""
+        return list(self)[index]
+
+    def __contains__(self, player: object) -> bool:
+        seat: int | None = self._seat_of.get(id(player))
+        return seat is not None and self._seats[seat] is player
+
+    @property
+    def all_players(self) -> list[T]:
+        """Every player that sat at the table ordered by seats, also the removed ones"""
+        return self._seats
+
+    def seat(self, player: T) -> int:
+        """Returns seat of player, also of removed one, O(n)"""
+        for seat, seated in enumerate(self._seats):
+            if seated is player:
+                return seat
+        raise ValueError('Player never sat at the table')
+
+    @property
+    def current(self) -> T:
+        if self._size == 0:
+            raise IndexError('No players at the table')
+        return self._seats[self._current]
+
+    @property
+    def current_seat(self) -> int:
+        return self._current
+
+    def peek(self, reversed_order: bool = False) -> T:
+        """Returns player who will be next, without moving"""
+        return self._seats[self._prev[self._current] if reversed_order else self._next[self._current]]
+
+    def advance(self, reversed_order: bool = False) -> T:
+        """Moves to the next player (previous if order is reversed) and returns him"""
+        self._current = self._prev[self._current] if reversed_order else self._next[self._current]
+        return self._seats[self._current]
+
+    def remove(self, player: T) -> None:
+        """Takes player from the table, if he is current, current becomes next player"""
+        if player not in self:
+            raise ValueError('Player is not at the table')
+        seat: int = self._seat_of.pop(id(player))
+        prev_seat: int = self._prev[seat]
+        next_seat: int = self._next[seat]
+        self._next[prev_seat] = next_seat
+        self._prev[next_seat] = prev_seat
+        self._size -= 1
+        if self._first == seat:
+            self._first = next_seat
+        if self._current == seat:
+            self._current = next_seat
+
+    def snapshot(self) -> tuple[list[int], int]:
+        """Returns seats still at the table in seating order and the current seat"""
+        seats: list[int] = []
+        seat: int = self._first
+        for _ in range(self._size):
+            seats.append(seat)
+            seat = self._next[seat]
+        return seats, self._current
+
+    def restore(self, seats: Sequence[int], current: int) -> None:
+        """Brings back order from snapshot, players at other seats are taken from the table"""
+        num_seats: int = len(seats)
+        for index, seat in enumerate(seats):
+            self._next[seat] = seats[(index + 1) % num_seats]
+            self._prev[seat] = seats[index - 1]
+        self._seat_of = {id(self._seats[seat]): seat for seat in seats}
+        self._first = seats[0] if num_seats else 0
+        self._current = current
+        self._size = num_seats
@@ -0,0 +1,433 @@
+"""Thousands of bot-only games played at once in lockstep, with the whole state kept in NumPy arrays
+
+Every step plays one turn of every game that is still running. Hands are uint64 bitmasks of card ids
+(the same as card_codes masks and BitHand), CardsActions of every game is a few integer arrays,
+and BotPlayer heuristics are evaluated as array operations for all current players together.\n
+Rules are the default rules of Game (Card.can_be_played comes from card_codes.LEGAL_MASKS, effects follow
+CardsActions.apply_card_effects and Game._resolve_no_play_action), house variants of rules.py are not supported, random choices are not the same draws,
+so single games differ from HeadlessGame and only statistics of many games agree
+(see benchmarks/bench_vector_simulation.py). Things decided by order of cards in hand in BotPlayer
+(which of two tied colours is demanded, which set of 3 cards is played) are decided at random.
+Draw pile is kept as card ids, discard pile is only needed as a set (apart from its top card), so it is a mask
+"""
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from makao_game import card_codes
+from makao_game import dictionaries as c_dict
+from makao_game.simulation import DEFAULT_MAX_TURNS, SimulationReport
+
+NUM_CARDS: int = card_codes.NUM_CARDS
+NUM_RANKS: int = card_codes.NUM_RANKS
+NUM_SUITS: int = card_codes.NUM_SUITS
+
+# action of the game, the same numbers as action states of card_codes, demand keeps its state in demand_state
+ACTION_NONE: int = card_codes.STATE_NONE
+ACTION_PULL: int = card_codes.STATE_PULL
+ACTION_FREEZE: int = card_codes.STATE_FREEZE
+ACTION_DEMAND: int = card_codes.STATE_DEMAND_NOTHING
+
+# functions of cards
+FUNCTION_NONE: int = 0
+FUNCTION_PULL: int = 1
+FUNCTION_FREEZE: int = 2
+FUNCTION_DEMAND_NUMBER: int = 3
+FUNCTION_DEMAND_COLOUR: int = 4
+FUNCTION_ABOLISH: int = 5
+FUNCTION_REVERSE: int = 6
+
+def _function_code(function: tuple[str, str | int] | None) -> int:
+    if function is None:
+        return FUNCTION_NONE
+    name, value = function
+    if name == card_codes.DEMAND:
+        return FUNCTION_DEMAND_NUMBER if value == c_dict.DEMAND_OPTIONS_NAMES['JACK'] else FUNCTION_DEMAND_COLOUR
+    return {card_codes.PULL: FUNCTION_PULL, card_codes.FREEZE: FUNCTION_FREEZE,
+            card_codes.ABOLISH: FUNCTION_ABOLISH, card_codes.REVERSE: FUNCTION_REVERSE}[name]
+
+# LEGAL_MASKS[state * NUM_CARDS + top card id] - mask of cards that can be played
+LEGAL_MASKS: np.ndarray = np.array(card_codes.LEGAL_MASKS, dtype=np.uint64)
+FUNCTIONS: np.ndarray = np.array([_function_code(function) for function in card_codes.FUNCTIONS_BY_ID], dtype=np.int8)
+PULL_VALUES: np.ndarray = np.array([function[1] if function is not None and isinstance(function[1], int) else 0
+                                    for function in card_codes.FUNCTIONS_BY_ID], dtype=np.int32)
+CARD_BITS: np.ndarray = np.array([1 << c_id for c_id in range(NUM_CARDS)], dtype=np.uint64)
+RANK_MASKS: np.ndarray = np.array(card_codes.RANK_MASKS, dtype=np.uint64)
+SUIT_MASKS: np.ndarray = np.array(card_codes.SUIT_MASKS, dtype=np.uint64)
+
+QUEENS: int = card_codes.RANK_MASKS[card_codes.QUEEN_RANK]
+# start card is non-functional and is not a King (Game._start_card)
+START_CARDS: int = card_codes.ALL_CARDS_MASK & ~card_codes.FUNCTIONAL_MASK & ~card_codes.RANK_MASKS[card_codes.KING_RANK]
+# BotPlayer demands the non-functional number (5 - 10) he has most, '5' if he has none
+NUMBER_DEMAND_RANKS: np.ndarray = np.array(card_codes.NUMBER_DEMAND_RANKS)
+# and colour he has most, Hearts if he has no cards
+DEFAULT_COLOUR_SUIT: int = card_codes.card_suit(card_codes.card_id(2, 3))
+
+# every rank is a nibble of the mask, these count cards of every rank inside its nibble
+_PAIRS: int = int('01' * (NUM_CARDS // 2), 2)
+_QUADS: int = int('0011' * NUM_RANKS, 2)
+_NIBBLES: int = int('0001' * NUM_RANKS, 2)
+# lowest bit of nibble of every rank that is played as a set, Kings are not (not all of them are functional)
+_SET_RANKS: int = _NIBBLES & ~card_codes.RANK_MASKS[card_codes.KING_RANK]
+
+@dataclass(frozen=True)
+class VectorPolicy:
+    """BotPlayer heuristics as numbers, the defaults are BotPlayer's\n
+    play_chance - chance to play when he has valid cards, makao_chance - chance to say makao/after makao,
+    play_sets - plays all cards of a rank (not Kings) when he has 3 or 4 of them and one is playable,
+    save_queens - plays a Queen only when he has nothing else to play
+    """
+    play_chance: float = 19 / 20
+    makao_chance: float = 20 / 21
+    play_sets: bool = True
+    save_queens: bool = True
+
+
+def card_counts(masks: np.ndarray) -> np.ndarray:
+    return np.bitwise_count(masks)
+
+def set_cards(masks: np.ndarray) -> np.ndarray:
+    """Returns masks of cards of ranks (apart from Kings) that masks have at least 3 cards of"""
+    pairs: np.ndarray = masks - ((masks >> 1) & _PAIRS)
+    counts: np.ndarray = (pairs & _QUADS) + ((pairs >> 2) & _QUADS)     # 0 - 4 in every nibble
+    three_or_more: np.ndarray = ((counts >> 2) | ((counts >> 1) & counts)) & _SET_RANKS
+    return three_or_more * 0xF
+
+
+class LockstepGames:
+    """Batch of games with the same number of players advanced together, one turn of every running game per step\n
+    seat_policies[game, seat] - index of policy of player at that seat,
+    every game starts with the player at seat 0, like Game without shuffled players
+    """
+    def __init__(self,
+                 seat_policies: np.ndarray,
+                 policies: list[VectorPolicy],
+                 rng: np.random.Generator,
+                 max_turns: int = DEFAULT_MAX_TURNS) -> None:
+        num_games, num_players = seat_policies.shape
+        if not 2 <= num_players <= c_dict.MAX_NUM_OF_PLAYERS:
+            raise ValueError(f'Game needs from 2 to {c_dict.MAX_NUM_OF_PLAYERS} players')
+        self.num_games: int = num_games
+        self.num_players: int = num_players
+        self.max_turns: int = max_turns
+        self._rng: np.random.Generator = rng
+        self._seat_policies: np.ndarray = seat_policies
+        self._play_chance: np.ndarray = np.array([policy.play_chance for policy in policies])
+        self._makao_chance: np.ndarray = np.array([policy.makao_chance for policy in policies])
+        self._set_filter: np.ndarray = np.array([card_codes.ALL_CARDS_MASK if policy.play_sets else 0
+                                                 for policy in policies], dtype=np.uint64)
+        self._queen_filter: np.ndarray = np.array([QUEENS if policy.save_queens else 0
+                                                   for policy in policies], dtype=np.uint64)
+
+        # piles and hands
+        self.hands: np.ndarray = np.zeros((num_games, num_players), dtype=np.uint64)
+        self.draw_pile: np.ndarray = np.zeros((num_games, NUM_CARDS), dtype=np.intp)   # ids from the bottom
+        self.draw_size: np.ndarray = np.zeros(num_games, dtype=np.intp)
+        self.discard_pile: np.ndarray = np.zeros(num_games, dtype=np.uint64)   # mask without the top card
+        self.top: np.ndarray = np.zeros(num_games, dtype=np.intp)
+        # CardsActions
+        self.action: np.ndarray = np.zeros(num_games, dtype=np.int8)
+        self.pull_stack: np.ndarray = np.zeros(num_games, dtype=np.int32)
+        self.freeze_stack: np.ndarray = np.zeros(num_games, dtype=np.int32)
+        self.demand_state: np.ndarray = np.zeros(num_games, dtype=np.intp)
+        self.demands_duration: np.ndarray = np.zeros(num_games, dtype=np.int32)
+        self.demand_started: np.ndarray = np.zeros(num_games, dtype=bool)
+        self.reversed_order: np.ndarray = np.zeros(num_games, dtype=bool)
+        # players
+        self.frozen_rows: np.ndarray = np.zeros((num_games, num_players), dtype=np.int32)
+        self.seats_left: np.ndarray = np.full(num_games, (1 << num_players) - 1, dtype=np.intp)    # mask of seats
+        self._seat_tables(num_players)
+        self.current: np.ndarray = np.zeros(num_games, dtype=np.intp)
+        self.finishers: np.ndarray = np.full((num_games, num_players), -1, dtype=np.intp)  # seats from the first place
+        self.num_finished: np.ndarray = np.zeros(num_games, dtype=np.intp)
+        self.turns: np.ndarray = np.zeros(num_games, dtype=np.int32)
+        self.running: np.ndarray = np.ones(num_games, dtype=bool)
+        self._deal()
+
+    def play(self) -> None:
+        """Plays every game until it ends or reaches max_turns"""
+        while self.step():
+            pass
+
+    def step(self) -> int:
+        """Plays one turn of every running game, returns how many games were played"""
+        games: np.ndarray = np.flatnonzero(self.running)
+        if games.size == 0:
+            return 0
+        seats: np.ndarray = self.current[games]
+        self.turns[games] += 1
+
+        frozen: np.ndarray = self.frozen_rows[games, seats] > 0
+        self._skip_frozen_turns(games[frozen], seats[frozen])
+        self._play_turns(games[~frozen], seats[~frozen])
+
+        self._next_players(games, seats)
+        self._remove_finishers(games, seats)
+        self.running[games] = (self._players_left[self.seats_left[games]] > 1) & (self.turns[games] < self.max_turns)
+        return games.size
+
+    @property
+    def finished(self) -> np.ndarray:
+        """True for games that ended before max_turns"""
+        return self._players_left[self.seats_left] <= 1
+
+    @property
+    def winners(self) -> np.ndarray:
+        """Seat of the winner of every game, -1 if game did not finish"""
+        return np.where(self.finished, self.finishers[:, 0], -1)
+
+    def _seat_tables(self, num_players: int) -> None:
+        """Fills tables indexed by mask of seats left: number of players and
+        _next_seat[reversed order, seats left, seat] - next seat still at the table (TurnOrder.advance)
+        """
+        num_masks: int = 1 << num_players
+        self._players_left: np.ndarray = np.array([mask.bit_count() for mask in range(num_masks)], dtype=np.intp)
+        self._next_seat: np.ndarray = np.zeros((2, num_masks, num_players), dtype=np.intp)
+        for direction in (0, 1):
+            for mask in range(num_masks):
+                for seat in range(num_players):
+                    next_seat: int = seat
+                    for offset in range(1, num_players):
+                        candidate: int = (seat + (-offset if direction else offset)) % num_players
+                        if mask >> candidate & 1:
+                            next_seat = candidate
+                            break
+                    self._next_seat[direction, mask, seat] = next_seat
+
+    def _random_cards(self, masks: np.ndarray) -> np.ndarray:
+        """Returns id of a random card from every mask (0 for empty masks)\n
+        Draws which of the cards to take and finds it by halving the mask
+        """
+        remaining: np.ndarray = (self._rng.random(masks.size) * card_counts(masks)).astype(np.uint8)
+        position: np.ndarray = np.zeros(masks.size, dtype=np.uint64)
+        for width in (32, 16, 8, 4, 2, 1):
+            lower: np.ndarray = card_counts((masks >> position) & ((1 << width) - 1))
+            higher: np.ndarray = remaining >= lower
+            remaining -= np.where(higher, lower, 0).astype(np.uint8)
+            position += np.where(higher, width, 0).astype(np.uint64)
+        return position.astype(np.intp)
+
+    def _deal(self) -> None:
+        """Game._dealing_cards and Game._start_card for every game"""
+        self._shuffle_into_draw_pile(np.arange(self.num_games), np.full(self.num_games, card_codes.ALL_CARDS_MASK,
+                                                                        dtype=np.uint64))
+        hand_size: int = 7 if self.num_players < 4 else 5
+        dealt: int = self.num_players * hand_size
+        for seat in range(self.num_players):
+            self.hands[:, seat] = np.bitwise_or.reduce(CARD_BITS[self.draw_pile[:, -dealt + seat::self.num_players]], 1)
+        self.draw_size -= dealt
+
+        # start card is swapped with the top card of the pile and taken, the rest stays in random order
+        rows: np.ndarray = np.arange(self.num_games)
+        self.top[:] = self._random_cards(START_CARDS & ~np.bitwise_or.reduce(self.hands, 1))
+        position: np.ndarray = (self.draw_pile == self.top[:, None]).argmax(1)
+        self.draw_size -= 1
+        self.draw_pile[rows, position] = self.draw_pile[rows, self.draw_size]
+
+    def _shuffle_into_draw_pile(self, games: np.ndarray, masks: np.ndarray) -> None:
+        """Makes cards of masks draw piles of games, in random order"""
+        keys: np.ndarray = np.where((CARD_BITS & masks[:, None]) != 0, self._rng.random((games.size, NUM_CARDS)), 2.0)
+        self.draw_pile[games] = keys.argsort(1)
+        self.draw_size[games] = card_counts(masks)
+
+    def _reset_actions(self, games: np.ndarray) -> None:
+        """CardsActions.reset_actions, keeps reversed_order"""
+        self.action[games] = ACTION_NONE
+        self.pull_stack[games] = 0
+        self.freeze_stack[games] = 0
+        self.demand_state[games] = 0
+        self.demands_duration[games] = 0
+        self.demand_started[games] = False
+
+    def _shorten_demands(self, games: np.ndarray) -> None:
+        """CardsActions.shorten_demand - demand lasts one player less, the last one resets actions"""
+        self.demand_started[games] = False
+        last: np.ndarray = self.demands_duration[games] <= 1
+        self._reset_actions(games[last])
+        self.demands_duration[games[~last]] -= 1
+
+    def _skip_frozen_turns(self, games: np.ndarray, seats: np.ndarray) -> None:
+        """Game._skip_frozen_turn"""
+        self.frozen_rows[games, seats] -= 1
+        self._shorten_demands(games[self.action[games] == ACTION_DEMAND])
+
+    def _play_turns(self, games: np.ndarray, seats: np.ndarray) -> None:
+        """Turns of players that are not frozen: they play if they have valid cards and decide to, otherwise pull"""
+        hands: np.ndarray = self.hands[games, seats]
+        states: np.ndarray = np.where(self.action[games] == ACTION_DEMAND, self.demand_state[games], self.action[games])
+        available: np.ndarray = hands & LEGAL_MASKS[states * NUM_CARDS + self.top[games]]
+        policies: np.ndarray = self._seat_policies[games, seats]
+        plays: np.ndarray = (available != 0) & (self._rng.random(games.size) < self._play_chance[policies])
+        self._play_cards(games[plays], seats[plays], hands[plays], available[plays], policies[plays])
+        self._resolve_no_play(games[~plays], seats[~plays])
+
+    def _play_cards(self, games: np.ndarray, seats: np.ndarray, hands: np.ndarray, available: np.ndarray,
+                    policies: np.ndarray) -> None:
+        """BotPlayer.pick_cards, Game._place_cards, demand and makao of players who play"""
+        sets: np.ndarray = set_cards(hands) & self._set_filter[policies]
+        playable_sets: np.ndarray = available & sets
+        singles: np.ndarray = available & ~self._queen_filter[policies]
+        singles = np.where(singles != 0, singles, available)
+        first: np.ndarray = self._random_cards(np.where(playable_sets != 0, playable_sets, singles))
+
+        # the first card goes down first, the rest of the set on it in any order
+        played: np.ndarray = np.where(playable_sets != 0, hands & RANK_MASKS[first // NUM_SUITS], CARD_BITS[first])
+        others: np.ndarray = played & ~CARD_BITS[first]
+        top: np.ndarray = np.where(others != 0, self._random_cards(others), first)
+
+        self.discard_pile[games] |= (CARD_BITS[self.top[games]] | played) & ~CARD_BITS[top]
+        self.top[games] = top
+        hands &= ~played
+        self.hands[games, seats] = hands
+
+        self._apply_card_effects(games, top, card_counts(played).astype(np.int32))
+        self._pick_demands(games, top, hands)
+
+        forgot_makao: np.ndarray = ((card_counts(hands) <= 1) &
+                                    (self._rng.random(games.size) >= self._makao_chance[policies]))
+        self._draw_cards(games[forgot_makao], seats[forgot_makao], np.full(forgot_makao.sum(), 5))
+
+    def _apply_card_effects(self, games: np.ndarray, top: np.ndarray, num_played: np.ndarray) -> None:
+        """CardsActions.apply_card_effects of the top card"""
+        functions: np.ndarray = FUNCTIONS[top]
+        self.demand_started[games] = False
+
+        # demanded_value is never 'colour', so multiple non-functional cards end a demand only by its duration
+        plain: np.ndarray = functions == FUNCTION_NONE
+        in_demand: np.ndarray = plain & (self.action[games] == ACTION_DEMAND)
+        self._shorten_demands(games[in_demand])
+        self._reset_actions(games[plain & ~in_demand])
+        self._reset_actions(games[functions == FUNCTION_ABOLISH])
+
+        pull: np.ndarray = (functions == FUNCTION_PULL) | (functions == FUNCTION_REVERSE)
+        self.action[games[pull]] = ACTION_PULL
+        self.pull_stack[games[pull]] += PULL_VALUES[top[pull]] * num_played[pull]
+        self.reversed_order[games[functions == FUNCTION_REVERSE]] ^= True
+
+        freeze: np.ndarray = functions == FUNCTION_FREEZE
+        self.action[games[freeze]] = ACTION_FREEZE
+        self.freeze_stack[games[freeze]] += num_played[freeze]
+
+        demand: np.ndarray = (functions == FUNCTION_DEMAND_NUMBER) | (functions == FUNCTION_DEMAND_COLOUR)
+        self.action[games[demand]] = ACTION_DEMAND
+        self.demand_state[games[demand]] = card_codes.STATE_DEMAND_NOTHING
+        self.demands_duration[games[demand]] = self._players_left[self.seats_left[games[demand]]]
+        self.demand_started[games[demand]] = True
+
+    def _pick_demands(self, games: np.ndarray, top: np.ndarray, hands: np.ndarray) -> None:
+        """BotPlayer.pick_number_demand and pick_colour_demand for players who played Jack or Ace,
+        ties are broken at random
+        """
+        functions: np.ndarray = FUNCTIONS[top]
+        number: np.ndarray = functions == FUNCTION_DEMAND_NUMBER
+        if number.any():
+            counts: np.ndarray = card_counts(hands[number, None] & RANK_MASKS[NUMBER_DEMAND_RANKS])
+            picked: np.ndarray = (counts + self._rng.random(counts.shape) / 2).argmax(1)
+            ranks: np.ndarray = NUMBER_DEMAND_RANKS[np.where(counts.any(1), picked, 0)]
+            self.demand_state[games[number]] = card_codes.STATE_DEMAND_NAME + ranks
+
+        colour: np.ndarray = functions == FUNCTION_DEMAND_COLOUR
+        if colour.any():
+            counts = card_counts(hands[colour, None] & SUIT_MASKS)
+            picked = (counts + self._rng.random(counts.shape) / 2).argmax(1)
+            suits: np.ndarray = np.where(counts.any(1), picked, DEFAULT_COLOUR_SUIT)
+            self.demand_state[games[colour]] = card_codes.STATE_DEMAND_COLOUR + suits
+
+    def _resolve_no_play(self, games: np.ndarray, seats: np.ndarray) -> None:
+        """Game._resolve_no_play_action"""
+        actions: np.ndarray = self.action[games]
+        freeze: np.ndarray = actions == ACTION_FREEZE
+        self.frozen_rows[games[freeze], seats[freeze]] = self.freeze_stack[games[freeze]] - 1
+        num_cards: np.ndarray = np.where(actions == ACTION_PULL, self.pull_stack[games], np.where(freeze, 0, 1))
+
+        demand: np.ndarray = actions == ACTION_DEMAND
+        self._shorten_demands(games[demand])
+        self._reset_actions(games[~demand])
+        self._draw_cards(games, seats, num_cards)
+
+    def _draw_cards(self, games: np.ndarray, seats: np.ndarray, num_cards: np.ndarray) -> None:
+        """Game._draw_cards: empty draw pile is refilled with discarded cards, if both ran out,
+        cards drawn so far are lost and player gets nothing
+        """
+        drawn: np.ndarray = np.zeros(games.size, dtype=np.uint64)
+        remaining: np.ndarray = num_cards.copy()
+        failed: np.ndarray = np.zeros(games.size, dtype=bool)
+        while True:
+            drawing: np.ndarray = np.flatnonzero(remaining > 0)
+            if drawing.size == 0:
+                break
+            drawing_games: np.ndarray = games[drawing]
+            empty: np.ndarray = self.draw_size[drawing_games] == 0
+            if empty.any():
+                refilled: np.ndarray = drawing_games[empty]
+                self._shuffle_into_draw_pile(refilled, self.discard_pile[refilled])
+                self.discard_pile[refilled] = 0
+                ran_out: np.ndarray = empty & (self.draw_size[drawing_games] == 0)
+                failed[drawing[ran_out]] = True
+                remaining[drawing[ran_out]] = 0
+                drawing, drawing_games = drawing[~ran_out], drawing_games[~ran_out]
+
+            self.draw_size[drawing_games] -= 1
+            drawn[drawing] |= CARD_BITS[self.draw_pile[drawing_games, self.draw_size[drawing_games]]]
+            remaining[drawing] -= 1
+
+        self.hands[games[~failed], seats[~failed]] |= drawn[~failed]
+
+    def _next_players(self, games: np.ndarray, seats: np.ndarray) -> None:
+        """TurnOrder.advance - the next seat still at the table, previous one if order is reversed"""
+        self.current[games] = self._next_seat[self.reversed_order[games].astype(np.intp), self.seats_left[games], seats]
+
+    def _remove_finishers(self, games: np.ndarray, seats: np.ndarray) -> None:
+        """Game._remove_finisher for players who ended their turn without cards"""
+        done: np.ndarray = self.hands[games, seats] == 0
+        games, seats = games[done], seats[done]
+        # finisher who just demanded is not counted in the demand
+        self.demands_duration[games[self.demand_started[games]]] -= 1
+        self.finishers[games, self.num_finished[games]] = seats
+        self.num_finished[games] += 1
+        self.seats_left[games] &= ~(1 << seats)
+
+
+class VectorSimulation:
+    """Counterpart of Simulation that plays games in LockstepGames batches of batch_size games\n
+    policies maps names of bots to VectorPolicy, bots without one play like BotPlayer
+    """
+    def __init__(self,
+                 bots: list[str],
+                 shuffle_players: bool = False,
+                 max_turns: int = DEFAULT_MAX_TURNS,
+                 seed: int | None = None,
+                 policies: dict[str, VectorPolicy] | None = None,
+                 batch_size: int = 10_000) -> None:
+        self.bots: list[str] = bots
+        self.shuffle_players: bool = shuffle_players
+        self.max_turns: int = max_turns
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.policies: dict[str, VectorPolicy] = policies or {}
+        self.batch_size: int = batch_size
+
+    def new_batch(self, num_games: int) -> tuple[LockstepGames, np.ndarray]:
+        """Returns not started games and index of bot in self.bots at every seat of every game"""
+        seating: np.ndarray = np.tile(np.arange(len(self.bots)), (num_games, 1))
+        if self.shuffle_players:
+            seating = self.rng.random(seating.shape).argsort(1)
+        policies: list[VectorPolicy] = [self.policies.get(name, VectorPolicy()) for name in self.bots]
+        return LockstepGames(seating, policies, self.rng, self.max_turns), seating
+
+    def run(self, num_games: int) -> SimulationReport:
+        """Plays num_games games and returns SimulationReport"""
+        report: SimulationReport = SimulationReport(wins={name: 0 for name in self.bots})
+        start: float = time.perf_counter()
+        for batch_start in range(0, num_games, self.batch_size):
+            games, seating = self.new_batch(min(self.batch_size, num_games - batch_start))
+            games.play()
+            finished: np.ndarray = games.finished
+            winners: np.ndarray = seating[finished, games.finishers[finished, 0]]
+            for bot, wins in enumerate(np.bincount(winners, minlength=len(self.bots))):
+                report.wins[self.bots[bot]] += int(wins)
+            report.games += games.num_games
+            report.unfinished += int((~finished).sum())
+            report.turns += int(games.turns.sum())
+        report.elapsed = time.perf_counter() - start
+        return report
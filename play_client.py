@@ -0,0 +1,23 @@
+import argparse
+import asyncio
+from typing import Any
+from makao_game import colour_string
+from makao_game.client import play_client
+
+async def answer(event: dict[str, Any]) -> str | None:
+    """Prints messages of the server and asks the player for answers to its questions"""
+    if event['type'] == 'message':
+        print(colour_string(event['text'], 'red') if event['warning'] else event['text'])
+        return None
+    return await asyncio.to_thread(input, event['prompt'])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Play Makao on a server started with serve.py')
+    parser.add_argument('name', help='your name at the table')
+    parser.add_argument('--host', default='127.0.0.1', help='address of the server')
+    parser.add_argument('-p', '--port', type=int, default=7777, help='port of the server')
+    args = parser.parse_args()
+    asyncio.run(play_client(args.host, args.port, args.name, answer, keep_events=False))
+
+if __name__ == '__main__':
+    main()
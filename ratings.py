@@ -0,0 +1,48 @@
+import argparse
+import os
+import time
+
+from makao_game import RatingTable, Rating, get_data_path
+from makao_game.ratings import RATINGS_FILE_NAME, backfill
+
+HEADER: str = f'{"player":<32} {"rating":>8} {"mu":>8} {"sigma":>7} {"games":>8} {"wins":>8}'
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Rate players of saved Makao games and show their ratings')
+    parser.add_argument('command', choices=['backfill', 'top', 'show'],
+                        help='backfill - rate saved games that are not rated yet, top - best players, '
+                             'show - ratings of given players')
+    parser.add_argument('names', nargs='*', help='players of show')
+    parser.add_argument('-d', '--data-dir', default=get_data_path(), help='directory with game data files')
+    parser.add_argument('-t', '--table', default=None,
+                        help=f'rating table file (default: {RATINGS_FILE_NAME} in data directory)')
+    parser.add_argument('-n', '--number', type=int, default=20, help='number of players of top')
+    parser.add_argument('--min-games', type=int, default=0, help='top lists only players with that many games')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of processes reading files of backfill (default - all cores)')
+    args = parser.parse_args()
+    table_path: str = args.table or os.path.join(args.data_dir, RATINGS_FILE_NAME)
+
+    if args.command == 'backfill':
+        start: float = time.perf_counter()
+        with RatingTable(table_path) as table:
+            rated, unfinished, rejected = backfill(table, args.data_dir, workers=args.workers)
+            print(f'{rated} games rated ({unfinished} unfinished and {rejected} with invalid players skipped) '
+                  f'in {time.perf_counter() - start:.1f}s, '
+                  f'{table.games} games of {len(table)} players in {table_path}')
+        return
+
+    if not os.path.exists(table_path):
+        parser.error(f'{table_path} does not exist, run backfill first')
+    with RatingTable(table_path, read_only=True) as table:
+        print(HEADER)
+        if args.command == 'top':
+            for rating in table.top(args.number, args.min_games):
+                print(rating)
+        else:
+            for name in args.names:
+                found: Rating | None = table.get(name)
+                print(found if found is not None else f'{name:<32} not rated')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+import argparse
+import os
+import time
+from makao_game import GameRecord, ReplayGame, REPLAY_EXTENSION
+from makao_game.data_logger import read_csv_rows
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Replay recorded Makao games and check them against their .csv data')
+    parser.add_argument('records', nargs='+', help=f'{REPLAY_EXTENSION} files saved next to game data')
+    args = parser.parse_args()
+
+    for path in args.records:
+        record: GameRecord = GameRecord.load(path)
+        csv_path: str = path.removesuffix(REPLAY_EXTENSION) + '.csv'
+        expected_rows = read_csv_rows(csv_path) if os.path.exists(csv_path) else None
+        start_time: float = time.perf_counter()
+        game = ReplayGame(record)
+        if expected_rows is not None:
+            game.verify(expected_rows)
+            result: str = 'matches .csv data'
+        else:
+            game.play()
+            result = 'has no .csv data to check'
+        elapsed: float = time.perf_counter() - start_time
+        print(f'{path}: {game.turns} moves replayed in {elapsed * 1e3:.1f} ms '
+              f'({record.duration / elapsed:.0f}x faster than the original game), {result}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+import argparse
+import asyncio
+from makao_game import GameServer
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Host Makao tables for players connecting over TCP (see play_client.py)')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('-p', '--port', type=int, default=7777, help='port to listen on')
+    parser.add_argument('--table-size', type=int, default=4, help='players at every table, humans and bots')
+    parser.add_argument('--wait-timeout', type=float, default=10.0,
+                        help='seconds players wait for others before the table is filled with bots')
+    parser.add_argument('--input-timeout', type=float, default=120.0, help='seconds player has for every answer')
+    parser.add_argument('--max-tables', type=int, default=1000, help='most tables open at once')
+    parser.add_argument('--max-waiting', type=int, default=1000, help='most players waiting for a table')
+    parser.add_argument('--log-batch-size', type=int, default=None,
+                        help='save data of every table, streaming rows in batches of that size')
+    args = parser.parse_args()
+
+    server = GameServer(
+        host=args.host,
+        port=args.port,
+        table_size=args.table_size,
+        wait_timeout=args.wait_timeout,
+        input_timeout=args.input_timeout,
+        max_tables=args.max_tables,
+        max_waiting=args.max_waiting,
+        log_batch_size=args.log_batch_size
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print(server.stats)
+        print(f'Queue wait:  {server.lobby.stats.queue_wait}')
+        print(f'Table start: {server.lobby.stats.table_start}')
+
+if __name__ == '__main__':
+    main()
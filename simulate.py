@@ -0,0 +1,53 @@
+import argparse
+from functools import partial
+from typing import Callable
+from makao_game import Simulation, Tournament, BotPlayer, ISMCTSBot, VARIANTS
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Play many bot-only Makao games and report games per second')
+    parser.add_argument('-g', '--games', type=int, default=10_000, help='number of games to play')
+    parser.add_argument('-b', '--bots', nargs='+', default=['Bot1', 'Bot2', 'Bot3', 'Bot4'], help='names of bots')
+    parser.add_argument('--shuffle', action='store_true', help='shuffle order of bots every game')
+    parser.add_argument('--bit-hands', action='store_true', help='keep hands of bots as bitmasks')
+    parser.add_argument('--seed', type=int, default=None, help='seed making results reproducible')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='play as a tournament spread across that many processes (0 - all cores)')
+    parser.add_argument('--ismcts', nargs='+', default=[], help='names of bots that use ISMCTSBot')
+    parser.add_argument('--iterations', type=int, default=200, help='rollouts of ISMCTSBot per move')
+    parser.add_argument('--vector', action='store_true',
+                        help='play all games at once in NumPy arrays (VectorSimulation, BotPlayer bots only)')
+    parser.add_argument('--rules', choices=list(VARIANTS), default='default', help='house rules variant')
+    args = parser.parse_args()
+    if args.vector and args.rules != 'default':
+        parser.error('--vector plays only the default rules')
+    bot_types: dict[str, Callable[..., BotPlayer]] = {name: partial(ISMCTSBot, iterations=args.iterations) for name in args.ismcts}
+
+    if args.vector:
+        from makao_game import VectorSimulation
+        print(VectorSimulation(
+            bots=args.bots,
+            shuffle_players=args.shuffle,
+            seed=args.seed
+        ).run(args.games))
+    elif args.workers is None:
+        print(Simulation(
+            bots=args.bots,
+            shuffle_players=args.shuffle,
+            seed=args.seed,
+            bit_hands=args.bit_hands,
+            bot_types=bot_types,
+            rules=VARIANTS[args.rules]
+        ).run(args.games))
+    else:
+        print(Tournament(
+            bots=args.bots,
+            seed=args.seed or 0,
+            workers=args.workers or None,
+            shuffle_players=args.shuffle,
+            bit_hands=args.bit_hands,
+            bot_types=bot_types,
+            rules=VARIANTS[args.rules]
+        ).run(args.games))
+
+if __name__ == '__main__':
+    main()
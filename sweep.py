@@ -0,0 +1,61 @@
+import argparse
+from typing import Any
+
+from makao_game import VARIANTS
+from makao_game.sweep import (PolicySweep, policy_grid, sample_policies, policy_fields, DEFAULT_BATCH, DEFAULT_MAX_GAMES,
+                              DEFAULT_ERROR_RATE, DEFAULT_TIE_MARGIN)
+
+DEFAULT_GRID: list[str] = ['play_weight=19,4', 'play_sets=true,false', 'save_queens=true,false']
+
+def parse_grid(items: list[str]) -> dict[str, list[Any]]:
+    """Turns items like play_weight=19,4 or save_queens=true,false into values of BotPolicy fields"""
+    types: dict[str, type] = policy_fields()
+    values: dict[str, list[Any]] = {}
+    for item in items:
+        name, _, options = item.partition('=')
+        if name not in types or not options:
+            raise ValueError(f'{item} is not field=value,value,... of {", ".join(types)}')
+        if types[name] is bool:
+            values[name] = [option.strip().lower() in ('true', 'yes', '1') for option in options.split(',')]
+        else:
+            values[name] = [types[name](option) for option in options.split(',')]
+    return values
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Rank BotPolicy configurations by playing them against each other')
+    parser.add_argument('grid', nargs='*', default=DEFAULT_GRID,
+                        help=f'swept values of BotPolicy fields as field=value,value (default: {" ".join(DEFAULT_GRID)})')
+    parser.add_argument('--sample', type=int, default=None, help='evaluate only that many policies drawn from the grid')
+    parser.add_argument('-p', '--players', type=int, default=4, help='players in every game')
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH, help='games of every policy per round')
+    parser.add_argument('--max-games', type=int, default=DEFAULT_MAX_GAMES, help='games after which a policy stops')
+    parser.add_argument('--error-rate', type=float, default=DEFAULT_ERROR_RATE,
+                        help='chance that any confidence interval is wrong')
+    parser.add_argument('--tie-margin', type=float, default=DEFAULT_TIE_MARGIN,
+                        help='policies with win rates closer than that are tied')
+    parser.add_argument('--top', type=int, default=None, help='rank only that many best policies')
+    parser.add_argument('--seed', type=int, default=0, help='seed of games and of the sample')
+    parser.add_argument('-w', '--workers', type=int, default=0, help='worker processes (0 - all cores)')
+    parser.add_argument('--rules', choices=list(VARIANTS), default='default', help='house rules variant')
+    args = parser.parse_args()
+
+    try:
+        values: dict[str, list[Any]] = parse_grid(args.grid)
+    except ValueError as error:
+        parser.error(str(error))
+    policies = sample_policies(values, args.sample, args.seed) if args.sample else policy_grid(values)
+    print(PolicySweep(
+        policies=policies,
+        num_players=args.players,
+        seed=args.seed,
+        workers=args.workers or None,
+        batch=args.batch,
+        max_games=args.max_games,
+        error_rate=args.error_rate,
+        tie_margin=args.tie_margin,
+        top=args.top,
+        rules=VARIANTS[args.rules]
+    ).run())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Binary game logs decode back to the same rows as .csv data of the game"""
+import asyncio
+import os
+import random
+
+import pytest
+
+from makao_game import Game, NullIOHandler, GameLog
+from makao_game.binary_log import write_game_log, convert_data_dir
+from makao_game.data_logger import read_csv_rows
+
+@pytest.mark.parametrize('seed', range(5))
+def test_log_matches_csv(tmp_path, seed: int) -> None:
+    game = Game(io_handler=NullIOHandler(), data_dir_path=str(tmp_path), rng=random.Random(seed),
+                bots=['Bot1', 'Bot2', 'Bot3'][:2 + seed % 2])
+    asyncio.run(game.run_game())
+    csv_path = game.save_data(binary=True)
+    expected = read_csv_rows(csv_path)
+    assert expected == game._game_data
+    with GameLog(csv_path.removesuffix('.csv') + '.mlog') as log:
+        assert len(log) == len(expected)
+        assert log.to_rows() == expected
+
+def test_streamed_log_matches_csv(tmp_path) -> None:
+    game = Game(io_handler=NullIOHandler(), data_dir_path=str(tmp_path), rng=random.Random(7), log_batch_size=5,
+                bots=['Bot1', 'Bot2', 'Bot3', 'Bot4'])
+    asyncio.run(game.run_game())
+    csv_path = game.save_data(binary=True)
+    with GameLog(csv_path.removesuffix('.csv') + '.mlog') as log:
+        assert log.to_rows() == read_csv_rows(csv_path)
+
+def test_empty_log(tmp_path) -> None:
+    path = str(tmp_path / 'empty.mlog')
+    write_game_log(path, [])
+    with GameLog(path) as log:
+        assert len(log) == 0 and log.to_rows() == []
+
+def test_columns_match_rows(tmp_path) -> None:
+    game = Game(io_handler=NullIOHandler(), data_dir_path=str(tmp_path), rng=random.Random(11),
+                bots=['Bot1', 'Bot2', 'Bot3'])
+    asyncio.run(game.run_game())
+    rows = game._game_data
+    log_path = str(tmp_path / 'game.mlog')
+    write_game_log(log_path, rows)
+    with GameLog(log_path) as log:
+        names = log.categories('Player_name')
+        assert [names[code] for code in log.column('Player_name').tolist()] == [row['Player_name'] for row in rows]
+        assert log.column('Is_frozen').tolist() == [row['Is_frozen'] for row in rows]
+        assert log.counts('Played_cards_names').tolist() == [row['Played_cards_count'] for row in rows]
+        with pytest.raises(KeyError):
+            log.column('Pulled_cards_names')
+
+def test_convert_data_dir_converts_only_new_files(tmp_path) -> None:
+    for seed in range(2):
+        game = Game(io_handler=NullIOHandler(), data_dir_path=str(tmp_path / str(seed)), rng=random.Random(seed),
+                    bots=['Bot1', 'Bot2'])
+        asyncio.run(game.run_game())
+        os.replace(game.save_data(), tmp_path / f'game{seed}.csv')
+    assert convert_data_dir(str(tmp_path)) == [str(tmp_path / 'game0.mlog'), str(tmp_path / 'game1.mlog')]
+    assert convert_data_dir(str(tmp_path)) == []
+    with GameLog(str(tmp_path / 'game1.mlog')) as log:
+        assert log.to_rows() == read_csv_rows(str(tmp_path / 'game1.csv'))
+
+def test_other_files_are_rejected(tmp_path) -> None:
+    path = tmp_path / 'game.mlog'
+    path.write_bytes(b'not a game log at all')
+    with pytest.raises(ValueError):
+        GameLog(str(path))
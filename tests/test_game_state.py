@@ -0,0 +1,42 @@
+"""Game state snapshots survive packing into bytes, restore games and clones play on like the original"""
+import random
+
+import pytest
+
+from makao_game import GameState, RuleSet
+from makao_game.game_state import VERSION
+from makao_game.simulation import HeadlessGame
+
+def started_game(seed: int, rules: RuleSet | None = None) -> HeadlessGame:
+    game = HeadlessGame(bots=['Bot1', 'Bot2', 'Bot3'], rng=random.Random(seed), rules=rules)
+    game._prepare_headless_game()
+    return game
+
+@pytest.mark.parametrize('rules', [None, RuleSet(jack_demand_turns=300, ace_demand_turns=1000)])
+def test_state_bytes_round_trip(rules: RuleSet | None) -> None:
+    for seed in range(5):
+        game = started_game(seed, rules)
+        while not game.is_over and game.turns < 300:
+            game.play_turn()
+            state = game.snapshot()
+            assert GameState.from_bytes(state.to_bytes()) == state
+
+def test_other_version_is_rejected() -> None:
+    data = bytearray(started_game(0).snapshot().to_bytes())
+    data[0] = VERSION + 1
+    with pytest.raises(ValueError):
+        GameState.from_bytes(bytes(data))
+
+def test_restore_and_clone_play_on_the_same() -> None:
+    game = started_game(3)
+    for _ in range(10):
+        game.play_turn()
+    state = game.snapshot()
+    clone = game.clone()
+    assert isinstance(clone, HeadlessGame)
+    game.play_out()
+    clone.play_out()
+    assert clone.placings() == game.placings() and clone.snapshot() == game.snapshot()
+
+    game.restore(state)
+    assert game.snapshot() == state
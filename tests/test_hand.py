@@ -0,0 +1,76 @@
+"""Counters of hands follow every change of the list, also in whole games checked after every change"""
+import random
+
+import pytest
+
+from makao_game import CARDS
+from makao_game.card_codes import card_id
+from makao_game.cards import Card
+from makao_game.hand import BitHand, Hand
+from makao_game.simulation import HeadlessGame
+
+@pytest.fixture(autouse=True)
+def check_counters(monkeypatch) -> None:
+    monkeypatch.setattr(Hand, 'check_counters', True)
+
+def cards(*ids: tuple[int, int]) -> list[Card]:
+    """Cards of (number, colour series) pairs, series 1 - 4 are Clubs, Diamonds, Hearts, Spades"""
+    return [CARDS[card_id(number, series)] for number, series in ids]
+
+@pytest.mark.parametrize('bit_hands', [False, True])
+def test_games_keep_counters(bit_hands: bool) -> None:
+    for seed in range(20):
+        game = HeadlessGame(bots=['Bot1', 'Bot2', 'Bot3', 'Bot4'], rng=random.Random(seed), bit_hands=bit_hands)
+        assert game.play()
+
+@pytest.mark.parametrize('hand_type', [Hand, BitHand])
+def test_mutators_keep_counters(hand_type: type[Hand]) -> None:
+    rng = random.Random(0)
+    hand = hand_type(rng.sample(CARDS, 6))
+    hand.append(CARDS[0])
+    hand.extend(rng.sample(CARDS, 2))
+    hand += rng.sample(CARDS, 3)
+    hand.insert(2, CARDS[5])
+    hand.remove(CARDS[5])
+    hand.pop()
+    hand.pop(0)
+    hand[1] = CARDS[7]
+    hand[2:4] = rng.sample(CARDS, 3)
+    del hand[0]
+    del hand[1:3]
+    hand *= 2
+    hand.sort(key=lambda card: card.id)
+    hand.reverse()
+    assert isinstance(hand, hand_type)
+    hand.verify()
+    if isinstance(hand, BitHand):
+        assert all(hand.count_id(card.id) == hand.count(card) for card in hand)
+    hand.clear()
+    assert hand == [] and not any(hand.rank_counts) and not any(hand.suit_counts)
+    if isinstance(hand, BitHand):
+        assert hand.mask == 0
+
+def test_stale_counters_are_found() -> None:
+    hand = Hand(cards((7, 1), (7, 2)))
+    hand.rank_counts[0] += 1
+    with pytest.raises(ValueError):
+        hand.verify()
+    bit_hand = BitHand(cards((7, 1)))
+    bit_hand._mask = 0
+    with pytest.raises(ValueError):
+        bit_hand.verify()
+
+@pytest.mark.parametrize('hand_type', [Hand, BitHand])
+def test_most_common_ties_go_to_the_first_card(hand_type: type[Hand]) -> None:
+    hearts_5, clubs_9, hearts_9, clubs_5, spades_5 = cards((5, 3), (9, 1), (9, 3), (5, 1), (5, 4))
+    assert hand_type().most_common_suit() is None
+    assert hand_type([clubs_9, hearts_5, hearts_9, clubs_5]).most_common_suit() == clubs_9.suit
+    assert hand_type([hearts_5, clubs_9, hearts_9, clubs_5]).most_common_suit() == hearts_5.suit
+    assert hand_type([clubs_9, hearts_5, hearts_9]).most_common_suit() == hearts_5.suit
+
+    numbers = range(hearts_5.rank, clubs_9.rank + 2)     # 5 - 10
+    assert hand_type(cards((11, 1), (2, 3))).most_common_rank(numbers) is None
+    assert hand_type([clubs_9, hearts_5, hearts_9, clubs_5]).most_common_rank(numbers) == clubs_9.rank
+    assert hand_type([hearts_5, clubs_9, hearts_9, clubs_5]).most_common_rank(numbers) == hearts_5.rank
+    assert hand_type([clubs_9, hearts_5, clubs_5, spades_5]).most_common_rank(numbers) == hearts_5.rank
+    assert hand_type([clubs_9, hearts_5]).most_common_rank(range(hearts_5.rank, clubs_9.rank)) == hearts_5.rank
@@ -0,0 +1,119 @@
+"""Buffered console output comes out in order and the same as console output, failed writes are raised, not waited for"""
+import asyncio
+import io
+import random
+
+import pytest
+
+from makao_game import BufferedIOHandler, ConsoleIOHandler, Game, IODataType, IOHandler
+from makao_game.utils import colour_string
+
+class FailingOutput(io.StringIO):
+    """Output whose first write fails"""
+    def __init__(self) -> None:
+        super().__init__()
+        self.failed: bool = False
+
+    def write(self, text: str) -> int:
+        if not self.failed:
+            self.failed = True
+            raise OSError('disk full')
+        return super().write(text)
+
+class Answers:
+    """Stands in for input, answers no and keeps what was on output (if given) and the prompt when it was asked"""
+    def __init__(self, output: io.StringIO | None = None) -> None:
+        self.output: io.StringIO | None = output
+        self.seen: list[str] = []
+
+    def __call__(self, message: str) -> str:
+        self.seen.append((self.output.getvalue() if self.output is not None else '') + message)
+        return 'no'
+
+async def play(io_handler: IOHandler, seed: int) -> int:
+    game = Game(io_handler=io_handler, rng=random.Random(seed), bots=['Bot1', 'Bot2', 'Bot3'])
+    try:
+        await game.run_game()
+        await game.show_leaderboard()
+    finally:
+        await io_handler.close()
+    return game._turn
+
+def test_messages_are_written_in_order() -> None:
+    output = io.StringIO()
+    handler = BufferedIOHandler(output=output)
+
+    async def show() -> None:
+        await handler.display_message('first')
+        await handler.flush()
+        await handler.display_message('second', warning=True)
+        await handler.display_private_message('Bot1', 'third')
+        await handler.flush()
+        assert handler.writes == 0   # flush does not wait for the writer
+        await handler.display_message('fourth')
+        await handler.close()
+
+    asyncio.run(show())
+    assert output.getvalue() == f'first\n{colour_string("second", "red")}\nthird\nfourth\n'
+    assert handler.writes == 1   # chunks waiting together are written at once
+
+def test_messages_are_written_before_input(monkeypatch) -> None:
+    output = io.StringIO()
+    handler = BufferedIOHandler(output=output)
+    answers = Answers(output)
+    monkeypatch.setattr('builtins.input', answers)
+
+    async def ask() -> str:
+        await handler.display_message('Your cards')
+        try:
+            return await handler.get_user_input(IODataType.YES_NO, 'Human', 'Shuffle? ')
+        finally:
+            await handler.close()
+
+    assert asyncio.run(ask()) == 'no'
+    assert answers.seen == ['Your cards\nShuffle? ']
+
+def test_write_error_is_raised() -> None:
+    output = FailingOutput()
+    handler = BufferedIOHandler(output=output)
+
+    async def show() -> None:
+        await handler.display_message('lost')
+        with pytest.raises(OSError, match='disk full'):
+            await asyncio.wait_for(handler.drain(), 5)
+        await handler.display_message('kept')
+        await asyncio.wait_for(handler.close(), 5)
+
+    asyncio.run(show())
+    assert output.getvalue() == 'kept\n'
+
+def test_write_error_is_raised_by_close() -> None:
+    handler = BufferedIOHandler(output=FailingOutput())
+
+    async def show() -> None:
+        await handler.display_message('lost')
+        await handler.flush()
+        with pytest.raises(OSError):
+            await asyncio.wait_for(handler.close(), 5)
+
+    asyncio.run(show())
+
+def test_silent_handler_writes_nothing(monkeypatch) -> None:
+    output = io.StringIO()
+    answers = Answers()
+    monkeypatch.setattr('builtins.input', answers)
+    asyncio.run(play(BufferedIOHandler(output=output, silent=True), 0))
+    assert output.getvalue() == '' and answers.seen == ['']
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_game_output_is_the_same_as_console(monkeypatch, capsys, seed: int) -> None:
+    monkeypatch.setattr('builtins.input', lambda message: print(message, end='') or 'no')
+    asyncio.run(play(ConsoleIOHandler(), seed))
+    console_output = capsys.readouterr().out
+
+    output = io.StringIO()
+    buffered = BufferedIOHandler(output=output)
+    monkeypatch.setattr('builtins.input', lambda message: output.write(message) and 'no')
+    turns = asyncio.run(play(buffered, seed))
+    assert output.getvalue() == console_output
+    assert buffered.writes < turns
@@ -0,0 +1,80 @@
+"""ISMCTSBot keeps to its budget of rollouts and time, beats BotPlayers and searches the same way in replays"""
+import asyncio
+import math
+import random
+import time
+from functools import partial
+from typing import Callable
+
+from makao_game import BotPlayer, ISMCTSBot, NullIOHandler, IODataType
+from makao_game.data_logger import read_csv_rows
+from makao_game.replay import RecordedGame, ReplayGame
+from makao_game.simulation import HeadlessGame, Simulation
+
+class BudgetBot(ISMCTSBot):
+    """ISMCTSBot that keeps how long every search took and how many rollouts it played"""
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.searches: list[tuple[float, int]] = []
+
+    def search(self) -> tuple[int, ...]:
+        rollouts: int = self.rollouts
+        start: float = time.perf_counter()
+        chosen: tuple[int, ...] = super().search()
+        self.searches.append((time.perf_counter() - start, self.rollouts - rollouts))
+        return chosen
+
+def searches_of_game(seed: int, **search: float | int | None) -> list[tuple[float, int]]:
+    """Plays a game of BudgetBot with search parameters against two BotPlayers, returns its searches"""
+    bots: list[BudgetBot] = []
+
+    def create_bot(**kwargs) -> BotPlayer:
+        bots.append(BudgetBot(**kwargs, **search))    # type: ignore[arg-type]
+        return bots[-1]
+
+    game = HeadlessGame(bots=['Searcher', 'Bot1', 'Bot2'], rng=random.Random(seed), bot_types={'Searcher': create_bot})
+    game.play()
+    return bots[0].searches
+
+class ShuffleAnswers(NullIOHandler):
+    """Answers yes to shuffling players, nothing else is asked in games of bots"""
+    async def get_user_input(self, data_type: IODataType, username: str | None, message: str = '') -> str:
+        return 'yes' if data_type == IODataType.YES_NO else ''
+
+def test_searching_bots_replay_with_shuffled_seats(tmp_path) -> None:
+    names = ['S1', 'S2', 'S3', 'Bot']
+    bot_types: dict[str, Callable[..., BotPlayer]] = {name: partial(ISMCTSBot, iterations=5, rollout_turns=10) for name in names[:3]}
+    seatings = []
+    for seed in range(3):
+        game = RecordedGame(seed=seed, io_handler=ShuffleAnswers(), data_dir_path=str(tmp_path / str(seed)),
+                            bot_types=bot_types, bots=names)
+        asyncio.run(game.run_game())
+        seatings.append(game.record.seating)
+        ReplayGame(game.record, bot_types=bot_types).verify(read_csv_rows(game.save_data()))
+    assert any(seating != names for seating in seatings)
+
+def test_iterations_bound_rollouts() -> None:
+    searches = searches_of_game(0, iterations=7)
+    # a search with a single legal move plays no rollouts
+    assert {rollouts for _, rollouts in searches} == {0, 7}
+
+def test_time_limit_is_kept() -> None:
+    time_limit = 0.01
+    searches = searches_of_game(1, iterations=None, time_limit=time_limit)
+    searched = [(duration, rollouts) for duration, rollouts in searches if rollouts > 0]
+    assert searched
+    # the last rollout starts before the limit, one rollout takes well under a few milliseconds
+    assert all(duration < time_limit + 0.05 for duration, _ in searched)
+    assert sum(duration for duration, _ in searched) / len(searched) < 2 * time_limit
+
+def test_searching_bot_beats_bot_players() -> None:
+    num_games = 40
+    bots = ['ISMCTS', 'Bot1', 'Bot2', 'Bot3']
+    report = Simulation(bots=bots, shuffle_players=True, seed=0,
+                        bot_types={'ISMCTS': partial(ISMCTSBot, iterations=30)}).run(num_games)
+    wins = report.wins['ISMCTS']
+    chance = 1 / len(bots)
+    # chance of winning that often if he were as good as the others
+    p_value = sum(math.comb(num_games, won) * chance ** won * (1 - chance) ** (num_games - won)
+                  for won in range(wins, num_games + 1))
+    assert wins / num_games > chance and p_value < 0.01
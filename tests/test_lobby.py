@@ -0,0 +1,120 @@
+"""Lobby forms full tables at once, fills late ones with bots, refuses players beyond its limits and keeps metrics"""
+import asyncio
+
+import pytest
+
+from makao_game.lobby import LatencyStats, Lobby, WaitingSeat
+
+class Seat:
+    """Waiting player without a connection"""
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.left: bool = False
+        self.closed: bool = False
+
+    @property
+    def disconnected(self) -> bool:
+        return self.left or self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class Tables:
+    """start_table of the lobby, keeps names of seats and number of bots of every formed table"""
+    def __init__(self) -> None:
+        self.formed: list[tuple[list[str], int]] = []
+
+    def __call__(self, seats: list[WaitingSeat], num_bots: int, formed_at: float) -> None:
+        self.formed.append(([seat.name for seat in seats], num_bots))
+
+
+async def settle() -> None:
+    """Lets the scheduler of the lobby run"""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+def test_invalid_lobbies() -> None:
+    with pytest.raises(ValueError):
+        Lobby(Tables(), table_size=1)
+    with pytest.raises(ValueError):
+        Lobby(Tables(), max_waiting=0)
+
+def test_full_table_starts_without_bots() -> None:
+    tables = Tables()
+
+    async def join() -> None:
+        lobby = Lobby(tables, table_size=3, wait_timeout=60)
+        lobby.start()
+        for name in ['A', 'B', 'C', 'D']:
+            assert lobby.join(Seat(name))
+        await settle()
+        assert lobby.waiting == 1 and lobby.open_tables == 1
+        await lobby.close()
+
+    asyncio.run(join())
+    assert tables.formed == [(['A', 'B', 'C'], 0)]
+
+def test_bots_fill_table_after_wait_timeout() -> None:
+    tables = Tables()
+    lobby = Lobby(tables, table_size=4, wait_timeout=0.05)
+
+    async def join() -> None:
+        lobby.start()
+        lobby.join(Seat('A'))
+        lobby.join(Seat('B'))
+        await settle()
+        assert not tables.formed
+        await asyncio.sleep(0.1)
+        lobby.table_started(0.0)
+        await lobby.close()
+
+    asyncio.run(join())
+    assert tables.formed == [(['A', 'B'], 2)]
+    assert lobby.stats.bots_added == 2 and lobby.stats.tables_formed == 1
+    assert lobby.stats.queue_wait.count == 2 and lobby.stats.queue_wait.mean >= 0.05
+    assert lobby.stats.table_start.count == 1
+
+def test_full_queue_refuses_players() -> None:
+    lobby = Lobby(Tables(), table_size=3, wait_timeout=60, max_waiting=2)
+    seats = [Seat(name) for name in ['A', 'B', 'C', 'D']]
+
+    async def join() -> None:
+        lobby.start()
+        assert lobby.join(seats[0]) and lobby.join(seats[1])
+        assert not lobby.join(seats[2])
+        seats[0].left = True    # player who left makes room for the next one
+        assert lobby.join(seats[3])
+        await settle()
+        await lobby.close()
+
+    asyncio.run(join())
+    assert lobby.stats.joined == 3 and lobby.stats.refused == 1 and lobby.stats.left == 1
+    assert all(seat.closed for seat in seats if seat is not seats[2])
+
+def test_open_tables_are_limited() -> None:
+    tables = Tables()
+
+    async def join() -> None:
+        lobby = Lobby(tables, table_size=2, wait_timeout=60, max_tables=1)
+        lobby.start()
+        for name in ['A', 'B', 'C', 'D']:
+            lobby.join(Seat(name))
+        await settle()
+        assert len(tables.formed) == 1 and lobby.waiting == 2
+        lobby.table_closed()
+        await settle()
+        assert lobby.waiting == 0 and lobby.open_tables == 1
+        await lobby.close()
+
+    asyncio.run(join())
+    assert tables.formed == [(['A', 'B'], 0), (['C', 'D'], 0)]
+
+def test_latency_stats() -> None:
+    stats = LatencyStats()
+    assert stats.mean == stats.percentile(50) == 0.0
+    for milliseconds in range(1, 101):
+        stats.add(milliseconds / 1000)
+    assert stats.count == 100 and stats.max == 0.1
+    assert stats.mean == pytest.approx(0.0505)
+    assert stats.percentile(50) == 0.051 and stats.percentile(95) == 0.096
@@ -0,0 +1,95 @@
+"""Legal moves: single cards and sets in hand order, Kings only one by one, pulls and demands, checks of chosen cards"""
+import random
+from itertools import permutations
+
+import pytest
+
+from makao_game import CARDS, CardsActions
+from makao_game.card_codes import card_id
+from makao_game.cards import Card
+from makao_game.moves import is_legal_move, legal_moves, set_moves
+
+def cards(*ids: tuple[int, int]) -> list[Card]:
+    """Cards of (number, colour series) pairs, series 1 - 4 are Clubs, Diamonds, Hearts, Spades"""
+    return [CARDS[card_id(number, series)] for number, series in ids]
+
+def actions_after(number: int, series: int, demand: str | None = None) -> CardsActions:
+    actions = CardsActions()
+    actions.apply_card(card_id(number, series), 1, 3)
+    if demand is not None:
+        actions.update_actions_with_player_inputs(demand)
+    return actions
+
+CLUBS_9: Card = cards((9, 1))[0]
+CLUBS_7, DIAMONDS_7, HEARTS_7, SPADES_7 = cards((7, 1), (7, 2), (7, 3), (7, 4))
+
+def test_single_cards_in_hand_order() -> None:
+    hand = cards((5, 2), (9, 3), (4, 1), (12, 3), (8, 2))
+    assert legal_moves(hand, CLUBS_9, CardsActions()) == [[hand[1]], [hand[2]], [hand[3]]]
+    assert legal_moves(cards((5, 2), (8, 3)), CLUBS_9, CardsActions()) == []
+
+def test_set_moves_order() -> None:
+    first, hearts, spades, clubs = DIAMONDS_7, HEARTS_7, SPADES_7, CLUBS_7
+    assert set_moves(first, [hearts, first, spades]) == [[first, spades, hearts], [first, hearts, spades]]
+    assert set_moves(first, [hearts, first, spades, clubs]) == [
+        [first, spades, hearts], [first, hearts, spades],
+        [first, clubs, hearts], [first, hearts, clubs],
+        [first, clubs, spades], [first, spades, clubs],
+        [first, spades, clubs, hearts], [first, hearts, clubs, spades], [first, hearts, spades, clubs],
+    ]
+    assert set_moves(first, [first, hearts]) == []
+
+def test_sets_follow_their_single_card() -> None:
+    nine_of_diamonds = cards((9, 2))[0]
+    hand = [HEARTS_7, DIAMONDS_7, SPADES_7, CLUBS_7, CLUBS_9]
+    moves = legal_moves(hand, nine_of_diamonds, CardsActions())
+    assert moves == [[DIAMONDS_7], *set_moves(DIAMONDS_7, hand[:4]), [CLUBS_9]]
+    assert [len(move) for move in moves] == [1] + [3] * 6 + [4] * 3 + [1]
+
+def test_kings_are_not_played_in_sets() -> None:
+    kings = cards((13, 1), (13, 2), (13, 3), (13, 4))
+    moves = legal_moves(kings, cards((13, 1))[0], CardsActions())
+    assert moves == [[king] for king in kings]
+    assert not is_legal_move(kings[:3], cards((9, 1))[0], CardsActions())
+
+def test_moves_under_pull() -> None:
+    hand = cards((2, 2), (3, 3), (3, 1), (12, 4), (9, 1), (4, 1))
+    assert legal_moves(hand, cards((2, 1))[0], actions_after(2, 1)) == [[hand[0]], [hand[2]], [hand[3]]]
+
+@pytest.mark.parametrize('number, demand, expected', [(11, '7', [0, 2, 3, 4]), (14, 'Hearts', [0, 1, 4, 5])])
+def test_moves_under_demand(number: int, demand: str, expected: list[int]) -> None:
+    hand = cards((7, 3), (8, 3), (7, 4), (11, 2), (12, 1), (5, 3))
+    moves = legal_moves(hand, cards((number, 1))[0], actions_after(number, 1, demand))
+    assert [hand.index(move[0]) for move in moves] == expected
+
+def test_is_legal_move() -> None:
+    top = cards((9, 2))[0]
+    actions = CardsActions()
+    assert is_legal_move([DIAMONDS_7], top, actions)
+    assert not is_legal_move([HEARTS_7], top, actions)
+    assert is_legal_move([DIAMONDS_7, CLUBS_7, HEARTS_7], top, actions)
+    assert is_legal_move([DIAMONDS_7, CLUBS_7, SPADES_7, HEARTS_7], top, actions)
+    assert not is_legal_move([HEARTS_7, DIAMONDS_7, CLUBS_7], top, actions)     # first card decides
+    assert not is_legal_move([DIAMONDS_7, DIAMONDS_7, HEARTS_7], top, actions)
+    assert not is_legal_move([DIAMONDS_7, HEARTS_7, cards((8, 3))[0]], top, actions)
+    assert not is_legal_move([DIAMONDS_7, HEARTS_7], top, actions)
+    assert not is_legal_move([DIAMONDS_7, CLUBS_7, SPADES_7, HEARTS_7, DIAMONDS_7], top, actions)
+
+def test_legal_moves_are_exactly_legal_plays() -> None:
+    rng = random.Random(0)
+    sets = 0
+    for _ in range(30):
+        ranks = rng.sample(range(13), 3)     # few ranks, so hands have sets
+        hand = rng.sample([card for card in CARDS if card.rank in ranks], 8)
+        top = rng.choice([card for card in CARDS if card not in hand])
+        actions = rng.choice([CardsActions(), actions_after(2, 3), actions_after(11, 2, '9'),
+                              actions_after(14, 4, 'Clubs'), actions_after(4, 1)])
+        moves = legal_moves(hand, top, actions)
+        assert all(is_legal_move(move, top, actions) for move in moves)
+        # legal_moves keeps cards in the middle of sets in hand order, any order of them is legal
+        plays = {(play[0], *sorted(play[1:-1], key=hand.index), play[-1]) if len(play) > 2 else play
+                 for size in (1, 2, 3, 4) for play in permutations(hand, size)
+                 if is_legal_move(list(play), top, actions)}
+        assert len(moves) == len(plays) and {tuple(move) for move in moves} == plays
+        sets += sum(len(move) > 1 for move in moves)
+    assert sets > 0
@@ -0,0 +1,119 @@
+"""Rating updates against hand-computed Weng-Lin values and round trips of the memory-mapped RatingTable"""
+import asyncio
+import math
+import random
+
+import pytest
+
+from makao_game import Game, NullIOHandler, IODataType, MAX_NAME_BYTES
+from makao_game.data_logger import TurnLogWriter
+from makao_game.ratings import (RatingTable, Row, rate_placings, game_placings, backfill, DEFAULT_MU, DEFAULT_SIGMA,
+                                DEFAULT_BETA)
+from makao_game.simulation import DEFAULT_MAX_TURNS, HeadlessGame
+
+# two players with default ratings: c = sqrt(2 * sigma^2 + 2 * beta^2), win chance 1/2,
+# mu changes by sigma^2 / c / 2, sigma shrinks by sqrt(1 - sigma / c * sigma^2 / c^2 / 4) for every neighbour
+C: float = math.sqrt(2 * DEFAULT_SIGMA ** 2 + 2 * DEFAULT_BETA ** 2)
+MU_CHANGE: float = DEFAULT_SIGMA ** 2 / C / 2
+SIGMA_FACTOR: float = DEFAULT_SIGMA / C * DEFAULT_SIGMA ** 2 / C ** 2 / 4
+
+def test_rate_placings_two_players() -> None:
+    (winner_mu, winner_sigma), (loser_mu, loser_sigma) = rate_placings([(DEFAULT_MU, DEFAULT_SIGMA)] * 2)
+    assert winner_mu == pytest.approx(27.63523138347365) == pytest.approx(DEFAULT_MU + MU_CHANGE)
+    assert loser_mu == pytest.approx(22.36476861652635) == pytest.approx(DEFAULT_MU - MU_CHANGE)
+    assert winner_sigma == loser_sigma == pytest.approx(8.065506316323548)
+    assert winner_sigma == pytest.approx(DEFAULT_SIGMA * math.sqrt(1 - SIGMA_FACTOR))
+
+def test_rate_placings_compares_only_neighbours() -> None:
+    rated = rate_placings([(DEFAULT_MU, DEFAULT_SIGMA)] * 4)
+    assert [mu for mu, _ in rated] == pytest.approx([DEFAULT_MU + MU_CHANGE, DEFAULT_MU, DEFAULT_MU, DEFAULT_MU - MU_CHANGE])
+    assert rated[1][1] == pytest.approx(7.788474807872566)
+    assert rated[1][1] == pytest.approx(DEFAULT_SIGMA * math.sqrt(1 - 2 * SIGMA_FACTOR))
+
+def test_table_grows_and_reopens(tmp_path) -> None:
+    path = str(tmp_path / 'ratings.mrat')
+    games = [[f'P{(game * 7 + seat * 3) % 50}' for seat in range(4)] for game in range(300)]
+    with RatingTable(path, capacity=4) as table:
+        for placings in games:
+            table.update(placings)
+        assert table.capacity > 4
+        ratings = {rating.name: rating for rating in table}
+        assert len(ratings) == len(table) == 50
+        assert table.games == 300
+        assert sum(rating.games for rating in ratings.values()) == 4 * 300
+        assert sum(rating.wins for rating in ratings.values()) == 300
+
+    with RatingTable(path, read_only=True) as table:
+        assert len(table) == 50 and table.games == 300
+        assert all(table.get(name) == rating for name, rating in ratings.items())
+        assert table.get('Nobody') is None
+        assert table.top(1)[0] == max(ratings.values(), key=lambda rating: rating.conservative)
+        with pytest.raises(ValueError):
+            table.update(['P1', 'P2'])
+
+def test_table_rejects_bad_games_without_changes(tmp_path) -> None:
+    with RatingTable(str(tmp_path / 'ratings.mrat')) as table:
+        table.update(['Alice', 'Bob'])
+        for placings in (['Alice'], ['Alice', 'Alice'], ['Alice', ''], ['Alice', 'x' * 33], ['Alice', 'a\0b']):
+            with pytest.raises(ValueError):
+                table.update(placings)
+        assert len(table) == 2 and table.games == 1
+        alice = table.get('Alice')
+        assert alice is not None and alice.games == 1
+
+def test_rated_files(tmp_path) -> None:
+    with RatingTable(str(tmp_path / 'ratings.mrat')) as table:
+        table.rate_game(str(tmp_path / 'game1.csv'), ['Alice', 'Bob'])
+        table.add_rated_files([str(tmp_path / 'game2.mlog')])
+        assert table.rated_files() == {'game1', 'game2'}
+
+def test_game_placings() -> None:
+    rows: list[Row] = [{'Player_name': 'A', 'Final_place': None}, {'Player_name': 'B', 'Final_place': None},
+            {'Player_name': 'C', 'Final_place': None}, {'Player_name': 'B', 'Final_place': 1},
+            {'Player_name': 'A', 'Final_place': 2}, {'Player_name': 'C', 'Final_place': None}]
+    assert game_placings(rows) == ['B', 'A', 'C']
+    assert game_placings(rows[:3]) is None
+
+def save_game(path: str, bots: list[str], seed: int, max_turns: int = DEFAULT_MAX_TURNS) -> None:
+    game = HeadlessGame(bots=bots, rng=random.Random(seed), collect_data=True, max_turns=max_turns)
+    game.play()
+    writer = TurnLogWriter(path)
+    for row in game._game_data:
+        writer.write(row)
+    writer.close()
+
+def test_backfill_skips_games_the_table_rejects(tmp_path) -> None:
+    long_name = 'x' * 40
+    for number, bots in enumerate([['A', 'B'], ['A', 'B'], ['A', long_name], ['A', 'B']]):
+        save_game(str(tmp_path / f'game{number}.csv'), bots, number)
+    with RatingTable(str(tmp_path / 'ratings.mrat')) as table:
+        assert backfill(table, str(tmp_path), workers=1, chunk_size=4) == (3, 0, 1)
+        assert backfill(table, str(tmp_path), workers=1, chunk_size=4) == (0, 0, 0)
+        assert table.rated_files() == {'game0', 'game1', 'game3'}
+        assert table.skipped_files() == {'game2'}
+        rating = table.get('A')
+        assert table.games == 3 and rating is not None and rating.games == 3
+
+class NameAnswers(NullIOHandler):
+    """Asks for a game of two humans and gives their names one after another"""
+    def __init__(self, names: list[str]) -> None:
+        self.names = iter(names)
+
+    async def get_user_input(self, data_type: IODataType, username: str | None, message: str = '') -> str:
+        if 'name' in message:
+            return next(self.names)
+        return {'Do you want to play with bots?': 'no', 'How many human players do you want to play?': '2'}.get(message, '')
+
+def test_name_prompt_rejects_names_the_table_cannot_store() -> None:
+    names = ['Alice', 'x' * (MAX_NAME_BYTES + 1), 'ż' * (MAX_NAME_BYTES // 2 + 1), 'a\0b', ' Alice', 'ż' * (MAX_NAME_BYTES // 2)]
+    game = Game(io_handler=NameAnswers(names))
+    players = asyncio.run(game._create_input_players())
+    assert [player.name for player in players] == ['Alice', 'ż' * (MAX_NAME_BYTES // 2)]
+
+def test_backfill_reads_unfinished_games_once(tmp_path) -> None:
+    save_game(str(tmp_path / 'game0.csv'), ['A', 'B'], 0)
+    save_game(str(tmp_path / 'game1.csv'), ['A', 'B', 'C'], 1, max_turns=3)
+    with RatingTable(str(tmp_path / 'ratings.mrat')) as table:
+        assert backfill(table, str(tmp_path), workers=1) == (1, 1, 0)
+        assert backfill(table, str(tmp_path), workers=1) == (0, 0, 0)
+        assert table.skipped_files() == {'game1'} and table.games == 1
@@ -0,0 +1,77 @@
+"""Recorded games saved as records play again the same, changed records do not"""
+import asyncio
+import os
+import random
+from functools import partial
+
+import pytest
+
+from makao_game import BotPlayer, BotPolicy, NullIOHandler, IODataType, RuleSet
+from makao_game.data_logger import read_csv_rows
+from makao_game.replay import RECORD_VERSION, GameRecord, RecordedGame, ReplayGame
+
+class RandomAnswers(NullIOHandler):
+    """Human players answering at random, also with invalid answers"""
+    def __init__(self, seed: int) -> None:
+        self.rng = random.Random(seed)
+
+    async def get_user_input(self, data_type: IODataType, username: str | None, message: str = '') -> str:
+        if data_type == IODataType.YES_NO:
+            return self.rng.choice(['yes', 'no'])
+        if data_type == IODataType.PLAY_PASS:
+            return self.rng.choice(['play'] * 9 + ['pass'])
+        if data_type == IODataType.CARD:
+            return str(self.rng.randint(1, 40))
+        if data_type == IODataType.MAKAO:
+            return self.rng.choice(['makao', 'after makao', ''])
+        if data_type == IODataType.DEMAND:
+            return str(self.rng.randint(5, 10)) if 'number' in message else self.rng.choice(['hearts', 'spades'])
+        return ''
+
+def recorded_game(tmp_path, seed: int, rules: RuleSet | None = None,
+                  bit_hands: bool = False) -> tuple[RecordedGame, str]:
+    """Game of a human answering at random, a bot with changed policy and a default bot, saved with its record"""
+    game = RecordedGame(seed=seed, io_handler=RandomAnswers(seed), data_dir_path=str(tmp_path), rules=rules,
+                        bit_hands=bit_hands,
+                        bot_types={'b1': partial(BotPlayer, policy=BotPolicy(play_weight=4, save_queens=False))},
+                        players=['h1'], bots=['b1', 'b2'])
+    asyncio.run(game.run_game())
+    return game, game.save_data()
+
+@pytest.mark.parametrize('bit_hands', [False, True])
+def test_record_replays(tmp_path, bit_hands: bool) -> None:
+    for seed in range(5):
+        game, csv_path = recorded_game(tmp_path / str(seed), seed, bit_hands=bit_hands)
+        record = GameRecord.load(os.path.splitext(csv_path)[0] + '.replay.json')
+        assert record == game.record
+        ReplayGame(record).verify(read_csv_rows(csv_path))
+
+def test_changed_record_fails(tmp_path) -> None:
+    game, csv_path = recorded_game(tmp_path, 3)
+    record = GameRecord.from_json(game.record.to_json())
+    kind, value = record.decisions[-1]
+    record.decisions[-1] = (kind, not value if isinstance(value, bool) else [])
+    with pytest.raises(ValueError):
+        ReplayGame(record).verify(read_csv_rows(csv_path))
+
+def test_missing_and_extra_decisions_fail(tmp_path) -> None:
+    game, csv_path = recorded_game(tmp_path, 4)
+    rows = read_csv_rows(csv_path)
+    record = GameRecord.from_json(game.record.to_json())
+    record.decisions = record.decisions[:len(record.decisions) // 2]
+    with pytest.raises(ValueError, match='no more decisions'):
+        ReplayGame(record).verify(rows)
+
+    record = GameRecord.from_json(game.record.to_json())
+    record.decisions.append(('play', True))
+    with pytest.raises(ValueError, match='before all recorded decisions'):
+        ReplayGame(record).verify(rows)
+
+    with pytest.raises(ValueError, match='moves, expected'):
+        ReplayGame(game.record).verify(rows + rows[-1:])
+
+def test_unknown_record_version_fails(tmp_path) -> None:
+    game, _ = recorded_game(tmp_path, 0)
+    text = game.record.to_json().replace(f'"version":{RECORD_VERSION}', '"version":99')
+    with pytest.raises(ValueError, match='version 99'):
+        GameRecord.from_json(text)
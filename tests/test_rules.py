@@ -0,0 +1,96 @@
+"""Rule sets: saving, compiled tables of house variants, demands of finishers and replays under every variant"""
+import json
+import os
+import random
+from functools import partial
+
+import pytest
+
+from makao_game import BotPlayer, BotPolicy, CardsActions, RuleSet, VARIANTS, CARDS, compile_rules
+from makao_game import card_codes
+from makao_game.card_codes import card_id
+from makao_game.data_logger import read_csv_rows
+from makao_game.moves import legal_moves
+from makao_game.replay import GameRecord, ReplayGame
+from makao_game.simulation import HeadlessGame
+from test_replay import recorded_game
+
+JACK: int = card_id(11, 1)
+FIVE: int = card_id(5, 1)
+SEVEN: int = card_id(7, 1)
+QUEEN: int = card_id(12, 2)
+KINGS: list[int] = [card_id(13, series) for series in range(1, 5)]
+
+@pytest.mark.parametrize('rules_name', list(VARIANTS))
+def test_rule_set_round_trip(rules_name: str) -> None:
+    rules = VARIANTS[rules_name]
+    loaded = RuleSet.from_dict(json.loads(json.dumps(rules.to_dict())))
+    assert loaded == rules and loaded.card_functions == rules.card_functions
+    assert compile_rules(loaded) is compile_rules(rules)
+
+def test_invalid_rule_sets() -> None:
+    with pytest.raises(ValueError):
+        RuleSet(jack_demand_turns=0)
+    with pytest.raises(ValueError):
+        RuleSet(functions={2: ('Pull', -1)})
+    with pytest.raises(ValueError):
+        RuleSet(functions={2: ('Fly', 1)})
+
+def test_queen_on_anything() -> None:
+    seven = CARDS[card_id(7, 2)]
+    default_rules = compile_rules()
+    variant = compile_rules(VARIANTS['queen_on_anything'])
+    queen_row = card_codes.STATE_NONE * card_codes.NUM_CARDS + QUEEN
+    assert default_rules.playable_rows[queen_row][SEVEN] == 1
+    assert variant.playable_rows[queen_row][SEVEN] == 0
+    assert variant.playable_rows[queen_row][seven.id] == 1
+
+def test_stacking_kings() -> None:
+    top = CARDS[card_id(12, 1)]   # Queen of Clubs, anything goes on it
+    hand = [CARDS[c_id] for c_id in KINGS[:3]]
+    assert all(len(move) == 1 for move in legal_moves(hand, top, CardsActions()))
+    stacking = CardsActions(compile_rules(VARIANTS['stacking_kings']))
+    assert any(len(move) == 3 for move in legal_moves(hand, top, stacking))
+
+def dealt_game(rules: RuleSet, hands: list[list[int]]) -> HeadlessGame:
+    """Game of three bots that never forget makao, with hands of card ids and seven of Clubs on the table"""
+    names = ['A', 'B', 'C']
+    game = HeadlessGame(bots=names, rng=random.Random(0), rules=rules,
+                        bot_types={name: partial(BotPlayer, policy=BotPolicy(forget_weight=0)) for name in names})
+    game._prepare_headless_game()
+    state = game.snapshot()
+    players = tuple(player._replace(deck=bytes(hand)) for player, hand in zip(state.players, hands))
+    used = {c_id for hand in hands for c_id in hand} | {SEVEN}
+    game.restore(state._replace(players=players, play_deck=bytes([SEVEN]),
+                                main_deck=bytes(card.id for card in CARDS if card.id not in used)))
+    return game
+
+@pytest.mark.parametrize('rules, duration', [(RuleSet(), 2), (RuleSet(jack_demand_turns=3), 3)])
+def test_finisher_on_demanding_card(rules: RuleSet, duration: int) -> None:
+    game = dealt_game(rules, [[JACK], [SEVEN + 4, SEVEN + 8], [SEVEN + 12, SEVEN + 16]])
+    game.play_turn([CARDS[JACK]])
+    assert game.placings()[0] == 'A'
+    assert game._actions.demands_duration == duration
+
+def test_finisher_after_demanding_card() -> None:
+    game = dealt_game(RuleSet(jack_demand_turns=4), [[JACK, QUEEN], [FIVE], [SEVEN + 8, SEVEN + 12]])
+    game.play_turn([CARDS[JACK]])
+    assert game._actions.demanded_value == '5'
+    game.play_turn([CARDS[FIVE]])
+    assert game.placings()[0] == 'B'
+    assert game._actions.demands_duration == 3
+
+@pytest.mark.parametrize('rules_name', list(VARIANTS))
+def test_record_replays_under_variant(tmp_path, rules_name: str) -> None:
+    for seed in range(5):
+        game, csv_path = recorded_game(tmp_path / str(seed), seed, VARIANTS[rules_name])
+        record = GameRecord.load(os.path.splitext(csv_path)[0] + '.replay.json')
+        assert record.rules == VARIANTS[rules_name]
+        ReplayGame(record).verify(read_csv_rows(csv_path))
+
+def test_replay_checks_bot_policies(tmp_path) -> None:
+    game, csv_path = recorded_game(tmp_path, 3, VARIANTS['default'])
+    record = GameRecord.from_json(game.record.to_json())
+    record.policies = [None if policy is None else BotPolicy() for policy in record.policies]
+    with pytest.raises(ValueError):
+        ReplayGame(record).verify(read_csv_rows(csv_path))
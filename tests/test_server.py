@@ -0,0 +1,95 @@
+"""Loopback clients play whole games at the server, lost seats close their tables and a full lobby refuses players"""
+import asyncio
+import json
+
+from benchmarks.scripted_client import ScriptedAnswers
+from makao_game import IODataType
+from makao_game.client import Event, play_client
+from makao_game.server import GameServer, SeatIOHandler, table_names
+
+INPUT_TYPES: set[str] = {data_type.value for data_type in IODataType}
+
+async def leave_at_first_input(server: GameServer, name: str) -> None:
+    """Client that joins and disconnects instead of answering its first question"""
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    writer.write(name.encode() + b'\n')
+    async for line in reader:
+        if json.loads(line)['type'] == 'input':
+            break
+    writer.close()
+    await writer.wait_closed()
+
+def test_loopback_clients_play_a_table() -> None:
+    async def play() -> tuple[GameServer, list[list[Event]]]:
+        async with GameServer(port=0, table_size=3, wait_timeout=0.05, seed=0) as server:
+            events = await asyncio.gather(*[play_client(server.host, server.port, name, ScriptedAnswers())
+                                            for name in ['Ann', 'Bob']])
+            await server.wait_tables()
+        return server, events
+
+    server, events = asyncio.run(play())
+    assert server.stats.tables_started == server.stats.tables_finished == 1
+    assert server.stats.tables_aborted == server.stats.rejected == 0
+    assert server.lobby.stats.bots_added == 1
+    for client_events in events:
+        assert client_events[0]['text'] == 'Waiting for other players'
+        assert client_events[-1]['text'].startswith('Last place takes: ')
+        assert {event['data_type'] for event in client_events if event['type'] == 'input'} <= INPUT_TYPES
+    assert not server.tables and server.lobby.open_tables == 0
+
+def test_lost_seat_closes_table() -> None:
+    async def play() -> tuple[GameServer, list[Event]]:
+        async with GameServer(port=0, table_size=2, wait_timeout=5, shuffle_players=False, seed=0) as server:
+            events, _ = await asyncio.gather(play_client(server.host, server.port, 'Ann', ScriptedAnswers()),
+                                             leave_at_first_input(server, 'Bob'))
+            await server.wait_tables()
+        return server, events
+
+    server, events = asyncio.run(play())
+    assert server.stats.tables_aborted == 1 and server.stats.tables_finished == 0
+    assert events[-1]['warning'] and events[-1]['text'].startswith('Table closed: ')
+
+def test_full_lobby_refuses_players() -> None:
+    async def play() -> tuple[GameServer, list[Event], list[Event]]:
+        async with GameServer(port=0, table_size=3, wait_timeout=60, max_waiting=1, seed=0) as server:
+            waiting = asyncio.create_task(play_client(server.host, server.port, 'Ann', ScriptedAnswers()))
+            while server.lobby.waiting == 0:
+                await asyncio.sleep(0.01)
+            refused = await play_client(server.host, server.port, 'Bob', ScriptedAnswers())
+        return server, refused, await waiting
+
+    server, refused, waited = asyncio.run(play())
+    assert server.stats.rejected == 1 and server.lobby.stats.refused == 1
+    assert refused == [{'type': 'message', 'text': 'Lobby is full, try again later', 'warning': True}]
+    assert waited == [{'type': 'message', 'text': 'Waiting for other players', 'warning': False}]
+    assert server.stats.tables_started == 0
+
+def test_clashing_names_are_unique_at_the_table() -> None:
+    async def names(sent: list[str], num_bots: int) -> tuple[list[str], list[str]]:
+        server = await asyncio.start_server(lambda reader, writer: None, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        connections = [await asyncio.open_connection('127.0.0.1', port) for _ in sent]
+        seats = [SeatIOHandler(name, reader, writer) for name, (reader, writer) in zip(sent, connections)]
+        bots = table_names(seats, num_bots)
+        for _, writer in connections:
+            writer.close()
+        server.close()
+        return [seat.name for seat in seats], bots
+
+    assert asyncio.run(names(['Player2', 'Player2', 'Ann'], 1)) == (['Player2', 'Player3', 'Ann'], ['Bot1'])
+    assert asyncio.run(names(['Bot1', 'Player1', '', 'x' * 40], 1)) == (['Player1', 'Player2', 'Player3', 'x' * 16],
+                                                                      ['Bot1'])
+
+def test_clients_with_the_same_name_get_their_own_questions() -> None:
+    async def play() -> list[list[Event]]:
+        async with GameServer(port=0, table_size=2, wait_timeout=5, seed=0) as server:
+            # a seat left out of the table would never be answered or closed
+            events = await asyncio.wait_for(asyncio.gather(*[play_client(server.host, server.port, 'Player2',
+                                                                         ScriptedAnswers()) for _ in range(2)]), 10)
+            await server.wait_tables()
+            assert server.stats.tables_finished == 1
+        return events
+
+    for client_events in asyncio.run(play()):
+        assert any(event['type'] == 'input' for event in client_events)
+        assert client_events[-1]['text'].startswith('Last place takes: ')
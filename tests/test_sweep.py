@@ -0,0 +1,82 @@
+"""Sweeps stop policies as soon as their order is settled, intervals are KL bounds, results do not depend on workers"""
+import math
+
+import pytest
+
+from makao_game import BotPolicy
+from makao_game.sweep import (PolicyResult, PolicySweep, SweepResult, kl_bernoulli, kl_interval,
+                              STATUS_MAX_GAMES, STATUS_OUT_OF_TOP, STATUS_RUNNING, STATUS_SETTLED)
+
+POLICIES: list[BotPolicy] = [BotPolicy(), BotPolicy(makao_weight=0), BotPolicy(makao_weight=1),
+                             BotPolicy(play_sets=False)]
+
+def updated(sweep: PolicySweep, wins_and_games: list[tuple[int, int]], rounds: int = 1) -> list[str]:
+    """Statuses of configurations with these wins and games after _update of a round"""
+    result = SweepResult([PolicyResult(policy, games, wins) for policy, (wins, games)
+                          in zip(sweep.policies, wins_and_games)], sweep.num_players, sweep.error_rate, rounds=rounds)
+    sweep._update(result, list(range(len(result.results))))
+    return [policy_result.status for policy_result in result.results]
+
+def test_kl_interval_bounds() -> None:
+    log_term = math.log(20)
+    assert kl_interval(0, 0, log_term) == (0.0, 1.0)
+    # without wins (or losses) the bound is closed: n * -log(1 - q) = log_term
+    assert kl_interval(0, 10, log_term) == (0.0, pytest.approx(1 - math.exp(-log_term / 10)))
+    assert kl_interval(10, 10, log_term) == (pytest.approx(math.exp(-log_term / 10)), 1.0)
+    low, high = kl_interval(30, 100, log_term)
+    assert low < 0.3 < high
+    assert 100 * kl_bernoulli(0.3, low) == pytest.approx(log_term, rel=1e-6)
+    assert 100 * kl_bernoulli(0.3, high) == pytest.approx(log_term, rel=1e-6)
+    assert kl_interval(70, 100, log_term) == (pytest.approx(1 - high), pytest.approx(1 - low))
+    narrower_low, narrower_high = kl_interval(300, 1000, log_term)
+    assert low < narrower_low < 0.3 < narrower_high < high
+
+def test_separated_policies_settle() -> None:
+    sweep = PolicySweep(POLICIES[:3], num_players=3, workers=1, batch=20, max_games=1000)
+    assert updated(sweep, [(900, 1000), (500, 1000), (100, 1000)]) == [STATUS_SETTLED] * 3
+    assert updated(sweep, [(60, 100), (50, 100), (10, 100)]) == [STATUS_RUNNING, STATUS_RUNNING, STATUS_SETTLED]
+    assert updated(sweep, [(600, 1000), (590, 1000), (100, 1000)]) == [STATUS_MAX_GAMES, STATUS_MAX_GAMES,
+                                                                      STATUS_SETTLED]
+
+def test_ties_settle_within_tie_margin() -> None:
+    sweep = PolicySweep(POLICIES[:2], num_players=3, workers=1, batch=20, max_games=100_000, tie_margin=0.05)
+    assert updated(sweep, [(30_000, 100_000), (30_100, 100_000)]) == [STATUS_SETTLED] * 2
+    assert updated(sweep, [(300, 1000), (301, 1000)]) == [STATUS_RUNNING] * 2
+
+def test_only_top_policies_are_ranked() -> None:
+    sweep = PolicySweep(POLICIES, num_players=3, workers=1, batch=20, max_games=1000, top=2)
+    statuses = updated(sweep, [(60, 100), (58, 100), (56, 100), (5, 100)])
+    assert statuses == [STATUS_RUNNING, STATUS_RUNNING, STATUS_RUNNING, STATUS_OUT_OF_TOP]
+    # without top the last one is settled below all the others
+    sweep.top = None
+    assert updated(sweep, [(60, 100), (58, 100), (56, 100), (5, 100)])[3] == STATUS_SETTLED
+
+def test_later_rounds_widen_intervals() -> None:
+    sweep = PolicySweep(POLICIES[:2], num_players=3, workers=1, batch=20, max_games=1000)
+    first = SweepResult([PolicyResult(policy, 100, 30) for policy in POLICIES[:2]], 3, sweep.error_rate, rounds=1)
+    later = SweepResult([PolicyResult(policy, 100, 30) for policy in POLICIES[:2]], 3, sweep.error_rate, rounds=10)
+    sweep._update(first, [0, 1])
+    sweep._update(later, [0, 1])
+    assert later.results[0].low < first.results[0].low and later.results[0].high > first.results[0].high
+
+def test_sweep_settles_before_max_games_for_any_workers() -> None:
+    results = []
+    for workers in (1, 3):
+        sweep = PolicySweep(POLICIES[:3], num_players=3, workers=workers, batch=20, max_games=1000, max_turns=300)
+        result = sweep.run()
+        assert [policy_result.status for policy_result in result.results] == [STATUS_SETTLED] * 3
+        assert all(policy_result.games < sweep.max_games for policy_result in result.results)
+        assert result.rounds > 1 and result.games < result.fixed_games
+        assert [policy_result.policy for policy_result in result.ranking()] == [POLICIES[0], POLICIES[2], POLICIES[1]]
+        results.append([(policy_result.games, policy_result.wins) for policy_result in result.results])
+    assert results[0] == results[1]
+
+def test_invalid_sweeps() -> None:
+    with pytest.raises(ValueError):
+        PolicySweep(POLICIES[:1])
+    with pytest.raises(ValueError):
+        PolicySweep([POLICIES[0], POLICIES[0]])
+    with pytest.raises(ValueError):
+        PolicySweep(POLICIES, top=4)
+    with pytest.raises(ValueError):
+        PolicySweep(POLICIES, batch=100, max_games=50)
@@ -0,0 +1,76 @@
+"""Bucket edges of timing histograms round-trip, percentiles are read from bucket bounds and merging adds samples"""
+import math
+import random
+
+from makao_game.timing import (NUM_BUCKETS, PERCENTILES, SUB_BUCKETS, Histogram, TurnProfiler, bucket_index,
+                               bucket_upper_bound)
+
+def histogram_of(samples: list[int]) -> Histogram:
+    histogram = Histogram()
+    for ns in samples:
+        histogram.record(ns)
+    return histogram
+
+def test_small_values_have_their_own_buckets() -> None:
+    for ns in range(2 * SUB_BUCKETS):
+        assert bucket_index(ns) == ns and bucket_upper_bound(ns) == ns
+    assert bucket_index(-5) == 0
+
+def test_bucket_edges_round_trip() -> None:
+    for index in range(NUM_BUCKETS - 1):
+        upper = bucket_upper_bound(index)
+        assert bucket_index(upper) == index
+        assert bucket_index(upper + 1) == index + 1
+    assert bucket_index(bucket_upper_bound(NUM_BUCKETS - 1)) == NUM_BUCKETS - 1
+
+def test_powers_of_two_start_buckets() -> None:
+    for power in range(2, 64):
+        index = bucket_index(1 << power)
+        assert index == (power - 1) * SUB_BUCKETS
+        assert bucket_upper_bound(index - 1) == (1 << power) - 1
+        # buckets are at most 25% wider than their lower edge
+        assert bucket_upper_bound(index) == (1 << power) + (1 << (power - 2)) - 1
+
+def test_percentiles_of_known_distribution() -> None:
+    histogram = histogram_of(list(range(1, 101)))
+    assert histogram.count == 100 and histogram.total == 5050 and histogram.max == 100
+    assert histogram.mean == 50.5
+    # 50 is in bucket 48..55, 90 in 80..95, 99 in 96..111 capped by the largest sample
+    assert [histogram.percentile(percent) for percent in (0, 50, 90, 99, 100)] == [1, 55, 95, 100, 100]
+    assert Histogram().percentile(50) == 0 and Histogram().mean == 0.0
+
+def test_percentiles_are_within_a_bucket_of_exact() -> None:
+    rng = random.Random(0)
+    samples = sorted(int(rng.lognormvariate(10, 2)) for _ in range(10_000))
+    histogram = histogram_of(samples)
+    for percent in (*PERCENTILES, 25, 75, 99.9):
+        exact = samples[math.ceil(len(samples) * percent / 100) - 1]
+        assert exact <= histogram.percentile(percent) <= max(exact * 1.25, SUB_BUCKETS)
+
+def test_merged_histogram_equals_histogram_of_all_samples() -> None:
+    rng = random.Random(1)
+    first = [rng.randrange(10 ** 6) for _ in range(500)]
+    second = [rng.randrange(10 ** 9) for _ in range(300)]
+    merged = histogram_of(first)
+    merged.merge(histogram_of(second))
+    both = histogram_of(first + second)
+    assert merged.counts == both.counts
+    assert (merged.count, merged.total, merged.max) == (both.count, both.total, both.max)
+    assert merged.count == 800 and merged.max == max(second)
+    assert [merged.percentile(percent) for percent in PERCENTILES] == [both.percentile(percent)
+                                                                       for percent in PERCENTILES]
+    empty = Histogram()
+    empty.merge(merged)
+    assert empty.counts == both.counts and empty.max == both.max
+
+def test_merged_profilers_report_all_samples() -> None:
+    profilers = [TurnProfiler(), TurnProfiler()]
+    profilers[0].histograms['choose_card', 'bot'].record(1_000)
+    profilers[1].histograms['choose_card', 'bot'].record(3_000)
+    profilers[1].histograms['display', 'human'].record(2_000)
+    profilers[0].merge(profilers[1])
+    rows = {(row['phase'], row['player']): row for row in profilers[0].report()}
+    assert set(rows) == {('choose_card', 'bot'), ('display', 'human')}
+    assert rows['choose_card', 'bot']['count'] == 2 and rows['choose_card', 'bot']['mean_us'] == 2.0
+    assert rows['choose_card', 'bot']['max_us'] == 3.0
+    assert rows['display', 'human']['p50_us'] == 2.0     # capped by the sample
@@ -0,0 +1,84 @@
+"""Lockstep games keep every card of the deck, end with valid winners, repeat with a seed and agree with HeadlessGame"""
+import math
+
+import numpy as np
+import pytest
+
+from makao_game import card_codes
+from makao_game.simulation import Simulation
+from makao_game.vector_simulation import CARD_BITS, LockstepGames, VectorPolicy, VectorSimulation
+
+MAX_Z: float = 4.0
+
+def new_games(num_players: int, num_games: int, seed: int) -> LockstepGames:
+    bots = [f'Bot{seat + 1}' for seat in range(num_players)]
+    games, _ = VectorSimulation(bots=bots, seed=seed, batch_size=num_games).new_batch(num_games)
+    return games
+
+def piles(games: LockstepGames) -> list[np.ndarray]:
+    """Masks of hands, draw pile, discard pile and top card of every game"""
+    draw = np.zeros(games.num_games, dtype=np.uint64)
+    for game in range(games.num_games):
+        draw[game] = np.bitwise_or.reduce(CARD_BITS[games.draw_pile[game, :games.draw_size[game]]], initial=0)
+    return [np.bitwise_or.reduce(games.hands, 1), draw, games.discard_pile, CARD_BITS[games.top]]
+
+@pytest.mark.parametrize('num_players', [2, 4])
+def test_cards_are_kept(num_players: int) -> None:
+    games = new_games(num_players, 200, num_players)
+    while True:
+        masks = piles(games)
+        assert (sum(np.bitwise_count(mask).astype(int) for mask in masks) == card_codes.NUM_CARDS).all()
+        assert (np.bitwise_or.reduce(masks) == card_codes.ALL_CARDS_MASK).all()
+        if not games.step():
+            break
+
+@pytest.mark.parametrize('num_players', [2, 3, 5])
+def test_games_end_with_valid_winners(num_players: int) -> None:
+    games = new_games(num_players, 300, 0)
+    games.play()
+    assert games.finished.all()
+    assert ((games.winners >= 0) & (games.winners < num_players)).all()
+    for finishers, num_finished in zip(games.finishers, games.num_finished):
+        assert num_finished == num_players - 1
+        assert len(set(finishers[:num_finished])) == num_finished
+
+def test_unfinished_games_have_no_winner() -> None:
+    games, _ = VectorSimulation(bots=['Bot1', 'Bot2', 'Bot3'], seed=0, max_turns=20).new_batch(100)
+    games.play()
+    assert (games.turns <= 20).all()
+    assert (games.winners[~games.finished] == -1).all()
+
+def test_seeded_runs_repeat() -> None:
+    def run(seed: int) -> tuple[dict[str, int], int]:
+        simulation = VectorSimulation(bots=['Bot1', 'Bot2', 'Bot3'], shuffle_players=True, seed=seed,
+                                      policies={'Bot2': VectorPolicy(play_sets=False)}, batch_size=80)
+        report = simulation.run(200)
+        assert report.games == 200 and sum(report.wins.values()) + report.unfinished == 200
+        return report.wins, report.turns
+    assert run(7) == run(7)
+    assert run(7) != run(8)
+
+def test_invalid_number_of_players() -> None:
+    with pytest.raises(ValueError):
+        LockstepGames(np.zeros((10, 1), dtype=np.intp), [VectorPolicy()], np.random.default_rng(0))
+
+def test_agrees_with_headless_games() -> None:
+    bots = ['Bot1', 'Bot2', 'Bot3']
+    simulation = Simulation(bots=bots, seed=0)
+    object_turns = []
+    object_first_wins = 0
+    for game_index in range(800):
+        game = simulation.new_game(game_index)
+        assert game.play()
+        object_turns.append(game.turns)
+        object_first_wins += game.placings()[0] == bots[0]
+    games = new_games(len(bots), 4000, 0)
+    games.play()
+
+    turns = np.array(object_turns)
+    z = (games.turns.mean() - turns.mean()) / math.sqrt(games.turns.var() / games.num_games + turns.var() / turns.size)
+    assert abs(z) < MAX_Z
+    object_rate, vector_rate = object_first_wins / turns.size, float((games.winners == 0).mean())
+    pooled = (object_first_wins + (games.winners == 0).sum()) / (turns.size + games.num_games)
+    z = (vector_rate - object_rate) / math.sqrt(pooled * (1 - pooled) * (1 / turns.size + 1 / games.num_games))
+    assert abs(z) < MAX_Z